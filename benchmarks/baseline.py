@@ -0,0 +1,281 @@
+# baseline.py
+"""
+Performance baselines: record micro.py / e2e.py results (every sample, not just
+the summary) as a JSON file under benchmarks/baselines/, and compare a later run
+against one to catch slowdowns before they turn into bot timeouts.
+
+Every benchmark on every map gets one throughput sample per --runs independent
+run. It is flagged SLOWER only when the slowdown is statistically significant
+(the 95% Welch's t confidence interval on the difference of mean throughput lies
+entirely below zero) AND at least --min-effect large, so noise and tiny shifts
+don't fail a run. Compare against baselines recorded on the same machine.
+
+python benchmarks/baseline.py record                       # -> benchmarks/baselines/<commit>.json
+python benchmarks/baseline.py record --name main --suites micro --maps maps/map1.txt
+python benchmarks/baseline.py compare benchmarks/baselines/main.json            # reruns with the same settings
+python benchmarks/baseline.py compare benchmarks/baselines/main.json new.json   # two recorded files
+
+compare exits 1 when anything got significantly slower.
+"""
+
+import argparse
+import datetime
+import glob
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+import e2e
+import micro
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+BASELINE_DIR = os.path.join(BENCH_DIR, "baselines")
+
+FORMAT_VERSION = 1
+
+# suite -> throughput key whose "samples" are compared (higher is better)
+METRICS = {"micro": "ops_per_sec", "e2e": "turns_per_sec"}
+
+# two sided 97.5% quantiles of Student's t for 1..30 degrees of freedom
+T_975 = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)
+
+
+# ----------------------------
+# Recording
+# ----------------------------
+
+def git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True
+        )
+    except OSError:
+        return None
+    return out.stdout.strip() or None
+
+
+def run_suites(settings: Dict[str, Any]) -> Dict[str, Any]:
+    """one run of the suites named in settings; maps are repo relative"""
+    maps = [os.path.join(REPO_ROOT, p) for p in settings["maps"]]
+    results: Dict[str, Any] = {}
+    if "micro" in settings["suites"]:
+        results["micro"] = micro.run(
+            maps, list(micro.BENCHMARKS), settings["min_time"], settings["repeat"]
+        )
+    if "e2e" in settings["suites"]:
+        results["e2e"] = e2e.run(
+            maps, list(e2e.BOTS), list(e2e.RECORD_MODES),
+            settings["games"], settings["turns"], settings["timeout"],
+        )
+    return results
+
+
+def collect(settings: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    settings["runs"] independent runs; each benchmark keeps one sample per run
+    (the median of that run's batches or games). Batches inside one run share
+    its process state, so their spread understates run to run noise.
+    """
+    runs = [run_suites(settings) for _ in range(settings["runs"])]
+    results: Dict[str, Any] = {}
+    for suite, key in METRICS.items():
+        if suite not in runs[0]:
+            continue
+        results[suite] = {}
+        for map_name, row in runs[0][suite].items():
+            out = results[suite][map_name] = {}
+            for name, first in row.items():
+                per_run = [r[suite][map_name][name] for r in runs]
+                if any(not r or not r["samples"] for r in per_run):
+                    out[name] = None
+                    continue
+                samples = [statistics.median(r["samples"]) for r in per_run]
+                out[name] = {**first, key: statistics.median(samples), "samples": samples}
+    return results
+
+
+def record(settings: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "version": FORMAT_VERSION,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "host": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+            "cpus": os.cpu_count(),
+        },
+        "settings": settings,
+        "results": collect(settings),
+    }
+
+
+def load(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported baseline version {data.get('version')}")
+    return data
+
+
+# ----------------------------
+# Comparing
+# ----------------------------
+
+def t_quantile(df: float) -> float:
+    if df < 1:
+        return T_975[0]
+    if df <= len(T_975):
+        return T_975[int(df) - 1]
+    return 1.96
+
+
+def welch_ci(old: List[float], new: List[float]) -> Optional[Tuple[float, float, float]]:
+    """(mean(new) - mean(old), low, high) at 95%, or None with fewer than 2 samples each"""
+    if len(old) < 2 or len(new) < 2:
+        return None
+    m0, m1 = statistics.fmean(old), statistics.fmean(new)
+    v0, v1 = statistics.variance(old) / len(old), statistics.variance(new) / len(new)
+    diff = m1 - m0
+    se = math.sqrt(v0 + v1)
+    if se == 0:
+        return diff, diff, diff
+    df = (v0 + v1) ** 2 / (
+        (v0 ** 2 / (len(old) - 1) if v0 else 0) + (v1 ** 2 / (len(new) - 1) if v1 else 0)
+    )
+    half = t_quantile(df) * se
+    return diff, diff - half, diff + half
+
+
+def compare(base: Dict[str, Any], new: Dict[str, Any], min_effect: float) -> List[Dict[str, Any]]:
+    """one row per (suite, map, benchmark) present in both runs"""
+    rows = []
+    for suite, key in METRICS.items():
+        old_maps = base["results"].get(suite, {})
+        new_maps = new["results"].get(suite, {})
+        for map_name in sorted(set(old_maps) & set(new_maps)):
+            for name, old in old_maps[map_name].items():
+                cur = new_maps[map_name].get(name)
+                if not old or not cur or not old["samples"] or not cur["samples"]:
+                    continue
+                a, b = old["samples"], cur["samples"]
+                m0 = statistics.fmean(a)
+                change = (statistics.fmean(b) - m0) / m0
+                ci = welch_ci(a, b)
+                if ci is None:
+                    verdict = "few samples"
+                elif ci[2] < 0 and -change >= min_effect:
+                    verdict = "SLOWER"
+                elif ci[1] > 0 and change >= min_effect:
+                    verdict = "faster"
+                else:
+                    verdict = "same"
+                rows.append({
+                    "suite": suite,
+                    "map": map_name,
+                    "benchmark": name,
+                    "metric": key,
+                    "old": m0,
+                    "new": statistics.fmean(b),
+                    "change": change,
+                    "ci": None if ci is None else [ci[1] / m0, ci[2] / m0],
+                    "verdict": verdict,
+                })
+    return rows
+
+
+def format_rows(rows: List[Dict[str, Any]], only_changed: bool) -> str:
+    lines = [
+        f"{'suite':<6} {'map':<18} {'benchmark':<18} {'old':>11} {'new':>11} {'change':>8} "
+        f"{'95% CI':>17}  verdict"
+    ]
+    for r in rows:
+        if only_changed and r["verdict"] == "same":
+            continue
+        ci = "" if r["ci"] is None else f"[{r['ci'][0]:+.1%}, {r['ci'][1]:+.1%}]"
+        lines.append(
+            f"{r['suite']:<6} {r['map']:<18} {r['benchmark']:<18} {r['old']:>11,.0f} {r['new']:>11,.0f} "
+            f"{r['change']:>+8.1%} {ci:>17}  {r['verdict']}"
+        )
+    return "\n".join(lines)
+
+
+# ----------------------------
+# CLI
+# ----------------------------
+
+def main():
+    ap = argparse.ArgumentParser(description="record and compare performance baselines")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    rec = sub.add_parser("record", help="run the benchmarks and save a baseline")
+    rec.add_argument("--name", default=None, help="baselines/<name>.json (default: current commit)")
+    rec.add_argument("--out", default=None, help="explicit output path")
+    rec.add_argument("--suites", nargs="+", choices=list(METRICS), default=list(METRICS))
+    rec.add_argument("--maps", nargs="+", default=None, help="map files (default: maps/*.txt)")
+    rec.add_argument("--runs", type=int, default=10, help="independent runs (one sample each; fewer leave the confidence interval too wide)")
+    rec.add_argument("--repeat", type=int, default=5, help="micro: timed batches per operation")
+    rec.add_argument("--min-time", type=float, default=0.05, help="micro: seconds per batch")
+    rec.add_argument("--games", type=int, default=3, help="e2e: games per map, bot and mode")
+    rec.add_argument("--turns", type=int, default=500, help="e2e: turns per game")
+
+    cmp_ = sub.add_parser("compare", help="compare a run against a baseline")
+    cmp_.add_argument("baseline", help="baseline json")
+    cmp_.add_argument("new", nargs="?", default=None, help="recorded run (default: run now with the baseline's settings)")
+    cmp_.add_argument("--min-effect", type=float, default=0.05, help="smallest relative change to flag")
+    cmp_.add_argument("--save", default=None, help="save the new run here")
+    cmp_.add_argument("--all", action="store_true", help="list unchanged benchmarks too")
+    args = ap.parse_args()
+
+    if args.cmd == "record":
+        maps = args.maps or sorted(glob.glob(os.path.join(REPO_ROOT, "maps", "*.txt")))
+        settings = {
+            "suites": args.suites,
+            "runs": args.runs,
+            "maps": [os.path.relpath(os.path.abspath(p), REPO_ROOT) for p in maps],
+            "repeat": args.repeat,
+            "min_time": args.min_time,
+            "games": args.games,
+            "turns": args.turns,
+            "timeout": 0.5,
+        }
+        data = record(settings)
+        out = args.out or os.path.join(BASELINE_DIR, f"{args.name or data['commit'] or 'baseline'}.json")
+        os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
+        with open(out, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1)
+        print(f"[BASELINE] wrote {out}")
+        return
+
+    base = load(args.baseline)
+    new = load(args.new) if args.new else record(base["settings"])
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(new, f, indent=1)
+    if new["host"] != base["host"]:
+        print(f"[BASELINE] warning: different host ({base['host']} vs {new['host']})")
+
+    rows = compare(base, new, args.min_effect)
+    print(format_rows(rows, only_changed=not args.all))
+    slower = [r for r in rows if r["verdict"] == "SLOWER"]
+    faster = sum(r["verdict"] == "faster" for r in rows)
+    print(
+        f"[BASELINE] {len(rows)} compared against {base.get('commit')}: "
+        f"{len(slower)} slower, {faster} faster"
+    )
+    if slower:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
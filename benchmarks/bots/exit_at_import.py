@@ -0,0 +1,20 @@
+"""
+exit_at_import.py - isolation check bot
+
+Calls sys.exit() while being imported, so benchmarks/isolation.py can check
+that it only fails its own game instead of ending the batch or tournament.
+"""
+
+import sys
+
+from robot_controller import RobotController
+
+sys.exit(3)
+
+
+class BotPlayer:
+    def __init__(self, map_copy):
+        pass
+
+    def play_turn(self, controller: RobotController):
+        pass
@@ -0,0 +1,21 @@
+"""
+first_turn.py - startup benchmark bot
+
+Prints a wall clock timestamp on its first play_turn and does nothing else, so
+benchmarks/startup.py can measure process start -> first turn.
+"""
+
+import time
+
+from robot_controller import RobotController
+
+
+class BotPlayer:
+    def __init__(self, map_copy):
+        self.map = map_copy
+        self.seen = False
+
+    def play_turn(self, controller: RobotController):
+        if not self.seen:
+            self.seen = True
+            print(f"FIRST_TURN {time.time():.6f}", flush=True)
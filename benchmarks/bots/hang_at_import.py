@@ -0,0 +1,20 @@
+"""
+hang_at_import.py - isolation check bot
+
+Never finishes importing, so benchmarks/isolation.py can check that a bot
+stuck at module level times out in the init phase instead of hanging its
+game (or a tournament worker).
+"""
+
+from robot_controller import RobotController
+
+while True:
+    pass
+
+
+class BotPlayer:
+    def __init__(self, map_copy):
+        pass
+
+    def play_turn(self, controller: RobotController):
+        pass
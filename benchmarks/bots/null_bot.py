@@ -0,0 +1,16 @@
+"""
+null_bot.py - end-to-end benchmark bot
+
+Does nothing, so a game against it measures the engine alone: turn start,
+environment ticks, the per-turn bot threads and replay recording.
+"""
+
+from robot_controller import RobotController
+
+
+class BotPlayer:
+    def __init__(self, map_copy):
+        pass
+
+    def play_turn(self, controller: RobotController):
+        pass
@@ -0,0 +1,26 @@
+"""
+random_bot.py - end-to-end benchmark bot
+
+Every bot takes one random legal move per turn (checked with can_move) and the
+team switches maps as soon as it may, so games exercise movement, occupancy
+and the switch. Uses the random module, which batch.run_one seeds per game.
+"""
+
+import random
+
+from robot_controller import RobotController
+
+DIRECTIONS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if (dx, dy) != (0, 0)]
+
+
+class BotPlayer:
+    def __init__(self, map_copy):
+        pass
+
+    def play_turn(self, controller: RobotController):
+        if controller.can_switch_maps():
+            controller.switch_maps()
+        for bot_id in controller.get_team_bot_ids(controller.get_team()):
+            moves = [d for d in DIRECTIONS if controller.can_move(bot_id, *d)]
+            if moves:
+                controller.move(bot_id, *random.choice(moves))
@@ -0,0 +1,42 @@
+"""
+replay_bot.py - end-to-end benchmark bot
+
+Replays its team's calls from the action log named by the COOKOFF_REPLAY_LOG
+environment variable (record one with game.py --action-log on the same map).
+The log is decoded once per process, so a turn costs only the engine calls it
+replays: real bot behaviour with no think time.
+"""
+
+import os
+from typing import Dict, List, Tuple
+
+from action_log import ActionLog, decode_arg
+from robot_controller import RobotController
+
+# log path -> team name -> turn -> [(method, args)]
+_DECODED: Dict[str, Dict[str, List[List[Tuple[str, list]]]]] = {}
+
+
+def decoded_calls(path: str) -> Dict[str, List[List[Tuple[str, list]]]]:
+    if path not in _DECODED:
+        log = ActionLog.load(path)
+        per_team = {"RED": [], "BLUE": []}
+        for calls in log.turns:
+            for team_calls in per_team.values():
+                team_calls.append([])
+            for team, method, args, _ in calls:
+                per_team[team][-1].append((method, [decode_arg(a) for a in args]))
+        _DECODED[path] = per_team
+    return _DECODED[path]
+
+
+class BotPlayer:
+    def __init__(self, map_copy):
+        self.turns = decoded_calls(os.environ["COOKOFF_REPLAY_LOG"])
+
+    def play_turn(self, controller: RobotController):
+        turns = self.turns[controller.get_team().name]
+        turn = controller.get_turn()
+        if turn < len(turns):
+            for method, args in turns[turn]:
+                getattr(controller, method)(*args)
@@ -0,0 +1,162 @@
+# e2e.py
+"""
+End-to-end benchmark: full games with stand-in bots that take (almost) no think
+time, so the result is engine throughput in turns/sec.
+
+Bots (benchmarks/bots/):
+  - null:   does nothing
+  - random: one random legal move per bot per turn, switches maps when it may
+  - replay: replays an action log recorded from a random vs random game on the
+            same map (recorded once per map at the start of the run)
+
+Each is played against itself on every map in maps/, with replay recording off
+and in both replay formats, in one process (batch.run_one, maps and bot modules
+cached as in tournaments).
+
+python benchmarks/e2e.py
+python benchmarks/e2e.py --maps maps/map1.txt --bots null replay --record off --games 5
+python benchmarks/e2e.py --json e2e.json
+"""
+
+import argparse
+import contextlib
+import glob
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+from dataclasses import replace
+from typing import Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+
+from batch import CachingLoader, GameConfig, run_one  # noqa: E402
+from game import Game  # noqa: E402
+
+BOTS = {
+    "null": os.path.join(BENCH_DIR, "bots", "null_bot.py"),
+    "random": os.path.join(BENCH_DIR, "bots", "random_bot.py"),
+    "replay": os.path.join(BENCH_DIR, "bots", "replay_bot.py"),
+}
+
+# replay recording mode -> replay file name (None: recording off)
+RECORD_MODES = {"off": None, "json": "replay.json", "bin": "replay.bin"}
+
+
+def record_action_log(map_path: str, turns: int, timeout: float, out_path: str, loader: CachingLoader) -> str:
+    """random vs random on map_path, saved as the log replay_bot plays back"""
+    random.seed(0)
+    with open(os.devnull, "w") as out, contextlib.redirect_stdout(out):
+        g = Game(
+            red_bot_path=BOTS["random"],
+            blue_bot_path=BOTS["random"],
+            map_path=map_path,
+            action_log_path=out_path,
+            turn_limit=turns,
+            per_turn_timeout_s=timeout,
+            loader=loader,
+        )
+        try:
+            g.run_game()
+        finally:
+            g.close()
+    return out_path
+
+
+def run(
+    maps: List[str],
+    bots: List[str],
+    modes: List[str],
+    games: int,
+    turns: int,
+    timeout: float,
+) -> Dict[str, Dict[str, dict]]:
+    """{map name: {"<bot>/<mode>": {"turns_per_sec", "samples", "errors"}}}"""
+    loader = CachingLoader()
+    tmp = tempfile.mkdtemp(prefix="cookoff-e2e-")
+    results: Dict[str, Dict[str, dict]] = {}
+    try:
+        for path in maps:
+            map_name = os.path.basename(path)
+            if "replay" in bots:
+                log = os.path.join(tmp, map_name + ".actions.json")
+                os.environ["COOKOFF_REPLAY_LOG"] = record_action_log(path, turns, timeout, log, loader)
+            row: Dict[str, dict] = {}
+            for bot in bots:
+                for mode in modes:
+                    out = RECORD_MODES[mode]
+                    config = GameConfig(
+                        BOTS[bot],
+                        BOTS[bot],
+                        path,
+                        turns=turns,
+                        timeout=timeout,
+                        replay_path=None if out is None else os.path.join(tmp, out),
+                    )
+                    samples, errors = [], 0
+                    for seed in range(games):
+                        res = run_one(replace(config, seed=seed), loader)
+                        if res.error is not None:
+                            errors += 1
+                            continue
+                        samples.append(res.turns / res.seconds)
+                    row[f"{bot}/{mode}"] = {
+                        "turns_per_sec": statistics.median(samples) if samples else None,
+                        "samples": samples,
+                        "errors": errors,
+                    }
+            results[map_name] = row
+    finally:
+        os.environ.pop("COOKOFF_REPLAY_LOG", None)
+        shutil.rmtree(tmp, ignore_errors=True)
+    return results
+
+
+def format_table(results: Dict[str, Dict[str, dict]]) -> str:
+    lines = []
+    for map_name, row in results.items():
+        lines.append(f"=== {map_name} ===")
+        lines.append(f"{'bots/replay':<16} {'turns/sec':>10} {'ms/turn':>9} {'min':>9} {'max':>9}")
+        for name, r in row.items():
+            if r["turns_per_sec"] is None:
+                lines.append(f"{name:<16} {'failed':>10} ({r['errors']} errors)")
+                continue
+            s = r["samples"]
+            note = f"  ({r['errors']} errors)" if r["errors"] else ""
+            lines.append(
+                f"{name:<16} {r['turns_per_sec']:>10,.0f} {1e3 / r['turns_per_sec']:>9.3f} "
+                f"{min(s):>9,.0f} {max(s):>9,.0f}{note}"
+            )
+        lines.append("")
+    return "\n".join(lines)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="engine turns/sec with stand-in bots")
+    ap.add_argument("--maps", nargs="+", default=None, help="map files (default: maps/*.txt)")
+    ap.add_argument("--bots", nargs="+", choices=list(BOTS), default=list(BOTS))
+    ap.add_argument("--record", nargs="+", choices=list(RECORD_MODES), default=list(RECORD_MODES),
+                    help="replay recording modes to compare")
+    ap.add_argument("--games", type=int, default=3, help="games per map, bot and mode (median reported)")
+    ap.add_argument("--turns", type=int, default=500, help="turns per game")
+    ap.add_argument("--timeout", type=float, default=0.5, help="per-turn timeout seconds per bot")
+    ap.add_argument("--json", default=None, help="also write the results to this file")
+    args = ap.parse_args()
+
+    maps = args.maps or sorted(glob.glob(os.path.join(REPO_ROOT, "maps", "*.txt")))
+    results = run(maps, args.bots, args.record, args.games, args.turns, args.timeout)
+    print(format_table(results))
+    if args.json:
+        import json
+
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"benchmark": "e2e", "results": results}, f, indent=2)
+        print(f"[E2E] wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
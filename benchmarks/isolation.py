@@ -0,0 +1,120 @@
+# isolation.py
+"""
+Isolation check: a misbehaving bot must only lose its own games, never hang or
+abort the run around it. Plays each stand-in bad bot (benchmarks/bots/) against
+null_bot in a tournament and in a batch (src/batch.py), each in a subprocess
+with a wall-clock limit.
+
+  - hang_at_import: loops forever at module level
+  - exit_at_import: calls sys.exit() at module level
+
+python benchmarks/isolation.py
+python benchmarks/isolation.py --limit 60 --reuse-workers
+
+Exits non-zero when a run hangs past --limit or a game doesn't end with the
+bad bot losing.
+"""
+
+import argparse
+import csv
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+TOURNAMENT_PY = os.path.join(REPO_ROOT, "src", "tournament.py")
+BATCH_PY = os.path.join(REPO_ROOT, "src", "batch.py")
+NULL_BOT = os.path.join(BENCH_DIR, "bots", "null_bot.py")
+BAD_BOTS = {
+    "hang_at_import": os.path.join(BENCH_DIR, "bots", "hang_at_import.py"),
+    "exit_at_import": os.path.join(BENCH_DIR, "bots", "exit_at_import.py"),
+}
+
+
+def run_limited(cmd: List[str], limit: float) -> Optional[subprocess.CompletedProcess]:
+    """None when the command is still running after limit seconds (it is killed)"""
+    # own process group, so a hung run's pool workers go down with it
+    proc = subprocess.Popen(
+        cmd, cwd=REPO_ROOT, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, start_new_session=True
+    )
+    try:
+        stdout, _ = proc.communicate(timeout=limit)
+    except subprocess.TimeoutExpired:
+        os.killpg(proc.pid, signal.SIGKILL)
+        proc.communicate()
+        return None
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout)
+
+
+def check_tournament(bad: str, map_path: str, limit: float, reuse_workers: bool) -> Optional[str]:
+    """None when every game finished and the bad bot lost it, otherwise what went wrong"""
+    with tempfile.TemporaryDirectory(prefix="cookoff-isolation-") as tmp:
+        out = os.path.join(tmp, "results.csv")
+        cmd = [
+            sys.executable, TOURNAMENT_PY,
+            "--bots", BAD_BOTS[bad], NULL_BOT,
+            "--maps", map_path, "--turns", "5",
+            "--jobs", "2", "--no-cache", "--quiet", "--out", out,
+        ] + (["--reuse-workers"] if reuse_workers else [])
+        if run_limited(cmd, limit) is None:
+            return f"tournament still running after {limit:.0f}s"
+        if not os.path.exists(out):
+            return "tournament wrote no results"
+        with open(out, "r", newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+    if len(rows) != 2:
+        return f"expected 2 games, got {len(rows)}"
+    for r in rows:
+        bad_team = "RED" if r["red"] == bad else "BLUE"
+        if r["winner"] == bad_team or (not r["winner"] and not r["error"]):
+            return f"{r['red']} vs {r['blue']}: {bad} did not lose (winner {r['winner'] or 'none'})"
+    return None
+
+
+def check_batch(bad: str, map_path: str, limit: float) -> Optional[str]:
+    """None when both games finished without the bad bot (RED) winning either"""
+    cmd = [
+        sys.executable, BATCH_PY,
+        "--red", BAD_BOTS[bad], "--blue", NULL_BOT,
+        "--map", map_path, "--games", "2", "--turns", "5",
+    ]
+    proc = run_limited(cmd, limit)
+    if proc is None:
+        return f"batch still running after {limit:.0f}s"
+    summary = [ln for ln in proc.stdout.splitlines() if ln.startswith("[BATCH]")]
+    if proc.returncode != 0 or not summary:
+        return f"batch aborted (exit code {proc.returncode})"
+    if "[BATCH] 2 games" not in summary[0] or "RED 0," not in summary[0]:
+        return summary[0]
+    return None
+
+
+def main():
+    ap = argparse.ArgumentParser(description="check that bad bots only lose their own games")
+    ap.add_argument("--map", default=os.path.join(REPO_ROOT, "maps", "map1.txt"))
+    ap.add_argument("--limit", type=float, default=60.0, help="wall-clock seconds per run before it counts as hung")
+    ap.add_argument("--reuse-workers", action="store_true", help="long lived tournament workers")
+    args = ap.parse_args()
+
+    failed: List[str] = []
+    for bad in BAD_BOTS:
+        for kind, check in (
+            ("tournament", lambda: check_tournament(bad, args.map, args.limit, args.reuse_workers)),
+            ("batch", lambda: check_batch(bad, args.map, args.limit)),
+        ):
+            t0 = time.perf_counter()
+            problem = check()
+            dt = time.perf_counter() - t0
+            print(f"[ISOLATION] {kind} {bad}: {problem or 'OK'} ({dt:.1f}s)", flush=True)
+            if problem:
+                failed.append(f"{kind} {bad}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
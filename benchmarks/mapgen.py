@@ -0,0 +1,144 @@
+# mapgen.py
+"""
+Synthetic map generator for scaling tests: kitchens far larger than the
+shipped maps, with many bot spawns and long ORDERS sections.
+
+Layout: a wall border around a floor; stations (and optional wall pillars)
+sit on a lattice of interior cells with both coordinates even, so every
+station touches floor and the floor stays connected whatever the density.
+Every station type appears at least once. Spawns are random floor cells.
+
+python benchmarks/mapgen.py --size 128 --spawns 10 --orders 2000 -o /tmp/big.txt
+python benchmarks/mapgen.py --width 512 --height 256 --density 0.5 --walls 0.1 --seed 3 -o /tmp/wide.txt
+"""
+
+import argparse
+import os
+import random
+import sys
+from typing import List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+
+from game_constants import FoodType  # noqa: E402
+
+# station char -> relative weight among the lattice sites that get a station
+STATION_WEIGHTS = {
+    "C": 6,  # counter
+    "$": 2,  # shop
+    "K": 2,  # cooker
+    "U": 1,  # submit
+    "S": 1,  # sink
+    "T": 1,  # sink table
+    "R": 1,  # trash
+    "B": 2,  # box
+}
+
+FOOD_NAMES = [f.name for f in FoodType]
+
+
+def lattice_sites(width: int, height: int) -> List[tuple]:
+    """interior cells that can hold a station without cutting the floor apart"""
+    return [(x, y) for x in range(2, width - 2, 2) for y in range(2, height - 2, 2)]
+
+
+def generate(
+    width: int,
+    height: int,
+    density: float = 0.3,
+    walls: float = 0.0,
+    spawns: int = 2,
+    orders: int = 100,
+    turns: int = 500,
+    switch_turn: int = 250,
+    switch_duration: int = 100,
+    seed: int = 0,
+) -> str:
+    """map file text; density / walls are fractions of the lattice sites"""
+    if width < 7 or height < 7:
+        raise ValueError("maps need to be at least 7x7")
+    rng = random.Random(seed)
+    grid = [["." for _ in range(width)] for _ in range(height)]  # grid[row][col]
+    for x in range(width):
+        grid[0][x] = grid[height - 1][x] = "#"
+    for y in range(height):
+        grid[y][0] = grid[y][width - 1] = "#"
+
+    sites = lattice_sites(width, height)
+    rng.shuffle(sites)
+    n_stations = max(len(STATION_WEIGHTS), int(len(sites) * density))
+    n_walls = int(len(sites) * walls)
+    if n_stations + n_walls > len(sites):
+        raise ValueError(f"{width}x{height} has {len(sites)} lattice sites, asked for {n_stations + n_walls}")
+
+    kinds = list(STATION_WEIGHTS)  # one of each first
+    kinds += rng.choices(kinds, weights=list(STATION_WEIGHTS.values()), k=n_stations - len(kinds))
+    for (x, y), ch in zip(sites, kinds):
+        grid[y][x] = ch
+    for x, y in sites[n_stations:n_stations + n_walls]:
+        grid[y][x] = "#"
+
+    floor = [(x, y) for y in range(1, height - 1) for x in range(1, width - 1) if grid[y][x] == "."]
+    if spawns > len(floor):
+        raise ValueError(f"only {len(floor)} floor cells for {spawns} spawns")
+    for x, y in rng.sample(floor, spawns):
+        grid[y][x] = "b"
+
+    lines = ["".join(row) for row in grid]
+    lines.append("")
+    lines.append(f"SWITCH: turn={switch_turn} duration={switch_duration}")
+    lines.append("")
+    lines.append("ORDERS:")
+    for _ in range(orders):
+        start = rng.randrange(0, max(1, turns - 20))
+        duration = rng.randint(20, 200)
+        required = ",".join(rng.sample(FOOD_NAMES, rng.randint(1, 3)))
+        lines.append(
+            f"start={start} duration={duration} required={required} "
+            f"reward={rng.randint(5, 50)} penalty={rng.randint(1, 5)}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def write_map(path: str, **kwargs) -> str:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(generate(**kwargs))
+    return path
+
+
+def main():
+    ap = argparse.ArgumentParser(description="generate a synthetic map for scaling tests")
+    ap.add_argument("--size", type=int, default=None, help="square map side (sets width and height)")
+    ap.add_argument("--width", type=int, default=64)
+    ap.add_argument("--height", type=int, default=64)
+    ap.add_argument("--density", type=float, default=0.3, help="fraction of lattice sites with a station")
+    ap.add_argument("--walls", type=float, default=0.0, help="fraction of lattice sites with a wall pillar")
+    ap.add_argument("--spawns", type=int, default=2, help="bot spawns (per team)")
+    ap.add_argument("--orders", type=int, default=100, help="ORDERS lines")
+    ap.add_argument("--turns", type=int, default=500, help="orders start before this turn")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("-o", "--out", required=True, help="output map file")
+    args = ap.parse_args()
+
+    width = height = args.size
+    if args.size is None:
+        width, height = args.width, args.height
+    write_map(
+        args.out,
+        width=width,
+        height=height,
+        density=args.density,
+        walls=args.walls,
+        spawns=args.spawns,
+        orders=args.orders,
+        turns=args.turns,
+        seed=args.seed,
+    )
+    print(f"[MAPGEN] wrote {args.out}: {width}x{height}, {args.spawns} spawns, {args.orders} orders")
+
+
+if __name__ == "__main__":
+    main()
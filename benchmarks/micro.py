@@ -0,0 +1,274 @@
+# micro.py
+"""
+Engine microbenchmarks: the hot GameState / RobotController operations timed in
+isolation, on every map in maps/ (or the ones given).
+
+For each operation and map it reports
+  - ops/sec: best of --repeat timed batches (each batch sized to take ~--min-time)
+  - alloc/op: peak bytes allocated during one call (tracemalloc, separate pass)
+  - kept/op: bytes still allocated after the batch, per call (growth, e.g. sinks
+    filling up with dirty plates)
+
+python benchmarks/micro.py
+python benchmarks/micro.py --maps maps/map1.txt maps/v1.txt --bench get_map move_bot
+python benchmarks/micro.py --json micro.json
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+
+from game_constants import Team  # noqa: E402
+from game_state import GameState  # noqa: E402
+from item import Food, Plate  # noqa: E402
+from tiles import Submit  # noqa: E402
+from robot_controller import RobotController  # noqa: E402
+from game import create_game_state  # noqa: E402
+
+
+# ----------------------------
+# Benchmarks
+# ----------------------------
+# each takes a fresh game state (turn 1) and returns the operation to time, or
+# None when the map can't exercise it
+
+Setup = Callable[[GameState], Optional[Callable[[], object]]]
+
+
+def red_bot(gs: GameState) -> int:
+    return min(bid for bid, b in gs.bots.items() if b.team == Team.RED)
+
+
+def bench_start_turn(gs: GameState):
+    return gs.start_turn
+
+
+def bench_tick_environment(gs: GameState):
+    return lambda: gs.tick_environment(Team.RED)
+
+
+def bench_move_bot(gs: GameState):
+    """one step there and back per two calls"""
+    bid = red_bot(gs)
+    b = gs.bots[bid]
+    for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (-1, -1), (1, -1), (-1, 1)):
+        if gs.move_bot(bid, dx, dy):
+            gs.move_bot(bid, -dx, -dy)
+            break
+    else:
+        return None  # boxed in
+    step = [dx, dy]
+
+    def op():
+        gs.move_bot(bid, step[0], step[1])
+        step[0], step[1] = -step[0], -step[1]
+
+    return op
+
+
+def bench_get_tile(gs: GameState):
+    rc = RobotController(Team.RED, gs)
+    b = gs.bots[red_bot(gs)]
+    return lambda: rc.get_tile(Team.RED, b.x, b.y)
+
+
+def bench_get_map(gs: GameState):
+    rc = RobotController(Team.RED, gs)
+    return lambda: rc.get_map(Team.RED)
+
+
+def bench_get_bot_state(gs: GameState):
+    rc = RobotController(Team.RED, gs)
+    bid = red_bot(gs)
+    return lambda: rc.get_bot_state(bid)
+
+
+def bench_get_orders(gs: GameState):
+    rc = RobotController(Team.RED, gs)
+    return lambda: rc.get_orders(Team.RED)
+
+
+def bench_submit_plate(gs: GameState):
+    """a successful submission of a plate matching the first order"""
+    m = gs.get_map(Team.RED)
+    submit = next(
+        ((x, y) for x in range(m.width) for y in range(m.height) if isinstance(m.tiles[x][y], Submit)),
+        None,
+    )
+    orders = gs.orders[Team.RED]
+    if submit is None or not orders:
+        return None
+    order = orders[0]
+    gs.turn = order.created_turn
+    food = []
+    for ft in order.required:
+        f = Food(ft)
+        f.chopped = ft.can_chop
+        f.cooked_stage = 1 if ft.can_cook else 0
+        food.append(f)
+    bot = gs.bots[red_bot(gs)]
+    sx, sy = submit
+
+    def op():
+        bot.holding = Plate(list(food))
+        order.completed_turn = None
+        gs.submit_plate(bot.bot_id, sx, sy)
+
+    return op
+
+
+def bench_to_dict(gs: GameState):
+    return gs.to_dict
+
+
+def bench_request_switch(gs: GameState):
+    """switches RED onto BLUE's map again and again (the once-per-game flag is reset)"""
+    gs.turn = gs.switch_turn
+    if not gs.switch_window_active():
+        return None
+
+    def op():
+        gs.switched[Team.RED] = False
+        gs.request_switch(Team.RED)
+
+    return op
+
+
+BENCHMARKS: Dict[str, Setup] = {
+    "start_turn": bench_start_turn,
+    "tick_environment": bench_tick_environment,
+    "move_bot": bench_move_bot,
+    "get_tile": bench_get_tile,
+    "get_map": bench_get_map,
+    "get_bot_state": bench_get_bot_state,
+    "get_orders": bench_get_orders,
+    "submit_plate": bench_submit_plate,
+    "to_dict": bench_to_dict,
+    "request_switch": bench_request_switch,
+}
+
+
+# ----------------------------
+# Measuring
+# ----------------------------
+
+def fresh_op(map_path: str, setup: Setup):
+    gs = create_game_state(map_path)
+    gs.start_turn()
+    return setup(gs)
+
+
+def time_op(op, min_time: float, repeat: int) -> List[float]:
+    """ops/sec of each of `repeat` equally sized batches"""
+    n = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(n):
+            op()
+        dt = time.perf_counter() - t0
+        if dt >= min_time or n >= 1 << 24:
+            break
+        n *= 2 if dt <= 0 else max(2, min(10, int(min_time / dt) + 1))
+    samples = [dt]
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter()
+        for _ in range(n):
+            op()
+        samples.append(time.perf_counter() - t0)
+    return [n / t if t > 0 else float("inf") for t in samples]
+
+
+def measure_alloc(op, calls: int = 50):
+    """(mean peak bytes per call, bytes kept per call)"""
+    tracemalloc.start()
+    try:
+        op()  # first call may fill caches
+        start, _ = tracemalloc.get_traced_memory()
+        peaks = 0
+        for _ in range(calls):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            op()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks += peak - before
+        end, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peaks / calls, (end - start) / calls
+
+
+def run(maps: List[str], names: List[str], min_time: float, repeat: int) -> Dict[str, Dict[str, dict]]:
+    """
+    {map name: {benchmark: {"ops_per_sec", "samples", "alloc_bytes", "kept_bytes"}}},
+    None when not applicable; samples holds every batch and ops_per_sec the best
+    of them, for the table (baseline.collect summarizes a run by the median)
+    """
+    results: Dict[str, Dict[str, dict]] = {}
+    for path in maps:
+        row: Dict[str, dict] = {}
+        for name in names:
+            # separate states for timing and allocation, so one doesn't skew the other
+            op = fresh_op(path, BENCHMARKS[name])
+            if op is None:
+                row[name] = None
+                continue
+            samples = time_op(op, min_time, repeat)
+            alloc, kept = measure_alloc(fresh_op(path, BENCHMARKS[name]))
+            row[name] = {
+                "ops_per_sec": max(samples),
+                "samples": samples,
+                "alloc_bytes": alloc,
+                "kept_bytes": kept,
+            }
+        results[os.path.basename(path)] = row
+    return results
+
+
+def format_table(results: Dict[str, Dict[str, dict]], names: List[str]) -> str:
+    lines = []
+    for map_name, row in results.items():
+        lines.append(f"=== {map_name} ===")
+        lines.append(f"{'operation':<18} {'ops/sec':>12} {'us/op':>9} {'alloc/op':>10} {'kept/op':>9}")
+        for name in names:
+            r = row.get(name)
+            if r is None:
+                lines.append(f"{name:<18} {'n/a':>12}")
+                continue
+            lines.append(
+                f"{name:<18} {r['ops_per_sec']:>12,.0f} {1e6 / r['ops_per_sec']:>9.2f} "
+                f"{r['alloc_bytes'] / 1024:>8.1f}KB {r['kept_bytes']:>8.0f}B"
+            )
+        lines.append("")
+    return "\n".join(lines)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="time hot engine operations on every map")
+    ap.add_argument("--maps", nargs="+", default=None, help="map files (default: maps/*.txt)")
+    ap.add_argument("--bench", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS))
+    ap.add_argument("--min-time", type=float, default=0.05, help="seconds per timed batch")
+    ap.add_argument("--repeat", type=int, default=5, help="timed batches per operation")
+    ap.add_argument("--json", default=None, help="also write the results to this file")
+    args = ap.parse_args()
+
+    maps = args.maps or sorted(glob.glob(os.path.join(REPO_ROOT, "maps", "*.txt")))
+    results = run(maps, args.bench, args.min_time, args.repeat)
+    print(format_table(results, args.bench))
+    if args.json:
+        import json
+
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"benchmark": "micro", "results": results}, f, indent=2)
+        print(f"[MICRO] wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
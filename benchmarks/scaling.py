@@ -0,0 +1,187 @@
+# scaling.py
+"""
+Scaling benchmark: engine cost against map area, bot count and order count,
+on synthetic maps from mapgen.py.
+
+Three sweeps, each varying one axis from a base map (--base-size square,
+--base-spawns, --base-orders):
+  - area:   --sizes
+  - bots:   --spawns (per team)
+  - orders: --orders
+
+Every point plays --turns turns with the null and random stand-in bots
+(benchmarks/bots/) through the default loader and reports setup time (game
+state + bot maps) with a cold compiled-map cache (parse + compile) and a warm
+one (artifact load), and ms per turn. The compiled-map cache points at the
+temp dir holding the generated maps, so nothing lands in .cache/maps. Results
+go to stdout, optionally a CSV, and a PNG plot when matplotlib is installed.
+
+python benchmarks/scaling.py
+python benchmarks/scaling.py --sizes 64 128 256 512 --spawns 2 10 50 --orders 100 1000 5000 --csv scaling.csv --plot scaling.png
+"""
+
+import argparse
+import contextlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+
+from game import Game  # noqa: E402
+from mapgen import write_map  # noqa: E402
+
+BOTS = {
+    "null": os.path.join(BENCH_DIR, "bots", "null_bot.py"),
+    "random": os.path.join(BENCH_DIR, "bots", "random_bot.py"),
+}
+
+
+def new_game(map_path: str, bot: str, turns: int, timeout: float) -> Game:
+    return Game(
+        red_bot_path=BOTS[bot],
+        blue_bot_path=BOTS[bot],
+        map_path=map_path,
+        turn_limit=turns,
+        per_turn_timeout_s=timeout,
+    )
+
+
+def measure(map_path: str, bot: str, turns: int, timeout: float) -> Dict[str, float]:
+    """first game compiles the map (cold), the second loads the artifact (warm) and plays"""
+    with open(os.devnull, "w") as out, contextlib.redirect_stdout(out):
+        t0 = time.perf_counter()
+        new_game(map_path, bot, turns, timeout).close()
+        t1 = time.perf_counter()
+        g = new_game(map_path, bot, turns, timeout)
+        t2 = time.perf_counter()
+        try:
+            g.run_game()
+        finally:
+            g.close()
+        t3 = time.perf_counter()
+    played = max(g.game_state.turn, 1)
+    return {
+        "setup_cold_s": t1 - t0,
+        "setup_warm_s": t2 - t1,
+        "turn_ms": (t3 - t2) / played * 1e3,
+        "turns": g.game_state.turn,
+    }
+
+
+def sweep_points(args) -> List[Dict[str, int]]:
+    base = {"size": args.base_size, "spawns": args.base_spawns, "orders": args.base_orders}
+    points = []
+    for axis, values in (("size", args.sizes), ("spawns", args.spawns), ("orders", args.orders)):
+        for v in values:
+            points.append({"sweep": axis, **base, axis: v})
+    return points
+
+
+def run(args) -> List[Dict]:
+    tmp = tempfile.mkdtemp(prefix="cookoff-scaling-")
+    saved_cache_dir = os.environ.get("COOKOFF_CACHE_DIR")
+    os.environ["COOKOFF_CACHE_DIR"] = tmp
+    rows = []
+    try:
+        for p in sweep_points(args):
+            path = write_map(
+                os.path.join(tmp, f"{p['size']}_{p['spawns']}_{p['orders']}.txt"),
+                width=p["size"],
+                height=p["size"],
+                density=args.density,
+                spawns=p["spawns"],
+                orders=p["orders"],
+                turns=args.turns,
+                seed=args.seed,
+            )
+            for bot in args.bots:
+                # sweeps share the base point, so drop earlier artifacts to keep the cold run cold
+                shutil.rmtree(os.path.join(tmp, "maps"), ignore_errors=True)
+                r = measure(path, bot, args.turns, args.timeout)
+                row = {**p, "area": p["size"] ** 2, "bot": bot, **r}
+                rows.append(row)
+                print(
+                    f"[SCALING] {p['sweep']:<6} {p['size']:>4}x{p['size']:<4} {p['spawns']:>3} bots "
+                    f"{p['orders']:>5} orders  {bot:<6} setup cold {r['setup_cold_s'] * 1e3:>8.1f}ms "
+                    f"warm {r['setup_warm_s'] * 1e3:>8.1f}ms  "
+                    f"turn {r['turn_ms']:>7.3f}ms" + ("" if r["turns"] == args.turns else f"  (stopped at turn {r['turns']})"),
+                    flush=True,
+                )
+    finally:
+        if saved_cache_dir is None:
+            os.environ.pop("COOKOFF_CACHE_DIR", None)
+        else:
+            os.environ["COOKOFF_CACHE_DIR"] = saved_cache_dir
+        shutil.rmtree(tmp, ignore_errors=True)
+    return rows
+
+
+def write_csv(rows: List[Dict], path: str) -> None:
+    cols = ["sweep", "size", "area", "spawns", "orders", "bot", "setup_cold_s", "setup_warm_s", "turn_ms", "turns"]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(",".join(cols) + "\n")
+        for r in rows:
+            f.write(",".join(str(r[c]) for c in cols) + "\n")
+
+
+def plot(rows: List[Dict], path: str) -> bool:
+    """one panel per sweep; False when matplotlib is not installed"""
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        return False
+    axes_for = {"size": ("area", "map area (cells)"), "spawns": ("spawns", "bots per team"), "orders": ("orders", "orders")}
+    fig, axes = plt.subplots(1, 3, figsize=(15, 4))
+    for ax, (sweep, (x_key, label)) in zip(axes, axes_for.items()):
+        for bot in sorted({r["bot"] for r in rows}):
+            pts = sorted((r[x_key], r["turn_ms"]) for r in rows if r["sweep"] == sweep and r["bot"] == bot)
+            if pts:
+                ax.plot([x for x, _ in pts], [y for _, y in pts], marker="o", label=bot)
+        ax.set_xlabel(label)
+        ax.set_ylabel("ms / turn")
+        ax.set_xscale("log")
+        ax.legend()
+    fig.tight_layout()
+    fig.savefig(path)
+    return True
+
+
+def main():
+    ap = argparse.ArgumentParser(description="engine turn time against map area, bot count and order count")
+    ap.add_argument("--sizes", nargs="+", type=int, default=[32, 64, 128, 256], help="square map sides")
+    ap.add_argument("--spawns", nargs="+", type=int, default=[2, 5, 10, 25, 50], help="bots per team")
+    ap.add_argument("--orders", nargs="+", type=int, default=[10, 100, 1000, 5000], help="ORDERS lines")
+    ap.add_argument("--base-size", type=int, default=64)
+    ap.add_argument("--base-spawns", type=int, default=2)
+    ap.add_argument("--base-orders", type=int, default=100)
+    ap.add_argument("--density", type=float, default=0.3, help="station density (see mapgen.py)")
+    ap.add_argument("--bots", nargs="+", choices=list(BOTS), default=list(BOTS))
+    ap.add_argument("--turns", type=int, default=100, help="turns per game")
+    ap.add_argument("--timeout", type=float, default=5.0, help="per-turn timeout seconds per bot")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--csv", default=None, help="write the rows to this file")
+    ap.add_argument("--plot", default=None, help="write a png of ms/turn per sweep (needs matplotlib)")
+    args = ap.parse_args()
+
+    rows = run(args)
+    if args.csv:
+        write_csv(rows, args.csv)
+        print(f"[SCALING] wrote {args.csv}")
+    if args.plot:
+        if plot(rows, args.plot):
+            print(f"[SCALING] wrote {args.plot}")
+        else:
+            print("[WARNING] --plot needs matplotlib, skipping the plot")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# startup.py
+"""
+Startup benchmark: wall time from launching `python src/game.py` to the first
+play_turn call (time-to-first-turn), headless, 1 turn.
+
+python benchmarks/startup.py
+python benchmarks/startup.py --runs 20 --map maps/v1.txt
+
+Exits non-zero when the median exceeds "startup_ms" in benchmarks/budgets.json.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+GAME_PY = os.path.join(REPO_ROOT, "src", "game.py")
+MARKER_BOT = os.path.join(BENCH_DIR, "bots", "first_turn.py")
+BUDGETS = os.path.join(BENCH_DIR, "budgets.json")
+
+
+def load_budget(name: str):
+    with open(BUDGETS, "r", encoding="utf-8") as f:
+        return json.load(f).get(name)
+
+
+def time_to_first_turn(map_path: str) -> float:
+    """seconds from spawning game.py until the marker bot's first turn"""
+    cmd = [
+        sys.executable, GAME_PY,
+        "--red", MARKER_BOT, "--blue", MARKER_BOT,
+        "--map", map_path, "--turns", "1",
+    ]
+    t0 = time.time()
+    proc = subprocess.run(cmd, cwd=REPO_ROOT, capture_output=True, text=True)
+    for line in proc.stdout.splitlines():
+        if line.startswith("FIRST_TURN "):
+            return float(line.split()[1]) - t0
+    raise RuntimeError(f"no FIRST_TURN marker (exit {proc.returncode}):\n{proc.stdout}{proc.stderr}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="measure game.py time-to-first-turn")
+    ap.add_argument("--map", default=os.path.join(REPO_ROOT, "maps", "map1.txt"))
+    ap.add_argument("--runs", type=int, default=10)
+    ap.add_argument("--budget-ms", type=float, default=None, help="override budgets.json")
+    args = ap.parse_args()
+
+    time_to_first_turn(args.map)  # warm the OS file cache and __pycache__
+    samples = [time_to_first_turn(args.map) * 1e3 for _ in range(args.runs)]
+    median = statistics.median(samples)
+    budget = args.budget_ms if args.budget_ms is not None else load_budget("startup_ms")
+
+    print(
+        f"[STARTUP] time-to-first-turn median {median:.1f}ms "
+        f"(min {min(samples):.1f}ms, max {max(samples):.1f}ms, {len(samples)} runs)"
+    )
+    if budget is not None:
+        ok = median <= budget
+        print(f"[STARTUP] budget {budget:.0f}ms: {'OK' if ok else 'OVER BUDGET'}")
+        if not ok:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
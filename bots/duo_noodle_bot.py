@@ -1,8 +1,7 @@
-import random
-from collections import deque
 from typing import Tuple, Optional, List
 
 from game_constants import Team, TileType, FoodType, ShopCosts
+from helpers import SpaceTimePlanner, analyze
 from robot_controller import RobotController
 from item import Pan, Plate, Food
 
@@ -10,56 +9,18 @@ from item import Pan, Plate, Food
 class BotPlayer:
     def __init__(self, map_copy):
         self.map = map_copy
+        # both bots are planned together so the helper steps out of the cook's way
+        self.planner = SpaceTimePlanner(analyze(map_copy))
         self.assembly_counter = None
         self.cooker_loc = None
         self.my_bot_id = None
 
         self.state = 0
 
-    def get_bfs_path(
-        self, controller: RobotController, start: Tuple[int, int], target_predicate
-    ) -> Optional[Tuple[int, int]]:
-        queue = deque([(start, [])])
-        visited = set([start])
-        w, h = self.map.width, self.map.height
-
-        while queue:
-            (curr_x, curr_y), path = queue.popleft()
-            tile = controller.get_tile(controller.get_team(), curr_x, curr_y)
-            if target_predicate(curr_x, curr_y, tile):
-                if not path:
-                    return (0, 0)
-                return path[0]
-
-            for dx in [0, -1, 1]:
-                for dy in [0, -1, 1]:
-                    if dx == 0 and dy == 0:
-                        continue
-                    nx, ny = curr_x + dx, curr_y + dy
-                    if 0 <= nx < w and 0 <= ny < h and (nx, ny) not in visited:
-                        if controller.get_map(controller.get_team()).is_tile_walkable(
-                            nx, ny
-                        ):
-                            visited.add((nx, ny))
-                            queue.append(((nx, ny), path + [(dx, dy)]))
-        return None
-
     def move_towards(
         self, controller: RobotController, bot_id: int, target_x: int, target_y: int
     ) -> bool:
-        bot_state = controller.get_bot_state(bot_id)
-        bx, by = bot_state["x"], bot_state["y"]
-
-        def is_adjacent_to_target(x, y, tile):
-            return max(abs(x - target_x), abs(y - target_y)) <= 1
-
-        if is_adjacent_to_target(bx, by, None):
-            return True
-        step = self.get_bfs_path(controller, (bx, by), is_adjacent_to_target)
-        if step and (step[0] != 0 or step[1] != 0):
-            controller.move(bot_id, step[0], step[1])
-            return False
-        return False
+        return self.planner.move_towards(controller, bot_id, (target_x, target_y))
 
     def find_nearest_tile(
         self, controller: RobotController, bot_x: int, bot_y: int, tile_name: str
@@ -270,15 +231,4 @@ class BotPlayer:
                 if controller.trash(bot_id, tx, ty):
                     self.state = 2  # restart
         for i in range(1, len(my_bots)):
-            self.my_bot_id = my_bots[i]
-            bot_id = self.my_bot_id
-
-            bot_info = controller.get_bot_state(bot_id)
-            bx, by = bot_info["x"], bot_info["y"]
-
-            dx = random.choice([-1, 1])
-            dy = random.choice([-1, 1])
-            nx, ny = bx + dx, by + dy
-            if controller.get_map(controller.get_team()).is_tile_walkable(nx, ny):
-                controller.move(bot_id, dx, dy)
-                return
+            self.planner.make_way(controller, my_bots[i])
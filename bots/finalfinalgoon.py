@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
 from game_constants import FoodType, ShopCosts, Team, TileType
+from helpers import analyze, bfs
 from item import Food, Pan, Plate
 from robot_controller import RobotController
 
@@ -68,6 +69,7 @@ class ActiveOrder:
 class BotPlayer:
     def __init__(self, map_copy):
         self.map = map_copy
+        self.info = analyze(map_copy)
         self.cooker_pos = []
         self.shop_pos = []
         self.submit_pos = []
@@ -89,7 +91,6 @@ class BotPlayer:
         # shared stattes
         self.current_order = ActiveOrder()
         self.path_cache = {}
-        self.turn_map = None
         self.bot_orders = {}
         self.order_claims = {}
 
@@ -99,24 +100,11 @@ class BotPlayer:
     def _initialize_locations(self, controller: RobotController):
         """Find and cache important tile locations once"""
 
-        m = controller.get_map(controller.get_team())
-
-        # Find all important tiles
-        for x in range(m.width):
-            for y in range(m.height):
-                tile = m.tiles[x][y]
-                tile_name = tile.tile_name
-
-                if tile_name == "SHOP":
-                    self.shop_pos.append((x, y))
-                elif tile_name == "SUBMIT":
-                    self.submit_pos.append((x, y))
-                elif tile_name == "TRASH":
-                    self.trash_pos.append((x, y))
-                elif tile_name == "COOKER":
-                    self.cooker_pos.append((x, y))
-                elif tile_name == "COUNTER":
-                    self.all_counters.append((x, y))
+        self.shop_pos = self.info.positions("SHOP")
+        self.submit_pos = self.info.positions("SUBMIT")
+        self.trash_pos = self.info.positions("TRASH")
+        self.cooker_pos = self.info.positions("COOKER")
+        self.all_counters = self.info.positions("COUNTER")
 
         # # Assign counters to different purposes
         # if len(self.all_counters) >= 3:
@@ -153,14 +141,6 @@ class BotPlayer:
         self, controller: RobotController, start: Tuple[int, int], target_predicate
     ) -> Optional[List[Tuple[int, int]]]:
         """BFS pathfinding - returns full step list [(dx, dy), ...] or None"""
-        queue = deque([start])
-        visited = {start}
-        came_from = {}  # (nx, ny) -> (prev_x, prev_y, dx, dy)
-        map_for_turn = self.turn_map
-        if map_for_turn is None:
-            map_for_turn = controller.get_map(controller.get_team())
-        w, h = map_for_turn.width, map_for_turn.height
-
         # Get all bot positions to avoid collisions
         bot_positions = set()
 
@@ -177,38 +157,7 @@ class BotPlayer:
             if bot:
                 bot_positions.add((bot["x"], bot["y"]))
 
-        while queue:
-            curr_x, curr_y = queue.popleft()
-            tile = controller.get_tile(controller.get_team(), curr_x, curr_y)
-
-            if target_predicate(curr_x, curr_y, tile):
-                # Reconstruct path
-                path = []
-                curr = (curr_x, curr_y)
-                while curr != start:
-                    prev_x, prev_y, dx, dy = came_from[curr]
-                    path.append((dx, dy))
-                    curr = (prev_x, prev_y)
-                return path[::-1]
-
-            # Explore neighbors (Chebyshev distance)
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    if dx == 0 and dy == 0:
-                        continue
-                    nx, ny = curr_x + dx, curr_y + dy
-
-                    if 0 <= nx < w and 0 <= ny < h and (nx, ny) not in visited:
-                        # Check if tile is walkable and not occupied by other bots
-                        if (
-                            map_for_turn.is_tile_walkable(nx, ny)
-                            and (nx, ny) not in bot_positions
-                        ):
-                            visited.add((nx, ny))
-                            came_from[(nx, ny)] = (curr_x, curr_y, dx, dy)
-                            queue.append((nx, ny))
-
-        return None
+        return bfs(self.info, start, target_predicate, blocked=bot_positions)
 
     def move_towards(
         self, controller: RobotController, bot_id: int, target_x: int, target_y: int
@@ -233,7 +182,7 @@ class BotPlayer:
             return False, None
 
         # Find path and move
-        def is_adjacent(x, y, tile):
+        def is_adjacent(x, y):
             return max(abs(x - target_x), abs(y - target_y)) <= 1
 
         cache_key = ((bx, by), (target_x, target_y))
@@ -405,6 +354,16 @@ class BotPlayer:
                 best_pos = (x, y)
         return best_pos
 
+    def find_nearest_station(self, controller, bot_state, group: str, positions):
+        """Nearest station of a type by walking distance (precomputed distance field)"""
+        bot_x, bot_y = bot_state["x"], bot_state["y"]
+        if bot_state["map_team"] == bot_state["team"]:
+            nearest = self.info.field(group).nearest(bot_x, bot_y)
+            if nearest is not None:
+                return nearest
+        # On the enemy map or walled off: fall back to straight-line distance
+        return self.find_closest(controller, bot_x, bot_y, positions)
+
     def find_empty_counter(self, controller: RobotController, bot_id: int):
         """Find nearest empty counter that is reachable (can path to adjacent position)"""
         bot_state = controller.get_bot_state(bot_id)
@@ -441,7 +400,7 @@ class BotPlayer:
                         goal_tiles.add((nx, ny))
 
         # 2. Run BFS with predicate checking if we are in goal_tiles
-        def is_at_goal(x, y, tile):
+        def is_at_goal(x, y):
             return (x, y) in goal_tiles
 
         path = self.get_bfs_path_steps(controller, (bot_x, bot_y), is_at_goal)
@@ -506,7 +465,7 @@ class BotPlayer:
                     if 0 <= nx < w and 0 <= ny < h:
                         goal_tiles.add((nx, ny))
 
-        def is_at_goal(x, y, tile):
+        def is_at_goal(x, y):
             return (x, y) in goal_tiles
 
         path = self.get_bfs_path_steps(controller, (bot_x, bot_y), is_at_goal)
@@ -562,7 +521,7 @@ class BotPlayer:
                     if 0 <= nx < w and 0 <= ny < h:
                         goal_tiles.add((nx, ny))
 
-        def is_at_goal(x, y, tile):
+        def is_at_goal(x, y):
             return (x, y) in goal_tiles
 
         path = self.get_bfs_path_steps(controller, (bot_x, bot_y), is_at_goal)
@@ -588,30 +547,27 @@ class BotPlayer:
         bot_state = controller.get_bot_state(bot_id)
         if not bot_state:
             return self.shop_pos[0] if self.shop_pos else None
-        bot_x, bot_y = bot_state["x"], bot_state["y"]
         if not self.shop_pos:
             return None
-        return self.find_closest(controller, bot_x, bot_y, self.shop_pos)
+        return self.find_nearest_station(controller, bot_state, "SHOP", self.shop_pos)
 
     def find_closest_submit(self, controller: RobotController, bot_id: int):
         """Find closest submit - submits are always accessible"""
         bot_state = controller.get_bot_state(bot_id)
         if not bot_state:
             return self.submit_pos[0] if self.submit_pos else None
-        bot_x, bot_y = bot_state["x"], bot_state["y"]
         if not self.submit_pos:
             return None
-        return self.find_closest(controller, bot_x, bot_y, self.submit_pos)
+        return self.find_nearest_station(controller, bot_state, "SUBMIT", self.submit_pos)
 
     def find_closest_counter(self, controller: RobotController, bot_id: int):
         """Find closest counter - returns all counters, not just empty ones"""
         bot_state = controller.get_bot_state(bot_id)
         if not bot_state:
             return self.all_counters[0] if self.all_counters else None
-        bot_x, bot_y = bot_state["x"], bot_state["y"]
         if not self.all_counters:
             return None
-        return self.find_closest(controller, bot_x, bot_y, self.all_counters)
+        return self.find_nearest_station(controller, bot_state, "COUNTER", self.all_counters)
 
     def find_closest_cooker(self, controller: RobotController, bot_id: int):
         bot_state = controller.get_bot_state(bot_id)
@@ -1551,7 +1507,6 @@ class BotPlayer:
             reverse=True,
         )
         # logger(f"orders: {active_orders}")
-        self.turn_map = controller.get_map(controller.get_team())
         bots = controller.get_team_bot_ids(controller.get_team())
         # logger(f"[PLAY_TURN] Running turn for bots: {bots[:2]}")
         for bot_id in bots[:2]:
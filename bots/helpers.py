@@ -0,0 +1,711 @@
+"""
+helpers.py
+
+Shared bot toolkit: static map analysis cached per map layout, BFS
+pathfinding over flat cell indices with parent pointers, per station type
+distance fields (O(1) distance / direction to the nearest shop, submit, ...)
+and a cooperative space-time planner for moving several bots without them
+blocking each other (SpaceTimePlanner).
+
+    from helpers import analyze, bfs, find_closest, move_towards
+
+    info = analyze(map_copy)             # once, in BotPlayer.__init__
+    shop = find_closest(info, (bx, by), info.positions("SHOP"))
+    steps = bfs(info, (bx, by), info.access_cells([shop]), blocked=occupied(controller))
+    move_towards(controller, bot_id, shop, info)
+    d, step = info.field("SUBMIT").distance(bx, by), info.field("SUBMIT").direction(bx, by)
+
+Cells are (x, y) in the public API; internally a cell is the index
+x * height + y, the same indexing as map.MapTemplate.walkable. The layout of a
+map never changes during a game, so analyze() is done once per layout and
+shared by every bot (and both teams when they play the same layout).
+"""
+
+import heapq
+import time
+import weakref
+from array import array
+from collections import OrderedDict, deque
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from game_constants import FoodType, ShopCosts, Team
+
+Cell = Tuple[int, int]
+
+# king moves, the move() rule
+DIRECTIONS: Tuple[Cell, ...] = tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy)
+
+_DIRECTION_CODE: Dict[Cell, int] = {d: k for k, d in enumerate(DIRECTIONS)}
+AT_GOAL = len(DIRECTIONS)  # step code of cells already within reach
+NO_STEP = 255  # step code of cells that cannot reach the stations
+
+# field name -> tile kinds it leads to; a field per group is built by analyze()
+STATION_GROUPS: Dict[str, Tuple[str, ...]] = {
+    "SHOP": ("SHOP",),
+    "SUBMIT": ("SUBMIT",),
+    "COOKER": ("COOKER",),
+    "COUNTER": ("COUNTER",),
+    "SINK": ("SINK", "SINKTABLE"),
+    "TRASH": ("TRASH",),
+    "BOX": ("BOX",),
+}
+
+INGREDIENT_COST: Dict[str, int] = {f.food_name: f.buy_cost for f in FoodType}
+
+
+class DistanceField:
+    """
+    for every cell, the moves to the nearest cell within reach of one of the
+    stations, the first step of such a path and which station it reaches;
+    walls count, bots don't (the layout is static, bots are not)
+    """
+
+    __slots__ = ("height", "stations", "dist", "step", "nearest_station")
+
+    def __init__(self, info: "MapInfo", stations: List[Cell]):
+        h = info.height
+        n = info.width * h
+        self.height = h
+        self.stations = stations
+        self.dist = array("i", [-1]) * n
+        self.step = bytearray([NO_STEP]) * n
+        self.nearest_station = array("i", [-1]) * n
+        dist, step, nearest = self.dist, self.step, self.nearest_station
+        q = deque()
+        for k, (x, y) in enumerate(stations):
+            for i in info.access(x, y):
+                if dist[i] == -1:
+                    dist[i] = 0
+                    step[i] = AT_GOAL
+                    nearest[i] = k
+                    q.append(i)
+        neighbors = info.neighbors
+        code = _DIRECTION_CODE
+        while q:
+            i = q.popleft()
+            nd = dist[i] + 1
+            for j in neighbors[i]:
+                if dist[j] == -1:
+                    dist[j] = nd
+                    step[j] = code[(i // h - j // h, i % h - j % h)]  # back towards i
+                    nearest[j] = nearest[i]
+                    q.append(j)
+
+    def distance(self, x: int, y: int) -> Optional[int]:
+        """moves until a station is within reach, None when none can be reached"""
+        d = self.dist[x * self.height + y]
+        return None if d < 0 else d
+
+    def direction(self, x: int, y: int) -> Optional[Cell]:
+        """first (dx, dy) of a shortest path, (0, 0) when already within reach, None when unreachable"""
+        c = self.step[x * self.height + y]
+        if c == NO_STEP:
+            return None
+        return (0, 0) if c == AT_GOAL else DIRECTIONS[c]
+
+    def nearest(self, x: int, y: int) -> Optional[Cell]:
+        """the station that distance() and direction() lead to"""
+        k = self.nearest_station[x * self.height + y]
+        return None if k < 0 else self.stations[k]
+
+
+class MapInfo:
+    """static layout of one map: walkability, station positions, the walkable neighbours of every cell and a DistanceField per STATION_GROUPS entry"""
+
+    def __init__(self, width: int, height: int, tile_names: Tuple[str, ...], walkable: bytes):
+        self.width = width
+        self.height = height
+        self.tile_names = tile_names  # tile_names[x * height + y]
+        self.walkable = walkable
+        self.stations: Dict[str, List[Cell]] = {}
+        for i, name in enumerate(tile_names):
+            if name not in ("FLOOR", "WALL"):
+                self.stations.setdefault(name, []).append(divmod(i, height))
+        self.neighbors: List[Tuple[int, ...]] = [
+            tuple(
+                (x + dx) * height + y + dy
+                for dx, dy in DIRECTIONS
+                if 0 <= x + dx < width and 0 <= y + dy < height and walkable[(x + dx) * height + y + dy]
+            )
+            for x in range(width)
+            for y in range(height)
+        ]
+        self._access: Dict[Cell, Tuple[int, ...]] = {}
+        self.fields: Dict[str, DistanceField] = {
+            group: DistanceField(self, self.positions(*kinds)) for group, kinds in STATION_GROUPS.items()
+        }
+
+    def index(self, x: int, y: int) -> int:
+        return x * self.height + y
+
+    def cell(self, i: int) -> Cell:
+        return divmod(i, self.height)
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height and bool(self.walkable[x * self.height + y])
+
+    def positions(self, *tile_names: str) -> List[Cell]:
+        """every cell holding one of these tile kinds, e.g. positions("SINK", "SINKTABLE")"""
+        return [pos for name in tile_names for pos in self.stations.get(name, ())]
+
+    def field(self, group: str) -> DistanceField:
+        """distance field of a STATION_GROUPS entry, e.g. field("SHOP")"""
+        return self.fields[group]
+
+    def access(self, x: int, y: int) -> Tuple[int, ...]:
+        """indices of the walkable cells a bot can interact with (x, y) from (chebyshev distance <= 1)"""
+        cells = self._access.get((x, y))
+        if cells is None:
+            h = self.height
+            cells = self._access[(x, y)] = tuple(
+                (x + dx) * h + y + dy
+                for dx in (-1, 0, 1)
+                for dy in (-1, 0, 1)
+                if 0 <= x + dx < self.width and 0 <= y + dy < h and self.walkable[(x + dx) * h + y + dy]
+            )
+        return cells
+
+    def access_cells(self, targets: Iterable[Cell]) -> Set[Cell]:
+        """walkable cells next to (or on) any of the targets, as a goal for bfs()"""
+        h = self.height
+        return {divmod(i, h) for x, y in targets for i in self.access(x, y)}
+
+
+# (width, height, tile names) -> MapInfo for the most recently used layouts; a
+# game has at most two, so long lived processes (batch, tournament workers)
+# keep a handful instead of one per game
+_BY_LAYOUT: "OrderedDict[tuple, MapInfo]" = OrderedDict()
+_LAYOUTS_KEPT = 8
+# MapTemplate -> MapInfo, a fast path that skips building the layout key; the
+# entry goes away with the template
+_BY_TEMPLATE: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _layout_info(key: tuple, walkable: Callable[[], bytes]) -> MapInfo:
+    info = _BY_LAYOUT.get(key)
+    if info is None:
+        info = _BY_LAYOUT[key] = MapInfo(key[0], key[1], key[2], walkable())
+        if len(_BY_LAYOUT) > _LAYOUTS_KEPT:
+            _BY_LAYOUT.popitem(last=False)
+    else:
+        _BY_LAYOUT.move_to_end(key)
+    return info
+
+
+def analyze(m) -> MapInfo:
+    """static analysis of a Map (a bot's map copy or controller.get_map()), cached per layout"""
+    template = getattr(m, "template", None)
+    if template is not None:
+        info = _BY_TEMPLATE.get(template)
+        if info is None:
+            names = tuple(cls.tile_name for col in template.tile_classes for cls in col)
+            info = _BY_TEMPLATE[template] = _layout_info((m.width, m.height, names), lambda: template.walkable)
+        return info
+    key = (m.width, m.height, tuple(t.tile_name for col in m.tiles for t in col))
+    return _layout_info(key, lambda: bytes(1 if t.is_walkable else 0 for col in m.tiles for t in col))
+
+
+def occupied(controller, map_team: Optional[Team] = None, exclude: Iterable[int] = ()) -> Set[Cell]:
+    """cells holding a bot (either team) on map_team's map (default: our own map)"""
+    map_name = (map_team or controller.get_team()).name
+    skip = set(exclude)
+    cells = set()
+    for team in (controller.get_team(), controller.get_enemy_team()):
+        for bot_id in controller.get_team_bot_ids(team):
+            if bot_id in skip:
+                continue
+            b = controller.get_bot_state(bot_id)
+            if b and b["map_team"] == map_name:
+                cells.add((b["x"], b["y"]))
+    return cells
+
+
+# ----------------------------
+# Pathfinding
+# ----------------------------
+
+
+def _search(
+    info: MapInfo, start: Cell, goal: Union[Set[Cell], Callable[[int, int], bool]], blocked: Iterable[Cell]
+) -> Tuple[Optional[int], Optional[array]]:
+    """BFS from start until a goal cell; (goal index, parent array) or (None, None)"""
+    h = info.height
+    s = start[0] * h + start[1]
+    if callable(goal):
+        is_goal = lambda i: goal(*divmod(i, h))  # noqa: E731
+    else:
+        goal_idx = {x * h + y for x, y in goal}
+        is_goal = goal_idx.__contains__
+    if is_goal(s):
+        return s, None
+    parent = array("i", [-1]) * (info.width * h)
+    parent[s] = s
+    for x, y in blocked:
+        if 0 <= x < info.width and 0 <= y < h and parent[x * h + y] == -1:
+            parent[x * h + y] = -2  # never entered
+    neighbors = info.neighbors
+    q = deque((s,))
+    while q:
+        i = q.popleft()
+        for j in neighbors[i]:
+            if parent[j] == -1:
+                parent[j] = i
+                if is_goal(j):
+                    return j, parent
+                q.append(j)
+    return None, None
+
+
+def bfs(
+    info: MapInfo,
+    start: Cell,
+    goal: Union[Set[Cell], Callable[[int, int], bool]],
+    blocked: Iterable[Cell] = (),
+) -> Optional[List[Cell]]:
+    """
+    shortest king-move path from start to any goal cell (a set of cells or a
+    predicate on x, y) avoiding blocked cells: the steps [(dx, dy), ...], []
+    when start is already a goal, None when no goal is reachable
+    """
+    end, parent = _search(info, start, goal, blocked)
+    if end is None:
+        return None
+    h = info.height
+    steps: List[Cell] = []
+    i = end
+    while parent is not None and parent[i] != i:
+        p = parent[i]
+        steps.append((i // h - p // h, i % h - p % h))
+        i = p
+    steps.reverse()
+    return steps
+
+
+def first_step(
+    info: MapInfo,
+    start: Cell,
+    goal: Union[Set[Cell], Callable[[int, int], bool]],
+    blocked: Iterable[Cell] = (),
+) -> Optional[Cell]:
+    """first step of bfs(), (0, 0) when already at a goal, None when unreachable"""
+    steps = bfs(info, start, goal, blocked)
+    if steps is None:
+        return None
+    return steps[0] if steps else (0, 0)
+
+
+def distances(info: MapInfo, starts: Iterable[Cell], blocked: Iterable[Cell] = ()) -> array:
+    """moves from the nearest start to every cell (-1 when unreachable), index x * height + y"""
+    h = info.height
+    dist = array("i", [-1]) * (info.width * h)
+    for x, y in blocked:
+        if 0 <= x < info.width and 0 <= y < h:
+            dist[x * h + y] = -2
+    q = deque()
+    for x, y in starts:
+        i = x * h + y
+        if dist[i] == -1:
+            dist[i] = 0
+            q.append(i)
+    neighbors = info.neighbors
+    while q:
+        i = q.popleft()
+        nd = dist[i] + 1
+        for j in neighbors[i]:
+            if dist[j] == -1:
+                dist[j] = nd
+                q.append(j)
+    for x, y in blocked:
+        if 0 <= x < info.width and 0 <= y < h and dist[x * h + y] == -2:
+            dist[x * h + y] = -1
+    return dist
+
+
+def find_closest(info: MapInfo, start: Cell, targets: Iterable[Cell], blocked: Iterable[Cell] = ()) -> Optional[Cell]:
+    """
+    the target a bot at start can reach (stand next to) in the fewest moves,
+    walls and blocked cells included; None when none is reachable
+    """
+    targets = list(targets)
+    if not targets:
+        return None
+    dist = distances(info, [start], blocked)
+    best, best_d = None, None
+    for x, y in targets:
+        for i in info.access(x, y):
+            d = dist[i]
+            if d >= 0 and (best_d is None or d < best_d):
+                best, best_d = (x, y), d
+    return best
+
+
+def move_towards(controller, bot_id: int, target: Cell, info: MapInfo, blocked: Optional[Set[Cell]] = None) -> bool:
+    """
+    one step along a shortest path to a cell next to target; True when the bot
+    is already within reach of it (nothing moved), False otherwise
+
+    blocked defaults to the cells of every other bot on the bot's current map
+    """
+    b = controller.get_bot_state(bot_id)
+    if not b:
+        return False
+    bx, by = b["x"], b["y"]
+    if max(abs(bx - target[0]), abs(by - target[1])) <= 1:
+        return True
+    if blocked is None:
+        blocked = occupied(controller, Team[b["map_team"]], exclude=(bot_id,))
+    step = first_step(info, (bx, by), info.access_cells([target]), blocked)
+    if step and step != (0, 0):
+        controller.move(bot_id, step[0], step[1])
+    return False
+
+
+# ----------------------------
+# Cooperative planning
+# ----------------------------
+
+
+class _Reservations:
+    """what the bots planned so far this turn have claimed on one map"""
+
+    __slots__ = ("cells", "moves", "parked", "walls", "waiting")
+
+    def __init__(self):
+        self.cells: Set[Tuple[int, int]] = set()  # (t, cell)
+        self.moves: Set[Tuple[int, int, int]] = set()  # (t, from, to), arriving at t
+        self.parked: Dict[int, int] = {}  # cell -> t from which a bot stays on it
+        self.walls: Set[int] = set()  # enemy bots and teammates that don't move
+        self.waiting: Dict[int, int] = {}  # cell -> teammate not planned yet, there until it moves
+
+    def copy(self) -> "_Reservations":
+        r = _Reservations()
+        r.cells, r.moves, r.parked = set(self.cells), set(self.moves), dict(self.parked)
+        r.walls, r.waiting = set(self.walls), dict(self.waiting)
+        return r
+
+    def free(self, i: int, t: int) -> bool:
+        return (
+            i not in self.walls
+            and (t, i) not in self.cells
+            and self.parked.get(i, t + 1) > t
+            and not (t == 1 and i in self.waiting)
+        )
+
+    def reserve(self, path: List[int], park: bool) -> None:
+        for t, i in enumerate(path):
+            self.cells.add((t, i))
+            if t:
+                self.moves.add((t, path[t - 1], i))
+        if park:
+            self.parked[path[-1]] = len(path) - 1
+
+
+class SpaceTimePlanner:
+    """
+    cooperative pathfinding for all bots of a team (windowed cooperative A*)
+
+    Every turn the bots are planned one after another. Each gets a space-time
+    A* over (cell, turns from now) up to `window` turns ahead that avoids
+    what the bots planned before it reserved: cells at a given turn, head-on
+    swaps and the cells of bots parked at their goal. Then it reserves its
+    own path, so a bot planned later steps aside (or backs out of a corridor)
+    instead of blocking. Plans are redone every turn.
+
+    move_team() plans the bots it is given jointly: it also tries putting each
+    other bot first (for up to order_budget_s) and keeps the order with the
+    lowest total cost, then moves every bot after the teammate whose cell it
+    steps into.
+    move_towards() / make_way() plan one bot at a time in call order and move
+    it right away, so teammates not planned yet hold their cell for this turn.
+
+    Teammates not planned at all last turn, and every enemy bot, are walls.
+    When controller.time_remaining() drops below margin_s the remaining bots
+    take a greedy step down the distance to their target instead.
+
+        self.planner = SpaceTimePlanner(analyze(map_copy))
+        ...
+        arrived = self.planner.move_team(controller, {bot_a: shop, bot_b: submit, bot_c: None})
+        if arrived[bot_a]:                      # within reach and not moving: act now
+            controller.buy(bot_a, FoodType.MEAT, *shop)
+    """
+
+    def __init__(
+        self,
+        info: MapInfo,
+        window: int = 12,
+        margin_s: float = 0.05,
+        order_budget_s: float = 0.02,
+        max_expansions: int = 20000,
+    ):
+        self.info = info
+        self.window = window
+        self.margin_s = margin_s
+        self.order_budget_s = order_budget_s
+        self.max_expansions = max_expansions
+        self.turn: Optional[int] = None
+        self.planned: Set[int] = set()  # bots planned this turn
+        self.planned_last_turn: Set[int] = set()
+        self.positions: Dict[int, Tuple[str, int]] = {}  # bot -> (map team name, cell index)
+        self.tables: Dict[str, _Reservations] = {}  # map team name -> reservations
+        # move_team() order, kept while the targets are so priorities don't
+        # flip from turn to turn and undo each other's plans
+        self.order: List[int] = []
+        self.order_targets: Dict[int, Optional[Cell]] = {}
+        self._heuristics: Dict[Cell, array] = {}
+
+    # ----------------------------
+    # Turn state
+    # ----------------------------
+
+    def _begin_turn(self, controller) -> None:
+        turn = controller.get_turn()
+        if turn == self.turn:
+            return
+        if self.turn is not None:
+            self.planned_last_turn = self.planned
+        self.turn = turn
+        self.planned = set()
+        self.positions = {}
+        self.tables = {}
+        h = self.info.height
+        ours = controller.get_team()
+        for team in (ours, controller.get_enemy_team()):
+            for bot_id in controller.get_team_bot_ids(team):
+                b = controller.get_bot_state(bot_id)
+                if not b:
+                    continue
+                where, i = b["map_team"], b["x"] * h + b["y"]
+                self.positions[bot_id] = (where, i)
+                table = self.tables.get(where)
+                if table is None:
+                    table = self.tables[where] = _Reservations()
+                if team != ours or (self.planned_last_turn and bot_id not in self.planned_last_turn):
+                    table.walls.add(i)
+                else:
+                    table.waiting[i] = bot_id
+
+    def _heuristic(self, target: Cell) -> array:
+        """moves from every cell to within reach of target, walls only"""
+        dist = self._heuristics.get(target)
+        if dist is None:
+            if len(self._heuristics) > 256:
+                self._heuristics.clear()
+            dist = self._heuristics[target] = distances(self.info, self.info.access_cells([target]))
+        return dist
+
+    def _out_of_time(self, controller) -> bool:
+        return controller.time_remaining() < self.margin_s
+
+    # ----------------------------
+    # Search
+    # ----------------------------
+
+    def _search(self, table: _Reservations, start: int, dist: Optional[array]) -> Tuple[List[int], float]:
+        """cells for t = 0, 1, ... of the cheapest path that respects the reservations, and its cost"""
+        W = self.window
+        free, moves = table.free, table.moves
+        neighbors = self.info.neighbors
+
+        def h(i: int) -> int:
+            return 0 if dist is None else dist[i]
+
+        def can_stay(i: int, t: int) -> bool:
+            return all(free(i, tt) for tt in range(t + 1, W + 1))
+
+        parent: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {(start, 0): None}
+        cost = {(start, 0): 0.0}
+        heap = [(float(h(start)), 0, start)]
+        best = (h(start), 0, start)  # closest to the goal seen so far, for when the search is cut off
+        end = None
+        expansions = 0
+        while heap and expansions < self.max_expansions:
+            _, t, i = heapq.heappop(heap)
+            expansions += 1
+            g = cost[(i, t)]
+            hi = h(i)
+            if (hi, -t) < (best[0], -best[1]):
+                best = (hi, t, i)
+            if t == W or (hi == 0 and can_stay(i, t)):
+                end = (i, t)
+                break
+            nt = t + 1
+            # waiting now costs a little more than waiting later, so a bot that
+            # has to get out of the way does it this turn rather than next
+            wait_cost = 1.0 + (W - t) * 1e-3
+            for j in (i,) + neighbors[i]:
+                if not free(j, nt):
+                    continue
+                if j != i and ((nt, j, i) in moves or (dist is not None and dist[j] < 0)):
+                    continue
+                ng = g + (wait_cost if j == i else 1.0)
+                if ng >= cost.get((j, nt), ng + 1):
+                    continue
+                cost[(j, nt)] = ng
+                parent[(j, nt)] = (i, t)
+                heapq.heappush(heap, (ng + h(j), nt, j))
+        if end is None:
+            end = (best[2], best[1])
+        path: List[int] = []
+        node: Optional[Tuple[int, int]] = end
+        while node is not None:
+            path.append(node[0])
+            node = parent[node]
+        path.reverse()
+        return path, cost[end] + h(end[0])
+
+    def _greedy(self, table: _Reservations, start: int, dist: Optional[array]) -> Tuple[List[int], float]:
+        """one step down dist (or staying put) that respects the reservations"""
+        best = None
+        for j in (start,) + self.info.neighbors[start]:
+            if not (table.free(j, 1) or j == start and j in table.waiting):
+                continue
+            if j != start and (1, j, start) in table.moves:
+                continue
+            key = (dist[j] if dist is not None and dist[j] >= 0 else 1 << 30, j != start)
+            if best is None or key < best[0]:
+                best = (key, j)
+        if best is None:
+            return [start], float(self.window)
+        return [start, best[1]], 1.0 + best[0][0]
+
+    def _plan(self, controller, bot_id: int, target: Optional[Cell]) -> Optional[Tuple[int, int, float]]:
+        """plan and reserve this bot's path; (start, next) cell indices and the path cost"""
+        if bot_id not in self.positions or bot_id in self.planned:
+            return None
+        self.planned.add(bot_id)
+        where, start = self.positions[bot_id]
+        table = self.tables[where]
+        table.waiting.pop(start, None)
+        table.walls.discard(start)  # a wall last turn, moving now
+        dist = None if target is None else self._heuristic(target)
+        if dist is not None and dist[start] < 0:
+            dist = None  # target unreachable: just keep out of the way
+        if self._out_of_time(controller):
+            path, cost = self._greedy(table, start, dist)
+            table.reserve(path, park=False)
+        else:
+            path, cost = self._search(table, start, dist)
+            at_goal = dist is None or dist[path[-1]] == 0
+            table.reserve(path, park=at_goal and len(path) <= self.window)
+        return start, (path[1] if len(path) > 1 else start), cost
+
+    def _move(self, controller, bot_id: int, start: int, nxt: int) -> bool:
+        h = self.info.height
+        return controller.move(bot_id, nxt // h - start // h, nxt % h - start % h)
+
+    def _within_reach(self, i: int, target: Cell) -> bool:
+        h = self.info.height
+        return max(abs(i // h - target[0]), abs(i % h - target[1])) <= 1
+
+    # ----------------------------
+    # Bot API
+    # ----------------------------
+
+    def move_towards(self, controller, bot_id: int, target: Cell) -> bool:
+        """
+        like helpers.move_towards, planned cooperatively: True when the bot is
+        within reach of target and stays put this turn (act on it now), False
+        after taking (or waiting for) a step
+        """
+        self._begin_turn(controller)
+        planned = self._plan(controller, bot_id, target)
+        if planned is None:
+            return False
+        start, nxt, _ = planned
+        if nxt != start:
+            self._move(controller, bot_id, start, nxt)
+            return False
+        return self._within_reach(start, target)
+
+    def make_way(self, controller, bot_id: int) -> None:
+        """an idle bot: stays put unless a bot planned before it needs the cell"""
+        self._begin_turn(controller)
+        planned = self._plan(controller, bot_id, None)
+        if planned is not None and planned[1] != planned[0]:
+            self._move(controller, bot_id, planned[0], planned[1])
+
+    def _base_order(self, targets: Dict[int, Optional[Cell]]) -> List[int]:
+        """last turn's order for bots that kept their target, then the rest farthest first, idle bots last"""
+        previous = {b: k for k, b in enumerate(self.order) if self.order_targets.get(b) == targets.get(b)}
+
+        def key(bot_id: int):
+            target = targets[bot_id]
+            if target is None or bot_id not in self.positions:
+                return (2, 0, bot_id)
+            if bot_id in previous:
+                return (0, previous[bot_id], bot_id)
+            return (1, -self._heuristic(target)[self.positions[bot_id][1]], bot_id)
+
+        return sorted(targets, key=key)
+
+    def move_team(self, controller, targets: Dict[int, Optional[Cell]]) -> Dict[int, bool]:
+        """
+        plans the given bots jointly (target None = idle) and moves them;
+        bot -> move_towards() result
+
+        A bot planned early may take the cell of one planned later this same
+        turn: the later one steps out first.
+        """
+        self._begin_turn(controller)
+        for bot_id in targets:
+            if bot_id in self.positions and bot_id not in self.planned:
+                where, i = self.positions[bot_id]
+                self.tables[where].waiting.pop(i, None)
+
+        base = self._base_order(targets)
+        movers = [b for b in base if targets[b] is not None and b in self.positions]
+        candidates = [base] + [[b] + [o for o in base if o != b] for b in movers[1:]]
+        planned_before, tables_before = set(self.planned), self.tables
+        best = None
+        t0 = time.monotonic()
+        for order in candidates:
+            if best is not None and (time.monotonic() - t0 > self.order_budget_s or self._out_of_time(controller)):
+                break
+            self.planned = set(planned_before)
+            self.tables = {where: table.copy() for where, table in tables_before.items()}
+            plans: Dict[int, Tuple[int, int, float]] = {}
+            for bot_id in order:
+                planned = self._plan(controller, bot_id, targets[bot_id])
+                if planned is not None:
+                    plans[bot_id] = planned
+            total = sum(p[2] for p in plans.values())
+            if best is None or total < best[0] - 1e-6:
+                best = (total, order, plans, self.planned, self.tables)
+        _, order, plans, self.planned, self.tables = best
+        self.order, self.order_targets = order, dict(targets)
+
+        pending = {bot_id: p for bot_id, p in plans.items() if p[0] != p[1]}
+        progress = True
+        while pending and progress:  # a cycle of bots stepping into each other's cells never gets moved
+            progress = False
+            taken = {(self.positions[b][0], p[0]) for b, p in pending.items()}
+            for bot_id, (start, nxt, _) in list(pending.items()):
+                where = self.positions[bot_id][0]
+                if (where, nxt) not in taken:
+                    self._move(controller, bot_id, start, nxt)
+                    taken.discard((where, start))
+                    del pending[bot_id]
+                    progress = True
+
+        return {
+            bot_id: bot_id in plans
+            and targets[bot_id] is not None
+            and plans[bot_id][0] == plans[bot_id][1]
+            and self._within_reach(plans[bot_id][0], targets[bot_id])
+            for bot_id in targets
+        }
+
+
+# ----------------------------
+# Orders
+# ----------------------------
+
+
+def ingredient_cost(required: Iterable[str]) -> int:
+    """shop price of an order's ingredients (food names as in get_orders()["required"])"""
+    return sum(INGREDIENT_COST.get(name, 0) for name in required)
+
+
+def order_cost(required: Iterable[str]) -> int:
+    """ingredients plus the plate it is served on"""
+    return ingredient_cost(required) + ShopCosts.PLATE.buy_cost
@@ -0,0 +1,273 @@
+# action_log.py
+"""
+Action-log replays: instead of dumping the state every turn, record the map,
+the game parameters and every state changing RobotController call (with its
+result). resimulate() rebuilds each turn by feeding the calls back through
+GameState/RobotController and checks that every call returns what it returned
+during the real game.
+
+python src/game.py --red bots/goon.py --blue bots/goon.py --map maps/map1.txt --action-log game.actions.json
+python src/action_log.py game.actions.json --replay replay.json
+python src/action_log.py game.actions.json --bench 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from game_constants import Team, FoodType, ShopCosts, WakeEvent
+
+VERSION = 1
+
+ENUMS = {"FoodType": FoodType, "ShopCosts": ShopCosts, "WakeEvent": WakeEvent}
+
+
+class ResimulationError(Exception):
+    pass
+
+
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def encode_arg(v: Any) -> Any:
+    """enums become "FoodType.EGG" strings, tuples lists; everything else is already json"""
+    if isinstance(v, (FoodType, ShopCosts, WakeEvent)):
+        return f"{type(v).__name__}.{v.name}"
+    if isinstance(v, (tuple, list)):
+        return [encode_arg(x) for x in v]
+    return v
+
+
+def decode_arg(v: Any) -> Any:
+    if isinstance(v, list):
+        return tuple(decode_arg(x) for x in v)
+    if isinstance(v, str) and "." in v:
+        enum_name, name = v.split(".", 1)
+        if enum_name in ENUMS:
+            return ENUMS[enum_name][name]
+    return v
+
+
+class ActionLog:
+    """
+    Calls are stored per turn in the order they happened across both teams:
+        turns[t] = [[team, method, args, result], ...]
+    turns[0] holds calls made before the first start_turn().
+    """
+
+    def __init__(
+        self,
+        map_path: str,
+        params: Dict[str, Any],
+        bots: Optional[Dict[str, str]] = None,
+        map_sha256: Optional[str] = None,
+    ):
+        self.map_path = map_path
+        self.map_sha256 = map_sha256 if map_sha256 is not None else file_sha256(map_path)
+        self.params = dict(params)
+        self.bots = dict(bots or {})
+        self.turns: List[List[list]] = [[]]
+        self.money: List[List[int]] = []
+        self.result: Dict[str, Any] = {}
+
+    # ----------------------------
+    # Recording
+    # ----------------------------
+
+    def record(self, turn: int, team: Team, method: str, args: List[Any], result: Any) -> None:
+        while len(self.turns) <= turn:
+            self.turns.append([])
+        self.turns[turn].append([team.name, method, [encode_arg(a) for a in args], result])
+
+    def end_turn(self, game_state) -> None:
+        """money after the turn, used as a cheap divergence check"""
+        while len(self.turns) <= game_state.turn:
+            self.turns.append([])
+        self.money.append(
+            [game_state.get_team_money(Team.RED), game_state.get_team_money(Team.BLUE)]
+        )
+
+    def set_result(self, winner: Optional[Team], game_state) -> None:
+        self.result = {
+            "winner": None if winner is None else winner.name,
+            "turns": game_state.turn,
+            "money": {
+                Team.RED.name: game_state.get_team_money(Team.RED),
+                Team.BLUE.name: game_state.get_team_money(Team.BLUE),
+            },
+        }
+
+    # ----------------------------
+    # (De)serialization
+    # ----------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": VERSION,
+            "map": {"path": self.map_path, "sha256": self.map_sha256},
+            "params": self.params,
+            "bots": self.bots,
+            "turns": self.turns,
+            "money": self.money,
+            "result": self.result,
+        }
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "ActionLog":
+        if d.get("version") != VERSION:
+            raise ResimulationError(f"unsupported action log version {d.get('version')}")
+        log = cls(d["map"]["path"], d["params"], d.get("bots"), map_sha256=d["map"]["sha256"])
+        log.turns = d["turns"]
+        log.money = d.get("money", [])
+        log.result = d.get("result", {})
+        return log
+
+    @classmethod
+    def load(cls, path: str) -> "ActionLog":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+# ----------------------------
+# Re-simulation
+# ----------------------------
+
+def resimulate(
+    log: ActionLog,
+    map_path: Optional[str] = None,
+    check: bool = True,
+    quiet: bool = True,
+) -> Iterator[Any]:
+    """
+    yields the GameState after every recorded turn (the same object, mutated)
+
+    check: raise ResimulationError as soon as a call result or the money diverges
+    quiet: swallow the controller's warning prints
+    """
+    from game import create_game_state
+    from robot_controller import RobotController
+
+    map_path = log.map_path if map_path is None else map_path
+    if check and file_sha256(map_path) != log.map_sha256:
+        raise ResimulationError(f"{map_path} does not match the recorded map hash")
+
+    game_state = create_game_state(map_path)
+    controllers = {
+        team: RobotController(team, game_state) for team in (Team.RED, Team.BLUE)
+    }
+
+    out = io.StringIO() if quiet else None
+
+    def run_calls(turn: int) -> None:
+        with contextlib.redirect_stdout(out) if quiet else contextlib.nullcontext():
+            for team, method, args, expected in log.turns[turn]:
+                rc = controllers[Team[team]]
+                got = getattr(rc, method)(*[decode_arg(a) for a in args])
+                if check and got != expected:
+                    raise ResimulationError(
+                        f"turn {turn}: {team}.{method}{tuple(args)} returned {got!r}, recorded {expected!r}"
+                    )
+        if out is not None:
+            out.seek(0)
+            out.truncate()
+
+    if log.turns:
+        run_calls(0)
+
+    for turn in range(1, len(log.turns)):
+        game_state.start_turn()
+        run_calls(turn)
+
+        if check and turn - 1 < len(log.money):
+            money = [game_state.get_team_money(Team.RED), game_state.get_team_money(Team.BLUE)]
+            if money != log.money[turn - 1]:
+                raise ResimulationError(
+                    f"turn {turn}: money {money} does not match recorded {log.money[turn - 1]}"
+                )
+        yield game_state
+
+
+def main():
+    ap = argparse.ArgumentParser(description="re-simulate a recorded action log")
+    ap.add_argument("log", help="path to an action log written with game.py --action-log")
+    ap.add_argument("--map", default=None, help="override the recorded map path")
+    ap.add_argument("--no-check", action="store_true", help="skip result/money checks")
+    ap.add_argument("--replay", default=None, help="write a replay (json, or binary for .bin)")
+    ap.add_argument("--bench", type=int, default=0, help="time N re-simulations (engine only)")
+    args = ap.parse_args()
+
+    log = ActionLog.load(args.log)
+    check = not args.no_check
+
+    if args.bench > 0:
+        times = []
+        for _ in range(args.bench):
+            t0 = time.perf_counter()
+            turns = sum(1 for _ in resimulate(log, args.map, check=check))
+            times.append(time.perf_counter() - t0)
+        best = min(times)
+        print(f"[BENCH] {turns} turns, best {best:.3f}s ({turns / best:.0f} turns/s) over {len(times)} runs")
+        return
+
+    frames: List[Dict[str, Any]] = []
+    writer = None
+    game_state = None
+    for game_state in resimulate(log, args.map, check=check):
+        if args.replay is None:
+            continue
+        if args.replay.endswith(".bin"):
+            if writer is None:
+                from binary_replay import BinaryReplayWriter
+
+                writer = BinaryReplayWriter(game_state)
+            writer.append()
+        else:
+            frames.append(game_state.to_dict())
+
+    if game_state is None:
+        print("[RESIM] empty log")
+        return
+
+    red = game_state.get_team_money(Team.RED)
+    blue = game_state.get_team_money(Team.BLUE)
+    print(f"[RESIM] {game_state.turn} turns, RED=${red}, BLUE=${blue}")
+    if check and log.result.get("money") not in (None, {Team.RED.name: red, Team.BLUE.name: blue}):
+        raise ResimulationError(f"final money does not match recorded result {log.result['money']}")
+
+    if args.replay is not None:
+        winner = log.result.get("winner")
+        winner = None if winner is None else Team[winner]
+        start = game_state.switch_turn
+        end = game_state.switch_turn + game_state.switch_duration
+        if writer is not None:
+            writer.write(args.replay, winner, start, end)
+        else:
+            payload = {
+                "winner": None if winner is None else winner.name,
+                "turns": len(frames),
+                "switch_turn_start": start,
+                "switch_turn_end": end,
+                "replay": frames,
+            }
+            with open(args.replay, "w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=2)
+        print(f"[REPLAY] wrote {args.replay}")
+
+
+if __name__ == "__main__":
+    main()
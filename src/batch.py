@@ -0,0 +1,162 @@
+# batch.py
+"""
+In-process batch engine: many games in one process, each map loaded once and
+each bot file imported once.
+
+    from batch import GameConfig, run_many
+    results = run_many([GameConfig("bots/goon.py", "bots/goon.py", "maps/map1.txt", seed=s) for s in range(1000)])
+
+Every game still gets fresh BotPlayer instances and a fresh game state built from
+the cached map. Bot MODULES are shared though, so module level globals in a bot
+carry over from one game to the next.
+
+python src/batch.py --red bots/goon.py --blue bots/goon.py --map maps/map1.txt --games 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import hashlib
+import os
+import random
+import time
+import traceback
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from game_constants import Team, GameConstants
+from game_state import GameState
+from compiled_map import CompiledMap, load_compiled_map
+from game import Game, GameLoader, game_state_from_maps, import_bot
+
+
+@dataclass(frozen=True)
+class GameConfig:
+    red: str
+    blue: str
+    map_path: str
+    turns: int = GameConstants.TOTAL_TURNS
+    timeout: float = 0.5
+    seed: Optional[int] = None
+    replay_path: Optional[str] = None
+    trace_path: Optional[str] = None  # jsonl controller call trace, see call_trace.py
+
+
+@dataclass
+class GameResult:
+    config: GameConfig
+    winner: Optional[str] = None  # RED, BLUE or None for a draw / error
+    red_money: int = 0
+    blue_money: int = 0
+    turns: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+class CachingLoader(GameLoader):
+    """loads each compiled map and imports each bot file once, then hands out fresh copies"""
+
+    def __init__(self):
+        self.maps: Dict[str, CompiledMap] = {}
+        self.bot_classes: Dict[str, type] = {}
+
+    def load_game_state(self, map_path: str) -> GameState:
+        key = os.path.abspath(map_path)
+        if key not in self.maps:
+            self.maps[key] = load_compiled_map(map_path)
+        return game_state_from_maps(*self.maps[key].load_two_team_maps_and_orders())
+
+    def load_bot_class(self, bot_path: str):
+        key = os.path.abspath(bot_path)
+        if key not in self.bot_classes:
+            # unique module name so two bots that share a basename don't collide
+            base = os.path.basename(bot_path).rsplit(".", 1)[0]
+            name = f"bot_{base}_{hashlib.sha1(key.encode()).hexdigest()[:8]}"
+            self.bot_classes[key] = import_bot(name, bot_path).BotPlayer
+        return self.bot_classes[key]
+
+
+def run_one(config: GameConfig, loader: GameLoader, quiet: bool = True) -> GameResult:
+    """plays one game; never raises"""
+    res = GameResult(config)
+    out = open(os.devnull, "w") if quiet else None
+    t0 = time.perf_counter()
+    try:
+        if config.seed is not None:
+            random.seed(config.seed)
+        with contextlib.redirect_stdout(out) if quiet else contextlib.nullcontext():
+            g = Game(
+                red_bot_path=config.red,
+                blue_bot_path=config.blue,
+                map_path=config.map_path,
+                replay_path=config.replay_path,
+                trace_path=config.trace_path,
+                turn_limit=config.turns,
+                per_turn_timeout_s=config.timeout,
+                loader=loader,
+            )
+            try:
+                winner = g.run_game()
+            finally:
+                g.close()
+        res.winner = None if winner is None else winner.name
+        res.red_money = g.game_state.get_team_money(Team.RED)
+        res.blue_money = g.game_state.get_team_money(Team.BLUE)
+        res.turns = g.game_state.turn
+    except KeyboardInterrupt:
+        raise
+    except BaseException as e:  # SystemExit from a bot too, as in tournament.play_match
+        res.error = f"{type(e).__name__}: {e}"
+        if not quiet:
+            traceback.print_exc()
+    finally:
+        if out is not None:
+            out.close()
+    res.seconds = time.perf_counter() - t0
+    return res
+
+
+def run_many(
+    configs: Iterable[GameConfig],
+    loader: Optional[CachingLoader] = None,
+    quiet: bool = True,
+) -> List[GameResult]:
+    """plays every config in this process, reusing parsed maps and bot modules"""
+    loader = CachingLoader() if loader is None else loader
+    return [run_one(c, loader, quiet) for c in configs]
+
+
+def main():
+    ap = argparse.ArgumentParser(description="play many games in one process")
+    ap.add_argument("--red", required=True, help="path to red bot python file")
+    ap.add_argument("--blue", required=True, help="path to blue bot python file")
+    ap.add_argument("--map", required=True, help="path to map text file")
+    ap.add_argument("--games", type=int, default=10, help="number of games (seeds 0..N-1)")
+    ap.add_argument("--turns", type=int, default=GameConstants.TOTAL_TURNS, help="turn limit")
+    ap.add_argument("--timeout", type=float, default=0.5, help="per-turn timeout seconds per bot")
+    args = ap.parse_args()
+
+    configs = [
+        GameConfig(args.red, args.blue, args.map, args.turns, args.timeout, seed=i)
+        for i in range(args.games)
+    ]
+    t0 = time.perf_counter()
+    results = run_many(configs)
+    dt = time.perf_counter() - t0
+
+    wins = {Team.RED.name: 0, Team.BLUE.name: 0, None: 0}
+    errors = 0
+    for r in results:
+        if r.error is not None:
+            errors += 1
+            continue
+        wins[r.winner] += 1
+    print(
+        f"[BATCH] {len(results)} games in {dt:.2f}s ({dt / max(len(results), 1) * 1e3:.1f}ms/game): "
+        f"RED {wins['RED']}, BLUE {wins['BLUE']}, draws {wins[None]}, errors {errors}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,507 @@
+# binary_replay.py
+"""
+Compact binary replay format with a turn index.
+
+File layout (little endian):
+
+    header        fixed struct (magic, version, sizes, section offsets, result)
+    layout        width * height tile ids, stored once ([x][y] order like Map.tiles)
+    dyn cells     (x, y) of every tile that carries state (counter, box, sink, ...)
+    bots          (bot_id, team) per bot, static for the whole game
+    orders        static order fields per team (required foods, turns, reward, ...)
+    turn index    one u64 file offset per recorded turn
+    frames        one frame per turn: a fixed width part plus an item blob
+
+A frame holds the fixed width records for money, bots, dynamic tiles for both
+maps and order progress. Items (plates with food, pans, ...) are variable sized,
+so every record references them by offset into the frame's item blob.
+
+ReplayReader mmaps the file and only decodes the frames that are asked for.
+
+python src/binary_replay.py replay.bin --turn 120
+python src/binary_replay.py replay.bin --to-json replay.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import mmap
+import struct
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from game_constants import Team, TileType, FoodType
+from tiles import Counter, Box, Sink, SinkTable, Cooker
+from item import Item, Food, Plate, Pan
+
+MAGIC = b"CCREPLAY"
+VERSION = 1
+
+HEADER = struct.Struct("<8sHHHIHIIIiibQQQQQQ")
+CELL = struct.Struct("<HH")
+BOT_STATIC = struct.Struct("<iB")
+ORDER_STATIC = struct.Struct("<iiiiiB")
+OFFSET = struct.Struct("<Q")
+
+FRAME_HEAD = struct.Struct("<iiiII")
+BOT_REC = struct.Struct("<hhBI")
+CELL_REC = struct.Struct("<IiiB")
+ORDER_REC = struct.Struct("<ii")
+
+ITEM_FOOD = 1
+ITEM_PLATE = 2
+ITEM_PAN = 3
+ITEM_OTHER = 255
+
+TEAMS = (Team.RED, Team.BLUE)
+TILE_BY_ID = {t.tile_id: t for t in TileType}
+FOOD_BY_ID = {f.food_id: f for f in FoodType}
+
+# tiles that show up with state in GameState.to_dict()
+DYNAMIC_TILES = (Counter, Box, Sink, SinkTable, Cooker)
+
+
+class ReplayFormatError(Exception):
+    pass
+
+
+# ----------------------------
+# Item encoding
+# ----------------------------
+
+def _food_bytes(f: Food) -> bytes:
+    flags = (1 if f.chopped else 0) | (int(f.cooked_stage) << 1)
+    return bytes((f.food_id, flags))
+
+
+def _food_from(buf, pos: int) -> Dict[str, Any]:
+    ft = FOOD_BY_ID[buf[pos]]
+    flags = buf[pos + 1]
+    return {
+        "type": "Food",
+        "food_name": ft.food_name,
+        "food_id": ft.food_id,
+        "chopped": bool(flags & 1),
+        "cooked_stage": flags >> 1,
+    }
+
+
+def encode_item(it: Item) -> bytes:
+    """item -> bytes, mirrors GameState.to_dict's item serialization"""
+    if isinstance(it, Food):
+        return bytes((ITEM_FOOD,)) + _food_bytes(it)
+    if isinstance(it, Plate):
+        foods = [f if isinstance(f, Food) else Food(f) for f in it.food]
+        out = bytearray((ITEM_PLATE, 1 if it.dirty else 0, len(foods)))
+        for f in foods:
+            out += _food_bytes(f)
+        return bytes(out)
+    if isinstance(it, Pan):
+        if it.food is None:
+            return bytes((ITEM_PAN, 0))
+        return bytes((ITEM_PAN, 1)) + _food_bytes(it.food)
+    name = type(it).__name__.encode("utf-8")
+    return bytes((ITEM_OTHER, len(name))) + name
+
+
+def decode_item(buf, pos: int) -> Dict[str, Any]:
+    kind = buf[pos]
+    if kind == ITEM_FOOD:
+        return _food_from(buf, pos + 1)
+    if kind == ITEM_PLATE:
+        n = buf[pos + 2]
+        return {
+            "type": "Plate",
+            "dirty": bool(buf[pos + 1]),
+            "food": [_food_from(buf, pos + 3 + 2 * i) for i in range(n)],
+        }
+    if kind == ITEM_PAN:
+        return {"type": "Pan", "food": _food_from(buf, pos + 2) if buf[pos + 1] else None}
+    if kind == ITEM_OTHER:
+        n = buf[pos + 1]
+        return {"type": bytes(buf[pos + 2 : pos + 2 + n]).decode("utf-8")}
+    raise ReplayFormatError(f"unknown item kind {kind} at {pos}")
+
+
+# ----------------------------
+# Writer
+# ----------------------------
+
+class BinaryReplayWriter:
+    """Encodes one frame per recorded turn; static data is captured from the game state once"""
+
+    def __init__(self, game_state):
+        self.gs = game_state
+        m = game_state.red_map
+        self.width = m.width
+        self.height = m.height
+
+        self.layout = bytes(
+            m.tiles[x][y].tile_id for x in range(self.width) for y in range(self.height)
+        )
+        self.cells: List[Tuple[int, int]] = [
+            (x, y)
+            for x in range(self.width)
+            for y in range(self.height)
+            if isinstance(m.tiles[x][y], DYNAMIC_TILES)
+        ]
+        self.bot_ids: List[int] = sorted(game_state.bots.keys())
+        self.frames: List[bytes] = []
+
+    def append(self, game_state=None) -> None:
+        """encode the current turn"""
+        gs = self.gs if game_state is None else game_state
+        blob = bytearray()
+
+        def ref(it: Optional[Item]) -> int:
+            if it is None:
+                return 0
+            pos = len(blob)
+            blob.extend(encode_item(it))
+            return pos + 1
+
+        orders = [gs.orders.get(team, []) for team in TEAMS]
+        out = bytearray(
+            FRAME_HEAD.pack(
+                gs.turn,
+                gs.get_team_money(Team.RED),
+                gs.get_team_money(Team.BLUE),
+                len(orders[0]),
+                len(orders[1]),
+            )
+        )
+
+        for bot_id in self.bot_ids:
+            b = gs.bots[bot_id]
+            out += BOT_REC.pack(b.x, b.y, b.map_team.value, ref(b.holding))
+
+        for team in TEAMS:
+            tiles = gs.get_map(team).tiles
+            for x, y in self.cells:
+                t = tiles[x][y]
+                count = progress = 0
+                if isinstance(t, Box):
+                    count = t.count
+                elif isinstance(t, Sink):
+                    count = t.num_dirty_plates
+                    progress = t.curr_dirty_plate_progress
+                elif isinstance(t, SinkTable):
+                    count = t.num_clean_plates
+                elif isinstance(t, Cooker):
+                    progress = t.cook_progress
+                item = None if isinstance(t, (Sink, SinkTable)) else t.item
+                out += CELL_REC.pack(ref(item), count, progress, 1 if t.using else 0)
+
+        for team_orders in orders:
+            for o in team_orders:
+                out += ORDER_REC.pack(
+                    -1 if o.claimed_by is None else o.claimed_by,
+                    -1 if o.completed_turn is None else o.completed_turn,
+                )
+
+        out += blob
+        self.frames.append(bytes(out))
+
+    def write(
+        self,
+        path: str,
+        winner: Optional[Team],
+        switch_turn_start: int,
+        switch_turn_end: int,
+    ) -> None:
+        """dump header, static sections, turn index and frames"""
+        gs = self.gs
+
+        cells = b"".join(CELL.pack(x, y) for x, y in self.cells)
+        bots = b"".join(
+            BOT_STATIC.pack(bot_id, gs.bots[bot_id].team.value) for bot_id in self.bot_ids
+        )
+
+        # orders are only ever appended, so the final lists cover every frame
+        order_counts = []
+        orders = bytearray()
+        for team in TEAMS:
+            team_orders = gs.orders.get(team, [])
+            order_counts.append(len(team_orders))
+            for o in team_orders:
+                orders += ORDER_STATIC.pack(
+                    o.order_id, o.created_turn, o.expires_turn, o.reward, o.penalty, len(o.required)
+                )
+                orders += bytes(ft.food_id for ft in o.required)
+
+        layout_pos = HEADER.size
+        cells_pos = layout_pos + len(self.layout)
+        bots_pos = cells_pos + len(cells)
+        orders_pos = bots_pos + len(bots)
+        index_pos = orders_pos + len(orders)
+        frames_pos = index_pos + OFFSET.size * len(self.frames)
+
+        index = bytearray()
+        pos = frames_pos
+        for frame in self.frames:
+            index += OFFSET.pack(pos)
+            pos += len(frame)
+
+        header = HEADER.pack(
+            MAGIC,
+            VERSION,
+            self.width,
+            self.height,
+            len(self.cells),
+            len(self.bot_ids),
+            order_counts[0],
+            order_counts[1],
+            len(self.frames),
+            switch_turn_start,
+            switch_turn_end,
+            -1 if winner is None else winner.value,
+            cells_pos,
+            bots_pos,
+            orders_pos,
+            index_pos,
+            frames_pos,
+            pos,
+        )
+
+        with open(path, "wb") as f:
+            f.write(header)
+            f.write(self.layout)
+            f.write(cells)
+            f.write(bots)
+            f.write(orders)
+            f.write(index)
+            for frame in self.frames:
+                f.write(frame)
+
+
+# ----------------------------
+# Reader
+# ----------------------------
+
+class ReplayReader:
+    """
+    mmap backed reader; frame(i) decodes turn i only
+
+        with ReplayReader("replay.bin") as r:
+            r.frame(len(r) - 1)["team_money"]
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = self._mm
+
+        if len(buf) < HEADER.size:
+            raise ReplayFormatError(f"{path}: truncated header")
+        (
+            magic,
+            version,
+            self.width,
+            self.height,
+            n_cells,
+            n_bots,
+            n_red_orders,
+            n_blue_orders,
+            self.num_turns,
+            self.switch_turn_start,
+            self.switch_turn_end,
+            winner,
+            cells_pos,
+            bots_pos,
+            orders_pos,
+            self._index_pos,
+            _frames_pos,
+            end_pos,
+        ) = HEADER.unpack_from(buf, 0)
+
+        if magic != MAGIC:
+            raise ReplayFormatError(f"{path}: not a binary replay")
+        if version != VERSION:
+            raise ReplayFormatError(f"{path}: unsupported version {version}")
+        if len(buf) < end_pos:
+            raise ReplayFormatError(f"{path}: truncated ({len(buf)} < {end_pos} bytes)")
+
+        self.winner: Optional[Team] = None if winner < 0 else Team(winner)
+
+        layout = buf[HEADER.size : cells_pos]
+        h = self.height
+        self.tile_types: List[List[TileType]] = [
+            [TILE_BY_ID[layout[x * h + y]] for y in range(h)] for x in range(self.width)
+        ]
+
+        self.cells: List[Tuple[int, int]] = [
+            CELL.unpack_from(buf, cells_pos + i * CELL.size) for i in range(n_cells)
+        ]
+        self.bots: List[Tuple[int, Team]] = []
+        for i in range(n_bots):
+            bot_id, team = BOT_STATIC.unpack_from(buf, bots_pos + i * BOT_STATIC.size)
+            self.bots.append((bot_id, Team(team)))
+
+        self.orders: Dict[Team, List[Dict[str, Any]]] = {}
+        pos = orders_pos
+        for team, n in zip(TEAMS, (n_red_orders, n_blue_orders)):
+            team_orders = []
+            for _ in range(n):
+                order_id, created, expires, reward, penalty, nreq = ORDER_STATIC.unpack_from(buf, pos)
+                pos += ORDER_STATIC.size
+                required = [FOOD_BY_ID[fid].food_name for fid in buf[pos : pos + nreq]]
+                pos += nreq
+                team_orders.append(
+                    {
+                        "order_id": order_id,
+                        "required": required,
+                        "created_turn": created,
+                        "expires_turn": expires,
+                        "reward": reward,
+                        "penalty": penalty,
+                    }
+                )
+            self.orders[team] = team_orders
+
+        self._bots_off = FRAME_HEAD.size
+        self._cells_off = self._bots_off + n_bots * BOT_REC.size
+        self._orders_off = self._cells_off + 2 * n_cells * CELL_REC.size
+
+    def __enter__(self) -> "ReplayReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._mm.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self.num_turns
+
+    def __getitem__(self, i: int) -> Dict[str, Any]:
+        return self.frame(i)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(self.num_turns):
+            yield self.frame(i)
+
+    def frame_offset(self, i: int) -> int:
+        if i < 0:
+            i += self.num_turns
+        if not 0 <= i < self.num_turns:
+            raise IndexError(f"turn index {i} out of range ({self.num_turns} turns)")
+        return OFFSET.unpack_from(self._mm, self._index_pos + i * OFFSET.size)[0]
+
+    def turn_money(self, i: int) -> Tuple[int, int, int]:
+        """(turn, red money, blue money) without decoding the rest of the frame"""
+        turn, red, blue, _, _ = FRAME_HEAD.unpack_from(self._mm, self.frame_offset(i))
+        return turn, red, blue
+
+    def frame(self, i: int) -> Dict[str, Any]:
+        """decodes turn i into the same dict shape as GameState.to_dict()"""
+        buf = self._mm
+        base = self.frame_offset(i)
+        turn, red_money, blue_money, n_red, n_blue = FRAME_HEAD.unpack_from(buf, base)
+        blob = base + self._orders_off + ORDER_REC.size * (n_red + n_blue)
+
+        def item(ref: int) -> Any:
+            return None if ref == 0 else decode_item(buf, blob + ref - 1)
+
+        bots = []
+        pos = base + self._bots_off
+        for bot_id, team in self.bots:
+            x, y, map_team, ref = BOT_REC.unpack_from(buf, pos)
+            pos += BOT_REC.size
+            bots.append(
+                {
+                    "bot_id": bot_id,
+                    "team": team.name,
+                    "x": x,
+                    "y": y,
+                    "holding": item(ref),
+                    "map_team": Team(map_team).name,
+                }
+            )
+
+        maps = {}
+        pos = base + self._cells_off
+        for team in TEAMS:
+            grid = [
+                [{"tile_name": t.tile_name, "is_walkable": t.is_walkable} for t in col]
+                for col in self.tile_types
+            ]
+            for x, y in self.cells:
+                ref, count, progress, using = CELL_REC.unpack_from(buf, pos)
+                pos += CELL_REC.size
+                d = grid[x][y]
+                tt = self.tile_types[x][y]
+                if tt == TileType.SINK:
+                    d["num_dirty_plates"] = count
+                    d["curr_dirty_plate_progress"] = progress
+                    d["using"] = bool(using)
+                elif tt == TileType.SINKTABLE:
+                    d["num_clean_plates"] = count
+                else:
+                    d["item"] = item(ref)
+                    if tt == TileType.BOX:
+                        d["count"] = count
+                    elif tt == TileType.COOKER:
+                        d["cook_progress"] = progress
+            maps[team] = grid
+
+        orders = {}
+        for team, n in zip(TEAMS, (n_red, n_blue)):
+            team_orders = []
+            for static in self.orders[team][:n]:
+                claimed_by, completed = ORDER_REC.unpack_from(buf, pos)
+                pos += ORDER_REC.size
+                o = dict(static)
+                o["required"] = list(static["required"])
+                o["claimed_by"] = None if claimed_by < 0 else claimed_by
+                o["completed_turn"] = None if completed < 0 else completed
+                team_orders.append(o)
+            orders[team.name] = team_orders
+
+        return {
+            "turn": turn,
+            "team_money": {Team.RED.name: red_money, Team.BLUE.name: blue_money},
+            "bots": bots,
+            "orders": orders,
+            "red_map": maps[Team.RED],
+            "blue_map": maps[Team.BLUE],
+        }
+
+    def to_json_payload(self) -> Dict[str, Any]:
+        """same payload Game.export_replay writes for json replays"""
+        return {
+            "winner": None if self.winner is None else self.winner.name,
+            "turns": self.num_turns,
+            "switch_turn_start": self.switch_turn_start,
+            "switch_turn_end": self.switch_turn_end,
+            "replay": list(self),
+        }
+
+
+def main():
+    ap = argparse.ArgumentParser(description="inspect or convert a binary replay")
+    ap.add_argument("replay", help="path to a binary replay")
+    ap.add_argument("--turn", type=int, default=None, help="print a single turn index as json")
+    ap.add_argument("--to-json", default=None, help="convert the whole replay to a json replay")
+    args = ap.parse_args()
+
+    with ReplayReader(args.replay) as r:
+        if args.turn is not None:
+            print(json.dumps(r.frame(args.turn), indent=2))
+        elif args.to_json is not None:
+            with open(args.to_json, "w", encoding="utf-8") as f:
+                json.dump(r.to_json_payload(), f, indent=2)
+            print(f"[REPLAY] wrote {args.to_json}")
+        else:
+            winner = None if r.winner is None else r.winner.name
+            turn, red, blue = r.turn_money(-1) if len(r) else (0, 0, 0)
+            print(
+                f"{args.replay}: {r.width}x{r.height}, {len(r)} turns, winner={winner}, "
+                f"last turn {turn}: RED=${red} BLUE=${blue}"
+            )
+
+
+if __name__ == "__main__":
+    main()
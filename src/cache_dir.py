@@ -0,0 +1,11 @@
+# cache_dir.py
+"""Where local caches (tournament results, compiled maps, ...) live"""
+
+import os
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def default_cache_dir() -> str:
+    """COOKOFF_CACHE_DIR if set, otherwise .cache/ at the repo root"""
+    return os.environ.get("COOKOFF_CACHE_DIR") or os.path.join(REPO_ROOT, ".cache")
@@ -0,0 +1,128 @@
+# call_trace.py
+"""
+Structured trace of every RobotController call a bot makes, one JSON object
+per line:
+
+    {"turn": 12, "team": "RED", "bot": 0, "method": "move", "args": [1, 0],
+     "result": false, "warnings": ["move() failed: illegal move bot 0 from (6,2) by (1,0)"],
+     "warning_codes": ["move() failed: illegal move bot # from (#,#) by (#,#)"], "us": 14.2}
+
+bot is the bot_id argument (null for calls that don't take one), us is the
+call's wall time in microseconds. warning_codes are the warning messages with
+numbers replaced by #, so the same failure groups together across bots and
+games. Objects that aren't JSON (Map, Tile, ...) are written as "<Map>". The
+first line is {"meta": {...}} describing the game.
+
+The controller only appends a tuple per call (copying mutable args and results,
+so later changes by the bot don't leak into the trace). The game encodes and
+writes them with flush() between turns, once the bot's thread has returned, so
+no encoding competes with a bot for the GIL mid-turn.
+
+python src/game.py --red bots/goon.py --blue bots/ff.py --map maps/map1.txt --trace game.trace.jsonl
+"""
+
+from __future__ import annotations
+
+import enum
+import json
+import re
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+_NUMBER = re.compile(r"-?\d+")
+
+
+def warning_code(msg: str) -> str:
+    return _NUMBER.sub("#", msg)
+
+
+def snapshot(v: Any) -> Any:
+    """copies lists, dicts and sets (nested too); other values are immutable or written as "<Type>" anyway"""
+    if isinstance(v, dict):
+        return {k: snapshot(x) for k, x in v.items()}
+    if isinstance(v, list):
+        return [snapshot(x) for x in v]
+    if isinstance(v, tuple):
+        return tuple(snapshot(x) for x in v)
+    if isinstance(v, set):
+        return set(v)
+    return v
+
+
+def encode_value(v: Any) -> Any:
+    """json default= hook: enums by name, everything else by type"""
+    if isinstance(v, enum.Enum):
+        return f"{type(v).__name__}.{v.name}"
+    return f"<{type(v).__name__}>"
+
+
+class CallTrace:
+    def __init__(self, path: str, meta: Optional[Dict[str, Any]] = None):
+        self.path = path
+        self.pending: deque = deque()  # append/popleft are thread safe (a timed out bot may still append)
+        self.calls = 0
+        self._file = open(path, "w", encoding="utf-8", buffering=1 << 20)
+        self._file.write(json.dumps({"meta": meta or {}}, default=encode_value) + "\n")
+
+    def record(
+        self,
+        turn: int,
+        team_name: str,
+        bot: Optional[int],
+        method: str,
+        args: tuple,
+        kwargs: Dict[str, Any],
+        result: Any,
+        warnings: Optional[List[str]],
+        ns: int,
+    ) -> None:
+        """called by the controller on the bot's thread: copies, no encoding"""
+        self.pending.append(
+            (turn, team_name, bot, method, snapshot(args), snapshot(kwargs), snapshot(result), warnings, ns)
+        )
+
+    # ----------------------------
+    # Writing
+    # ----------------------------
+
+    def _encode(self, rec: tuple) -> str:
+        turn, team_name, bot, method, args, kwargs, result, warnings, ns = rec
+        row = {
+            "turn": turn,
+            "team": team_name,
+            "bot": bot,
+            "method": method,
+            "args": list(args) + ([kwargs] if kwargs else []),
+            "result": result,
+            "warnings": warnings or [],
+            "warning_codes": [warning_code(w) for w in warnings] if warnings else [],
+            "us": round(ns / 1000, 1),
+        }
+        try:
+            return json.dumps(row, default=encode_value)
+        except (TypeError, ValueError):  # e.g. dict keys that aren't strings
+            row["result"] = repr(result)
+            return json.dumps(row, default=encode_value)
+
+    def flush(self) -> None:
+        """encodes and writes everything recorded so far; the game calls it between turns"""
+        if self._file.closed:
+            return
+        pending = self.pending
+        lines = []
+        while pending:
+            lines.append(self._encode(pending.popleft()))
+        if lines:
+            self.calls += len(lines)
+            self._file.write("\n".join(lines) + "\n")
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def close(self) -> None:
+        """writes everything still pending and closes the file"""
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
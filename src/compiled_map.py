@@ -0,0 +1,223 @@
+# compiled_map.py
+"""
+Compiled maps: everything load_map_from_txt works out from a map file (layout,
+spawns, switch window, orders), plus a station index, stored as one pickle of
+plain values in the cache dir.
+
+The artifact is named after a hash of the map file contents (and the order
+defaults and format version), so editing a map simply compiles a new one.
+Loading it is a single read + unpickle; tiles and orders are then built fresh.
+
+python src/compiled_map.py maps/map1.txt            # compile (or reuse) and print a summary
+python src/compiled_map.py maps/*.txt --force       # recompile
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Optional, Tuple
+
+from game_constants import Team, FoodType
+from game_state import Order
+from map import Map, MapTemplate
+from map_processor import CHAR_TO_TILE, ParsedMap, load_map_from_txt
+from cache_dir import default_cache_dir
+
+MAGIC = b"CCMAP"
+VERSION = 2
+
+TILE_CLASS_BY_ID = {cls.tile_id: cls for cls in CHAR_TO_TILE.values()}
+
+
+class CompiledMapError(Exception):
+    pass
+
+
+@dataclass
+class CompiledMap:
+    source_sha256: str
+    width: int
+    height: int
+    layout: bytes  # tile_id per cell, index x * height + y
+    spawns_red: List[Tuple[int, int]]
+    spawns_blue: List[Tuple[int, int]]
+    switch_turn: int
+    switch_duration: int
+    # (order_id, [food names], created_turn, expires_turn, reward, penalty)
+    orders: List[Tuple]
+    # tile_name -> station positions
+    stations: Dict[str, List[Tuple[int, int]]] = field(default_factory=dict)
+    # built on first use, not stored in the artifact
+    _template: Optional[MapTemplate] = field(default=None, init=False, repr=False, compare=False)
+
+    # ----------------------------
+    # Building game objects
+    # ----------------------------
+
+    def template(self) -> MapTemplate:
+        """built once per CompiledMap, shared by every Map it hands out"""
+        t = self._template
+        if t is None:
+            h = self.height
+            layout = self.layout
+            t = MapTemplate(
+                self.width,
+                h,
+                tuple(
+                    tuple(TILE_CLASS_BY_ID[layout[x * h + y]] for y in range(h))
+                    for x in range(self.width)
+                ),
+                stations=self.stations,
+            )
+            self._template = t
+        return t
+
+    def build_map(self, team: Team = Team.RED) -> Map:
+        return self.template().instantiate(team)
+
+    def build_orders(self) -> List[Order]:
+        return [
+            Order(
+                order_id=oid,
+                required=[FoodType[name] for name in required],
+                created_turn=created,
+                expires_turn=expires,
+                reward=reward,
+                penalty=penalty,
+            )
+            for oid, required, created, expires, reward, penalty in self.orders
+        ]
+
+    def load_two_team_maps_and_orders(self):
+        """same shape as map_processor.load_two_team_maps_and_orders"""
+        map_red = self.build_map(Team.RED)
+        map_blue = self.build_map(Team.BLUE)
+        orders_red = self.build_orders()
+        orders_blue = self.build_orders()
+        parsed = ParsedMap(
+            map_obj=map_red,
+            spawns_red=list(self.spawns_red),
+            spawns_blue=list(self.spawns_blue),
+            orders=orders_red,
+            switch_turn=self.switch_turn,
+            switch_duration=self.switch_duration,
+        )
+        return map_red, map_blue, orders_red, orders_blue, parsed
+
+
+# ----------------------------
+# Compiling
+# ----------------------------
+
+def compile_parsed(parsed: ParsedMap, source_sha256: str) -> CompiledMap:
+    m = parsed.map_obj
+    w, h = m.width, m.height
+    layout = bytes(m.tiles[x][y].tile_id for x in range(w) for y in range(h))
+    template = MapTemplate.from_map(m)
+
+    orders = [
+        (o.order_id, [f.name for f in o.required], o.created_turn, o.expires_turn, o.reward, o.penalty)
+        for o in parsed.orders
+    ]
+    return CompiledMap(
+        source_sha256=source_sha256,
+        width=w,
+        height=h,
+        layout=layout,
+        spawns_red=list(parsed.spawns_red),
+        spawns_blue=list(parsed.spawns_blue),
+        switch_turn=parsed.switch_turn,
+        switch_duration=parsed.switch_duration,
+        orders=orders,
+        stations=template.stations,
+    )
+
+
+def compile_map(path: str, default_reward: int = 5, default_penalty: int = 2) -> CompiledMap:
+    with open(path, "rb") as f:
+        sha = hashlib.sha256(f.read()).hexdigest()
+    parsed = load_map_from_txt(path, default_reward=default_reward, default_penalty=default_penalty)
+    return compile_parsed(parsed, sha)
+
+
+# ----------------------------
+# Artifact cache
+# ----------------------------
+
+def artifact_path(path: str, cache_dir: Optional[str] = None, default_reward: int = 5, default_penalty: int = 2) -> str:
+    """cache file for this map's current contents"""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        h.update(f.read())
+    h.update(f"|v{VERSION}|{default_reward}|{default_penalty}".encode())
+    cache_dir = default_cache_dir() if cache_dir is None else cache_dir
+    return os.path.join(cache_dir, "maps", h.hexdigest() + ".cmap")
+
+
+def save_compiled(cm: CompiledMap, path: str) -> None:
+    """atomic, so parallel workers compiling the same map never see a partial file"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(MAGIC + bytes([VERSION]))
+        state = {f.name: getattr(cm, f.name) for f in fields(cm) if f.init}
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+
+def read_compiled(path: str) -> CompiledMap:
+    with open(path, "rb") as f:
+        data = f.read()
+    head = len(MAGIC) + 1
+    if data[: len(MAGIC)] != MAGIC or data[len(MAGIC)] != VERSION:
+        raise CompiledMapError(f"{path}: not a version {VERSION} compiled map")
+    return CompiledMap(**pickle.loads(data[head:]))
+
+
+def load_compiled_map(
+    path: str,
+    cache_dir: Optional[str] = None,
+    default_reward: int = 5,
+    default_penalty: int = 2,
+    force: bool = False,
+) -> CompiledMap:
+    """reads the cached artifact, compiling (and caching) it first if needed"""
+    target = artifact_path(path, cache_dir, default_reward, default_penalty)
+    if not force and os.path.exists(target):
+        try:
+            return read_compiled(target)
+        except (OSError, CompiledMapError, pickle.UnpicklingError, EOFError, TypeError):
+            pass  # unreadable or from another format version: rebuild it
+    cm = compile_map(path, default_reward, default_penalty)
+    try:
+        save_compiled(cm, target)
+    except OSError:
+        pass  # read-only cache dir: still usable, just not cached
+    return cm
+
+
+def main():
+    import argparse
+    import time
+
+    ap = argparse.ArgumentParser(description="compile maps into the map cache")
+    ap.add_argument("maps", nargs="+", help="map text files")
+    ap.add_argument("--force", action="store_true", help="recompile even if cached")
+    args = ap.parse_args()
+
+    for p in args.maps:
+        t0 = time.perf_counter()
+        cm = load_compiled_map(p, force=args.force)
+        dt = time.perf_counter() - t0
+        counts = ", ".join(f"{k}={len(v)}" for k, v in sorted(cm.stations.items()))
+        print(
+            f"[MAP] {p}: {cm.width}x{cm.height}, {len(cm.orders)} orders, {counts} "
+            f"({dt * 1e3:.1f}ms) -> {artifact_path(p)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
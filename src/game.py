@@ -2,30 +2,40 @@
 
 """python src/game.py --red bots/sample_bot.py --blue bots/sample_bot.py --map maps/tiny_map.txt --render"""
 
-import argparse
 import copy
 import importlib.util
-import json
 import os
 import sys
 import time
-import traceback
-from threading import Thread
-from typing import Optional, Any, Dict, List, Tuple
+from threading import Thread, get_ident
+from typing import TYPE_CHECKING, Optional, Any, Dict, List, Tuple
 
 from game_constants import Team, GameConstants
 from game_state import GameState
-from robot_controller import RobotController
+from robot_controller import RobotController, InitPhaseView
 
 from map_processor import load_two_team_maps_and_orders
-
-try:
-    from render import Renderer
-
-    RENDER_AVAILABLE = True
-except ImportError:
-    RENDER_AVAILABLE = False
-    Renderer = None
+from turn_timing import TurnTimings
+from compiled_map import load_compiled_map
+
+# optional subsystems (pygame rendering, replay/log writers, ...) are imported
+# on first use so headless runs and tournament workers start fast
+if TYPE_CHECKING:
+    from action_log import ActionLog
+    from binary_replay import BinaryReplayWriter
+    from call_trace import CallTrace
+    from memory_profile import MemoryProfiler
+    from profiling import TeamProfiler
+    from sampling_profiler import SamplingProfiler
+
+
+def load_renderer():
+    """the Renderer class, or None when pygame is not available"""
+    try:
+        from render import Renderer
+    except ImportError:
+        return None
+    return Renderer
 
 
 def import_file(module_name: str, file_path: str):
@@ -40,6 +50,14 @@ def import_file(module_name: str, file_path: str):
     return module
 
 
+def import_bot(module_name: str, bot_path: str):
+    """import_file for a bot: its directory goes on sys.path so it can import sibling modules (bots/helpers.py)"""
+    bot_dir = os.path.dirname(os.path.abspath(bot_path))
+    if bot_dir not in sys.path:
+        sys.path.append(bot_dir)
+    return import_file(module_name, bot_path)
+
+
 def find_default_floor_spawn(m, prefer_center=True) -> Tuple[int, int]:
     """if map has no red, blue spawn markers, find the centermost walkable spawn"""
     if prefer_center:
@@ -59,6 +77,83 @@ def find_default_floor_spawn(m, prefer_center=True) -> Tuple[int, int]:
     return (0, 0)
 
 
+def create_game_state(map_path: str, use_map_cache: bool = True) -> GameState:
+    """
+    fresh game state for a map: tiles, orders, switch window and spawned bots
+
+    use_map_cache: build from the compiled map artifact (see compiled_map.py)
+    instead of parsing the text
+    """
+    if use_map_cache:
+        return game_state_from_maps(*load_compiled_map(map_path).load_two_team_maps_and_orders())
+    return game_state_from_maps(*load_two_team_maps_and_orders(map_path))
+
+
+def game_state_from_maps(map_red, map_blue, orders_red, orders_blue, parsed) -> GameState:
+    """builds the game state from the output of load_two_team_maps_and_orders"""
+    # create game state
+    game_state = GameState(red_map=map_red, blue_map=map_blue)
+
+    # get midgame switch window from map
+    game_state.switch_turn = getattr(
+        parsed, "switch_turn", GameConstants.MIDGAME_SWITCH_TURN
+    )
+    game_state.switch_duration = getattr(
+        parsed, "switch_duration", GameConstants.MIDGAME_SWITCH_DURATION
+    )
+
+    # load orders into the game state
+    game_state.orders[Team.RED] = orders_red
+    game_state.orders[Team.BLUE] = orders_blue
+
+    # make next_order_id to avoid collisions if spawn_order() is useed later
+    max_id = 0
+    for o in orders_red:
+        max_id = max(max_id, o.order_id)
+    game_state.next_order_id = max_id + 1
+
+    # put the bots in the parsed map
+    if parsed.spawns_red:
+        for x, y in parsed.spawns_red:
+            game_state.add_bot(Team.RED, x, y)
+    else:
+        x, y = find_default_floor_spawn(game_state.red_map)
+        game_state.add_bot(Team.RED, x, y)
+
+    if parsed.spawns_blue:
+        for x, y in parsed.spawns_blue:
+            game_state.add_bot(Team.BLUE, x, y)
+    else:
+        x, y = find_default_floor_spawn(game_state.blue_map)
+        game_state.add_bot(Team.BLUE, x, y)
+
+    return game_state
+
+
+class GameLoader:
+    """
+    where a Game gets its starting state and bot classes from
+
+    the default parses the map and imports the bot files again for every game;
+    batch.CachingLoader reuses both across games
+    """
+
+    def load_game_state(self, map_path: str) -> GameState:
+        return create_game_state(map_path)
+
+    def load_bot_class(self, bot_path: str):
+        name = os.path.basename(bot_path).rsplit(".", 1)[0]
+        return import_bot(name, bot_path).BotPlayer
+
+    def map_for_bot(self, game_state: GameState, team: Team):
+        """the private map copy handed to BotPlayer.__init__"""
+        m = game_state.get_map(team)
+        if m.template is not None and game_state.turn == 0:
+            # nothing has happened yet, so a fresh build equals a deepcopy
+            return m.template.instantiate(team)
+        return copy.deepcopy(m)
+
+
 class Game:
     def __init__(
         self,
@@ -66,103 +161,232 @@ class Game:
         blue_bot_path: str,
         map_path: str,
         replay_path: Optional[str] = None,
+        replay_format: Optional[str] = None,
+        action_log_path: Optional[str] = None,
         render: bool = False,
         turn_limit: int = GameConstants.TOTAL_TURNS,
         per_turn_timeout_s: float = 0.5,
         fps_cap: int = 30,
+        loader: Optional[GameLoader] = None,
+        init_timeout_s: float = 5.0,
+        profile_dir: Optional[str] = None,
+        latency_report_path: Optional[str] = None,
+        warn_fraction: float = 0.8,
+        memprofile_dir: Optional[str] = None,
+        memprofile_every: int = 50,
+        sample_profile_dir: Optional[str] = None,
+        sample_hz: float = 250.0,
+        trace_path: Optional[str] = None,
     ):
         self.render_enabled = render
         self.turn_limit = turn_limit
         self.per_turn_timeout_s = per_turn_timeout_s
+        self.init_timeout_s = init_timeout_s
+
+        # wall + cpu time of every play_turn call
+        self.turn_timings = TurnTimings(per_turn_timeout_s)
+        self.latency_report_path = latency_report_path
+        self.warn_fraction = warn_fraction
         self.fps_cap = fps_cap
 
         self.replay_path = replay_path
         if replay_path is not None:
             os.makedirs(os.path.dirname(replay_path) or ".", exist_ok=True)
 
-        # load the maps
-        map_red, map_blue, orders_red, orders_blue, parsed = (
-            load_two_team_maps_and_orders(map_path)
-        )
+        # json unless asked otherwise or the path ends in .bin
+        if replay_format is None:
+            replay_format = (
+                "bin"
+                if replay_path is not None and replay_path.endswith(".bin")
+                else "json"
+            )
+        if replay_format not in ("json", "bin"):
+            raise ValueError(f"unknown replay format {replay_format!r}")
+        self.replay_format = replay_format
 
-        # create game state
-        self.game_state = GameState(red_map=map_red, blue_map=map_blue)
+        loader = GameLoader() if loader is None else loader
+        self.game_state = loader.load_game_state(map_path)
 
-        # get midgame switch window from map
-        self.game_state.switch_turn = getattr(
-            parsed, "switch_turn", GameConstants.MIDGAME_SWITCH_TURN
-        )
-        self.game_state.switch_duration = getattr(
-            parsed, "switch_duration", GameConstants.MIDGAME_SWITCH_DURATION
-        )
+        # optional per-team cProfile of init phase + play_turn
+        self.profile_dir = profile_dir
+        self.profiler: Optional["TeamProfiler"] = None
+        if profile_dir is not None:
+            from profiling import TeamProfiler
 
-        # load orders into the game state
-        self.game_state.orders[Team.RED] = orders_red
-        self.game_state.orders[Team.BLUE] = orders_blue
+            self.profiler = TeamProfiler(
+                {Team.RED: red_bot_path, Team.BLUE: blue_bot_path}
+            )
 
-        # make next_order_id to avoid collisions if spawn_order() is useed later
-        max_id = 0
-        for o in orders_red:
-            max_id = max(max_id, o.order_id)
-        self.game_state.next_order_id = max_id + 1
+        # optional stack sampling of the bot threads (flamegraph input)
+        self.sample_profile_dir = sample_profile_dir
+        self.sampler: Optional["SamplingProfiler"] = None
+        if sample_profile_dir is not None:
+            from sampling_profiler import SamplingProfiler
 
-        # import bots, need the play turn mechanic
-        self.red_failed_init = False
-        self.blue_failed_init = False
+            self.sampler = SamplingProfiler(sample_hz)
+            self.sampler.start()
 
-        # try to import
-        try:
-            red_name = os.path.basename(red_bot_path).rsplit(".", 1)[0]
-            self.red_player = import_file(red_name, red_bot_path).BotPlayer(
-                copy.deepcopy(self.game_state.red_map)
+        # optional tracemalloc snapshots every memprofile_every turns, started
+        # before the bots are imported so their init allocations are traced too
+        self.memprofile_dir = memprofile_dir
+        self.memprofiler: Optional["MemoryProfiler"] = None
+        if memprofile_dir is not None:
+            from memory_profile import MemoryProfiler
+
+            self.memprofiler = MemoryProfiler(
+                {Team.RED: red_bot_path, Team.BLUE: blue_bot_path}, every=memprofile_every
+            )
+            self.memprofiler.start()
+
+        # optional action log (every state changing controller call + result)
+        self.action_log_path = action_log_path
+        self.action_log: Optional["ActionLog"] = None
+        if action_log_path is not None:
+            from action_log import ActionLog
+
+            os.makedirs(os.path.dirname(action_log_path) or ".", exist_ok=True)
+            self.action_log = ActionLog(
+                map_path,
+                {
+                    "turn_limit": turn_limit,
+                    "per_turn_timeout_s": per_turn_timeout_s,
+                    "init_timeout_s": init_timeout_s,
+                    "switch_turn": self.game_state.switch_turn,
+                    "switch_duration": self.game_state.switch_duration,
+                },
+                bots={Team.RED.name: red_bot_path, Team.BLUE.name: blue_bot_path},
             )
-        except Exception as e:
-            self.red_failed_init = True
-            print(f"[INIT] Red bot failed: {e}")
-            traceback.print_exc()
 
-        try:
-            blue_name = os.path.basename(blue_bot_path).rsplit(".", 1)[0]
-            self.blue_player = import_file(blue_name, blue_bot_path).BotPlayer(
-                copy.deepcopy(self.game_state.blue_map)
+        # optional jsonl trace of every controller call, written between turns
+        self.trace_path = trace_path
+        self.trace: Optional["CallTrace"] = None
+        if trace_path is not None:
+            from call_trace import CallTrace
+
+            os.makedirs(os.path.dirname(trace_path) or ".", exist_ok=True)
+            self.trace = CallTrace(
+                trace_path,
+                meta={
+                    "map": map_path,
+                    "bots": {Team.RED.name: red_bot_path, Team.BLUE.name: blue_bot_path},
+                    "turn_limit": turn_limit,
+                    "per_turn_timeout_s": per_turn_timeout_s,
+                },
             )
-        except Exception as e:
-            self.blue_failed_init = True
-            print(f"[INIT] Blue bot failed: {e}")
-            traceback.print_exc()
 
         # generate the controllers
-        self.red_controller = RobotController(Team.RED, self.game_state)
-        self.blue_controller = RobotController(Team.BLUE, self.game_state)
-
-        # put the bots in the parsed map
-        if parsed.spawns_red:
-            for x, y in parsed.spawns_red:
-                self.game_state.add_bot(Team.RED, x, y)
-        else:
-            x, y = find_default_floor_spawn(self.game_state.red_map)
-            self.game_state.add_bot(Team.RED, x, y)
+        self.red_controller = RobotController(
+            Team.RED, self.game_state, action_log=self.action_log, trace=self.trace
+        )
+        self.blue_controller = RobotController(
+            Team.BLUE, self.game_state, action_log=self.action_log, trace=self.trace
+        )
 
-        if parsed.spawns_blue:
-            for x, y in parsed.spawns_blue:
-                self.game_state.add_bot(Team.BLUE, x, y)
-        else:
-            x, y = find_default_floor_spawn(self.game_state.blue_map)
-            self.game_state.add_bot(Team.BLUE, x, y)
+        # import bots and run their init phase, need the play turn mechanic
+        self.init_seconds: Dict[Team, float] = {}
+        self.red_player, self.red_failed_init = self.init_player(
+            Team.RED, red_bot_path, loader
+        )
+        self.blue_player, self.blue_failed_init = self.init_player(
+            Team.BLUE, blue_bot_path, loader
+        )
+        if self.memprofiler is not None:
+            self.memprofiler.snapshot(self.game_state.turn)
 
         # replay
         self.replay: List[Dict[str, Any]] = []
+        self.replay_writer: Optional["BinaryReplayWriter"] = None
+        if self.replay_path is not None and self.replay_format == "bin":
+            from binary_replay import BinaryReplayWriter
+
+            self.replay_writer = BinaryReplayWriter(self.game_state)
 
         # renderer if available
-        if self.render_enabled and not RENDER_AVAILABLE:
+        Renderer = load_renderer() if self.render_enabled else None
+        if self.render_enabled and Renderer is None:
             print(
                 "[WARNING] Rendering requested but pygame not available, disabling render"
             )
             self.render_enabled = False
         self.renderer = Renderer(self.game_state) if self.render_enabled else None
 
+    def init_player(self, team: Team, bot_path: str, loader: GameLoader):
+        """
+        the timed init phase: importing the bot, BotPlayer(map_copy), then the
+        optional BotPlayer.init_phase(view), where view is a read-only
+        InitPhaseView of this team's controller. All three share init_timeout_s,
+        so a bot that hangs at import times out like any other.
+
+        returns (player, failed)
+        """
+        name = team.name.capitalize()
+        try:
+            map_copy = loader.map_for_bot(self.game_state, team)
+        except Exception as e:
+            print(f"[INIT] {name} bot failed: {e}")
+            import traceback
+
+            traceback.print_exc()
+            return None, True
+
+        controller = (
+            self.red_controller if team == Team.RED else self.blue_controller
+        )
+        player = None
+        exc: Optional[BaseException] = None
+
+        def init():
+            p = loader.load_bot_class(bot_path)(map_copy)
+            init_phase = getattr(p, "init_phase", None)
+            if callable(init_phase):
+                init_phase(InitPhaseView(controller))
+            return p
+
+        def runner():
+            nonlocal player, exc
+            if self.sampler is not None:
+                # from inside the thread, so the first samples of the call aren't missed
+                self.sampler.attach(team, get_ident())
+            try:
+                if self.profiler is not None:
+                    player = self.profiler.runcall(team, init)
+                else:
+                    player = init()
+            except BaseException as e:
+                exc = e
+
+        # time.monotonic is the clock Thread.join's timeout runs on
+        t0 = time.monotonic()
+        self.game_state.turn_deadlines[team] = t0 + self.init_timeout_s
+        th = Thread(target=runner, daemon=True)
+        th.start()
+        th.join(self.init_timeout_s)
+        dt = time.monotonic() - t0
+        if self.sampler is not None:
+            self.sampler.detach(team)
+        self.game_state.turn_deadlines[team] = None
+        self.init_seconds[team] = dt
+        if self.trace is not None:
+            self.trace.flush()
+
+        if th.is_alive():
+            print(
+                f"[INIT] {name} bot timed out ({dt:.3f}s > {self.init_timeout_s:.3f}s)"
+            )
+            return None, True
+        if exc is not None:
+            print(f"[INIT] {name} bot failed: {exc}")
+            import traceback
+
+            traceback.print_exception(type(exc), exc, exc.__traceback__)
+            return None, True
+        print(f"[INIT] {name} bot ready in {dt:.3f}s (budget {self.init_timeout_s:.3f}s)")
+        return player, False
+
     def call_player(self, team: Team) -> bool:
-        """calls the player run code"""
+        """calls the player run code (skipped while the team sleeps)"""
+        if self.game_state.is_asleep(team):
+            return True
         if team == Team.RED:
             if self.red_failed_init:
                 return False
@@ -176,23 +400,43 @@ class Game:
 
         ok = True
         exc: Optional[BaseException] = None
+        cpu: Optional[float] = None
 
         def runner():
-            nonlocal ok, exc
+            nonlocal ok, exc, cpu
+            if self.sampler is not None:
+                self.sampler.attach(team, get_ident())
+            c0 = time.thread_time()
             # try it
             try:
-                player.play_turn(controller)
+                if self.profiler is not None:
+                    self.profiler.runcall(team, player.play_turn, controller)
+                else:
+                    player.play_turn(controller)
             except BaseException as e:
                 ok = False
                 exc = e
+            cpu = time.thread_time() - c0
 
-        t0 = time.time()
+        # time.monotonic is the clock Thread.join's timeout runs on, and the one
+        # RobotController.time_remaining() reads
+        t0 = time.monotonic()
+        self.game_state.turn_deadlines[team] = t0 + self.per_turn_timeout_s
         th = Thread(target=runner, daemon=True)  # run in a separate thread
         th.start()
         th.join(self.per_turn_timeout_s)
-        dt = time.time() - t0
+        dt = time.monotonic() - t0
+        if self.sampler is not None:
+            self.sampler.detach(team)
+        self.game_state.turn_deadlines[team] = None
+        timed_out = th.is_alive()
+        self.turn_timings.record(
+            team, self.game_state.turn, dt, None if timed_out else cpu, timed_out
+        )
+        if self.trace is not None:
+            self.trace.flush()
 
-        if th.is_alive():
+        if timed_out:
             print(
                 f"[TURN RUNNER] {team.name} timed out ({dt:.3f}s > {self.per_turn_timeout_s:.3f}s)"
             )
@@ -201,12 +445,19 @@ class Game:
             print(f"[TURN RUNNER] {team.name} crashed: {exc}")
             print(f"{type(exc).__name__}: {exc}")
             if exc:
+                import traceback
+
                 print("Full traceback:")
                 traceback.print_exception(type(exc), exc, exc.__traceback__)
             return False
         return True
 
     def record_turn(self):
+        if self.replay_path is None:
+            return  # nothing will be written, don't pay for the frames
+        if self.replay_writer is not None:
+            self.replay_writer.append()
+            return
         self.replay.append(self.game_state.to_dict())  # for the replay rile
 
     def render(self) -> bool:
@@ -221,10 +472,12 @@ class Game:
         # needs init
         if self.red_failed_init and self.blue_failed_init:
             print("[GAME] Both bots failed to initialize.")
+            self.export_diagnostics()
             return None
 
         # render init
         if not self.render():
+            self.export_diagnostics()
             return None
 
         for _ in range(self.turn_limit):
@@ -237,6 +490,10 @@ class Game:
 
             # record and render
             self.record_turn()
+            if self.action_log is not None:
+                self.action_log.end_turn(self.game_state)
+            if self.memprofiler is not None:
+                self.memprofiler.maybe_snapshot(self.game_state.turn)
             if not self.render():
                 break
 
@@ -244,16 +501,16 @@ class Game:
             if not blue_ok and red_ok:
                 print("[GAME] BLUE failed, RED wins")
                 winner = Team.RED
-                self.export_replay(winner)
+                self.finish(winner)
                 return winner
             if not red_ok and blue_ok:
                 print("[GAME] RED failed, BLUE wins")
                 winner = Team.BLUE
-                self.export_replay(winner)
+                self.finish(winner)
                 return winner
             if not red_ok and not blue_ok:
                 print("[GAME] Both failed, no winner")
-                self.export_replay(None)
+                self.finish(None)
                 return None
 
         red_money = self.game_state.get_team_money(Team.RED)
@@ -271,13 +528,110 @@ class Game:
             print("[RESULT] DRAW")
             winner = None
 
+        self.finish(winner)
+        return winner
+
+    def finish(self, winner: Optional[Team]):
+        """write whatever outputs were requested"""
         self.export_replay(winner)
-        return None
+        self.export_action_log(winner)
+        self.export_trace()
+        self.export_profile()
+        self.export_sample_profile()
+        self.export_memprofile()
+        self.export_latency_report()
+        self.print_perf_summary()
+
+    def export_diagnostics(self):
+        """profiles and the call trace, for runs that end before any result"""
+        self.export_profile()
+        self.export_sample_profile()
+        self.export_memprofile()
+        self.export_trace()
+
+    def print_perf_summary(self):
+        """controller usage totals per team (RobotController.get_perf_stats)"""
+        for team, controller in (
+            (Team.RED, self.red_controller),
+            (Team.BLUE, self.blue_controller),
+        ):
+            g = controller.get_perf_stats()["game"]
+            if not g["total_calls"]:
+                continue
+            top = ", ".join(f"{k} {v}" for k, v in list(g["calls"].items())[:5])
+            copies = ", ".join(f"{k} {v}" for k, v in g["deepcopies"].items()) or "none"
+            print(
+                f"[PERF] {team.name}: {g['total_calls']} controller calls ({top}), "
+                f"{g['total_deepcopies']} deepcopies ({copies}), {g['warnings']} warnings"
+            )
+
+    def export_latency_report(self):
+        if self.latency_report_path is None:
+            return
+        os.makedirs(os.path.dirname(self.latency_report_path) or ".", exist_ok=True)
+        rep = self.turn_timings.write(self.latency_report_path, self.warn_fraction)
+        for name, t in rep["teams"].items():
+            if not t["turns"]:
+                continue
+            w = t["wall_ms"]
+            print(
+                f"[LATENCY] {name}: p50 {w['p50']:.1f}ms p99 {w['p99']:.1f}ms max {w['max']:.1f}ms, "
+                f"{len(t['near_timeout'])} turns over {self.warn_fraction:.0%} of the timeout, "
+                f"{len(t['timeouts'])} timeouts"
+            )
+        print(f"[LATENCY] wrote {self.latency_report_path}")
+
+    def export_profile(self):
+        if self.profiler is None:
+            return
+        print(self.profiler.write(self.profile_dir))
+        print(f"[PROFILE] wrote {self.profile_dir}/RED.prof, BLUE.prof and summary.txt")
+
+    def export_sample_profile(self):
+        if self.sampler is None:
+            return
+        self.sampler.stop()
+        print(self.sampler.write(self.sample_profile_dir))
+        print(
+            f"[SAMPLES] wrote {self.sample_profile_dir}/RED.collapsed, BLUE.collapsed and summary.txt"
+        )
+
+    def export_memprofile(self):
+        if self.memprofiler is None:
+            return
+        mp = self.memprofiler
+        if not mp.curve or mp.curve[-1][0] != self.game_state.turn:
+            mp.snapshot(self.game_state.turn)  # always end on the final turn
+        mp.stop()
+        print(mp.write(self.memprofile_dir))
+        print(f"[MEMPROFILE] wrote {self.memprofile_dir}/curve.csv and growth.txt")
+
+    def export_trace(self):
+        if self.trace is None or self.trace.closed:
+            return
+        self.trace.close()
+        print(f"[TRACE] wrote {self.trace.calls} controller calls to {self.trace_path}")
+
+    def export_action_log(self, winner: Optional[Team]):
+        if self.action_log is None:
+            return
+        self.action_log.set_result(winner, self.game_state)
+        self.action_log.save(self.action_log_path)
+        print(f"[ACTION LOG] wrote {self.action_log_path}")
 
     def export_replay(self, winner: Optional[Team]):
-        """json dump"""
+        """json dump, or the binary format when replay_format is bin"""
         if self.replay_path is None:
             return
+        if self.replay_writer is not None:
+            self.replay_writer.write(
+                self.replay_path,
+                winner,
+                self.game_state.switch_turn,
+                self.game_state.switch_turn + self.game_state.switch_duration,
+            )
+            print(f"[REPLAY] wrote {self.replay_path}")
+            return
         payload = {
             "winner": None if winner is None else winner.name,
             "turns": len(self.replay),
@@ -286,17 +640,28 @@ class Game:
             + self.game_state.switch_duration,
             "replay": self.replay,
         }
+        import json
+
         with open(self.replay_path, "w", encoding="utf-8") as f:
             json.dump(payload, f, indent=2)
         print(f"[REPLAY] wrote {self.replay_path}")
 
     def close(self):
+        # stop the profilers even when run_game raised before writing them
+        if self.sampler is not None:
+            self.sampler.stop()
+        if self.memprofiler is not None:
+            self.memprofiler.stop()
+        if self.trace is not None:
+            self.trace.close()
         if self.renderer is not None:
             self.renderer.close()
 
 
 def main():
     """parse and run"""
+    import argparse
+
     ap = argparse.ArgumentParser()
     ap.add_argument(
         "--red", required=True, help="path to red bot python file (defines BotPlayer)"
@@ -308,6 +673,23 @@ def main():
         "--map", required=True, help="path to map text file (layout + optional ORDERS:)"
     )
     ap.add_argument("--replay", default=None, help="optional output replay json path")
+    ap.add_argument(
+        "--replay-format",
+        choices=["json", "bin"],
+        default=None,
+        help="replay format (default: bin for .bin paths, json otherwise)",
+    )
+    ap.add_argument(
+        "--action-log",
+        default=None,
+        help="optional output path for the action log (re-simulate with src/action_log.py)",
+    )
+    ap.add_argument(
+        "--trace",
+        default=None,
+        metavar="PATH",
+        help="write every controller call (turn, team, bot, method, args, result, warnings, latency) as jsonl",
+    )
     ap.add_argument("--render", action="store_true", help="enable pygame rendering")
     ap.add_argument(
         "--turns", type=int, default=GameConstants.TOTAL_TURNS, help="turn limit"
@@ -315,6 +697,61 @@ def main():
     ap.add_argument(
         "--timeout", type=float, default=0.5, help="per-turn timeout seconds per bot"
     )
+    ap.add_argument(
+        "--init-timeout",
+        type=float,
+        default=5.0,
+        help="seconds per bot for BotPlayer construction plus init_phase()",
+    )
+    ap.add_argument(
+        "--profile",
+        nargs="?",
+        const="profiles",
+        default=None,
+        metavar="DIR",
+        help="cProfile each team's init phase and play_turn; writes .prof files and summary.txt to DIR (default: profiles)",
+    )
+    ap.add_argument(
+        "--sample-profile",
+        nargs="?",
+        const="samples",
+        default=None,
+        metavar="DIR",
+        help="sample each team's bot thread stack; writes collapsed stacks (flamegraph.pl / speedscope input) and summary.txt to DIR (default: samples)",
+    )
+    ap.add_argument(
+        "--sample-hz",
+        type=float,
+        default=250.0,
+        help="stack samples per second for --sample-profile",
+    )
+    ap.add_argument(
+        "--memprofile",
+        nargs="?",
+        const="memprofile",
+        default=None,
+        metavar="DIR",
+        help="tracemalloc snapshots every --memprofile-every turns; writes curve.csv (RSS, traced memory per engine/bot) and growth.txt (top growing allocation sites) to DIR (default: memprofile)",
+    )
+    ap.add_argument(
+        "--memprofile-every",
+        type=int,
+        default=50,
+        metavar="N",
+        help="turns between memory snapshots",
+    )
+    ap.add_argument(
+        "--latency-report",
+        default=None,
+        metavar="PATH",
+        help="write per-team play_turn wall/cpu percentiles, histogram and near-timeout turns as json",
+    )
+    ap.add_argument(
+        "--warn-fraction",
+        type=float,
+        default=0.8,
+        help="flag turns that use more than this fraction of the per-turn timeout",
+    )
     ap.add_argument("--fps", type=int, default=30, help="fps cap when rendering")
     args = ap.parse_args()
 
@@ -323,9 +760,20 @@ def main():
         blue_bot_path=args.blue,
         map_path=args.map,
         replay_path=args.replay,
+        replay_format=args.replay_format,
+        action_log_path=args.action_log,
+        trace_path=args.trace,
         render=args.render,
         turn_limit=args.turns,
         per_turn_timeout_s=args.timeout,
+        init_timeout_s=args.init_timeout,
+        profile_dir=args.profile,
+        sample_profile_dir=args.sample_profile,
+        sample_hz=args.sample_hz,
+        memprofile_dir=args.memprofile,
+        memprofile_every=args.memprofile_every,
+        latency_report_path=args.latency_report,
+        warn_fraction=args.warn_fraction,
         fps_cap=args.fps,
     )
     try:
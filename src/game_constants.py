@@ -90,6 +90,14 @@ class ShopCosts(Enum):
   PAN = ("PAN", 4)
 
 
+class WakeEvent(Enum):
+  '''ends RobotController.sleep_until / wake_on early'''
+  NEW_ORDER = 0 #an order for your team became active this turn
+  FOOD_COOKED = 1 #food in a pan on your home map just finished cooking (or burnt)
+  SWITCH_WINDOW = 2 #the map switch window opened this turn
+  ENEMY_ON_MAP = 3 #an enemy bot is on your home map
+
+
 class FrozenMeta(type):
   '''cannot edit game constants check'''
   def __setattr__(cls, name, value):
@@ -5,9 +5,9 @@ Game state that keeps track of teams, bots, maps, team money, bot items, and ord
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, FrozenSet, List, Optional, Tuple, Any
 
-from game_constants import Team, TileType, FoodType, GameConstants
+from game_constants import Team, TileType, FoodType, GameConstants, WakeEvent
 from map import Map
 from tiles import Tile, Floor, Wall, Counter, Sink, SinkTable, Cooker, Trash, Submit, Shop, Box
 from item import Item, Food, Plate, Pan
@@ -168,6 +168,12 @@ class GameState:
         self.switch_duration = GameConstants.MIDGAME_SWITCH_DURATION
         self.switched = {Team.RED: False, Team.BLUE: False}
 
+        #sleeping teams: team -> (wake turn or None, wake events), see RobotController.sleep_until
+        self.sleeping: Dict[Team, Tuple[Optional[int], FrozenSet[WakeEvent]]] = {}
+
+        #time.monotonic() deadline of the call the team is in (play_turn / init phase), set by game.py
+        self.turn_deadlines: Dict[Team, Optional[float]] = {Team.RED: None, Team.BLUE: None}
+
         #init map tiles
         normalize_map_tiles(self.red_map)
         normalize_map_tiles(self.blue_map)
@@ -285,35 +291,86 @@ class GameState:
         '''cooking ticks helper that basically cooks if pan is in the food or wash if the dishes are washing'''
         m = self.get_map(team)
 
-        for x in range(m.width):
-            for y in range(m.height):
+        for x, y in self.ticking_cells(m):
 
-                #get the tile
-                tile = m.tiles[x][y]
+            #get the tile
+            tile = m.tiles[x][y]
+
+            #if the tile is a cooker, then we auto cook it through ticking
+            if isinstance(tile, Cooker):
+                pan = tile.item
+                if isinstance(pan, Pan) and isinstance(pan.food, Food):
+                    tile.cook_progress += 1
+                    if tile.cook_progress == GameConstants.COOK_PROGRESS and pan.food.cooked_stage == 0:
+                        pan.food.cooked_stage = 1
+                    elif tile.cook_progress >= GameConstants.BURN_PROGRESS:
+                        pan.food.cooked_stage = 2
 
-                #if the tile is a cooker, then we auto cook it through ticking
-                if isinstance(tile, Cooker):
-                    pan = tile.item
-                    if isinstance(pan, Pan) and isinstance(pan.food, Food):
-                        tile.cook_progress += 1
-                        if tile.cook_progress == GameConstants.COOK_PROGRESS and pan.food.cooked_stage == 0:
-                            pan.food.cooked_stage = 1
-                        elif tile.cook_progress >= GameConstants.BURN_PROGRESS:
-                            pan.food.cooked_stage = 2
+            #if the tile is a sink, then if we are washing, then we clean it
+            if isinstance(tile, Sink):
 
-                #if the tile is a sink, then if we are washing, then we clean it
-                if isinstance(tile, Sink):
+                if tile.using and tile.num_dirty_plates > 0:
+                    tile.curr_dirty_plate_progress += 1
 
-                    if tile.using and tile.num_dirty_plates > 0:
-                        tile.curr_dirty_plate_progress += 1
+                    if tile.curr_dirty_plate_progress >= GameConstants.PLATE_WASH_PROGRESS:
+                        tile.curr_dirty_plate_progress = 0
+                        tile.num_dirty_plates -= 1
+                        self.add_clean_plate_to_sinktable_near(team, x, y)
+
+                # reset the tile each turn so the user needs ot keep washing
+                tile.using = False
+
+    def ticking_cells(self, m: Map) -> List[Tuple[int, int]]:
+        '''cells tick_environment looks at: cookers and sinks from the shared static layer, else everything'''
+        if m.template is None:
+            return [(x, y) for x in range(m.width) for y in range(m.height)]
+        return m.template.positions(TileType.COOKER.tile_name, TileType.SINK.tile_name)
+
+    # -------------
+    # Sleeping
+    # -------------
 
-                        if tile.curr_dirty_plate_progress >= GameConstants.PLATE_WASH_PROGRESS:
-                            tile.curr_dirty_plate_progress = 0
-                            tile.num_dirty_plates -= 1
-                            self.add_clean_plate_to_sinktable_near(team, x, y)
+    def put_to_sleep(self, team: Team, wake_turn: Optional[int], events=()) -> None:
+        '''stop calling the team until wake_turn (None = no time limit) or one of the events'''
+        self.sleeping[team] = (wake_turn, frozenset(events))
 
-                    # reset the tile each turn so the user needs ot keep washing
-                    tile.using = False
+    def is_asleep(self, team: Team) -> bool:
+        '''checked once per turn after start_turn(); wakes the team when its turn or an event comes'''
+        entry = self.sleeping.get(team)
+        if entry is None:
+            return False
+        wake_turn, events = entry
+        if (wake_turn is not None and self.turn >= wake_turn) or any(
+            self.wake_event_happened(team, e) for e in events
+        ):
+            del self.sleeping[team]
+            return False
+        return True
+
+    def wake_event_happened(self, team: Team, event: WakeEvent) -> bool:
+        if event == WakeEvent.NEW_ORDER:
+            return any(o.created_turn == self.turn for o in self.orders.get(team, []))
+
+        if event == WakeEvent.FOOD_COOKED:
+            m = self.get_map(team)
+            if m.template is not None:
+                cells = m.template.stations.get(TileType.COOKER.tile_name, [])
+            else:
+                cells = [(x, y) for x in range(m.width) for y in range(m.height)]
+            for x, y in cells:
+                tile = m.tiles[x][y]
+                if isinstance(tile, Cooker) and isinstance(tile.item, Pan) and isinstance(tile.item.food, Food):
+                    if tile.cook_progress in (GameConstants.COOK_PROGRESS, GameConstants.BURN_PROGRESS):
+                        return True
+            return False
+
+        if event == WakeEvent.SWITCH_WINDOW:
+            return self.turn == self.switch_turn
+
+        if event == WakeEvent.ENEMY_ON_MAP:
+            return any(b.team != team and b.map_team == team for b in self.bots.values())
+
+        return False
 
     def expire_orders(self) -> None:
         '''
@@ -634,6 +691,6 @@ class GameState:
             "team_money": {Team.RED.name: self.get_team_money(Team.RED), Team.BLUE.name: self.get_team_money(Team.BLUE)},
             "bots": bots_payload,
             "orders": orders_payload,
-            "red_map": self.red_map.to_2d_list(),
-            "blue_map": self.blue_map.to_2d_list(),
+            "red_map": self.red_map._replay_2d_list(),
+            "blue_map": self.blue_map._replay_2d_list(),
         }
\ No newline at end of file
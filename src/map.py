@@ -2,7 +2,7 @@
 
 from game_constants import TileType, Team
 from tiles import Tile
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 
 class Map:
@@ -40,6 +40,7 @@ class Map:
         tiles: List[List[Tile]] = None,
         team: Team = Team.RED,
         orders: List = None,
+        template: Optional["MapTemplate"] = None,
     ):
         self.width = width
         self.height = height
@@ -56,6 +57,9 @@ class Map:
         if self.orders is None:
             self.orders = []
 
+        # the layout this map was built from, if any (shared, never mutated)
+        self.template = template
+
     def in_bounds(self, x: int, y: int) -> bool:
         """
         checks if self.tiles[x][y] is in bounds,
@@ -104,3 +108,108 @@ class Map:
         converts the map into a 2D list of tile dictionaries containing full state
         """
         return [[tile.to_dict() for tile in row] for row in self.tiles]
+
+    def _replay_2d_list(self):
+        """
+        to_2d_list for replay frames: stateless tiles (floor, wall, ...) hand
+        out their shared static_dict instead of a copy, so the result is read-only
+        """
+        base = Tile.to_dict
+        return [
+            [tile.static_dict if type(tile).to_dict is base else tile.to_dict() for tile in row]
+            for row in self.tiles
+        ]
+
+
+class MapTemplate:
+    """
+    Immutable static layer of a map: which Tile class sits on every cell, plus
+    what follows from that alone (walkability, station index).
+
+    instantiate() builds a fresh mutable Map (every tile in its initial state)
+    without deepcopying an existing one. Both teams' maps, the bots' copies and
+    any copy of those share one template, so the lookups and precomputations
+    below are done once per layout.
+    """
+
+    __slots__ = ("width", "height", "tile_classes", "_derived", "__weakref__")
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        tile_classes: Tuple[Tuple[type, ...], ...],
+        stations: Optional[Dict[str, List[Tuple[int, int]]]] = None,
+    ):
+        object.__setattr__(self, "width", width)
+        object.__setattr__(self, "height", height)
+        object.__setattr__(self, "tile_classes", tile_classes)  # tile_classes[x][y]
+        # lazily computed, never changes once set
+        derived = {}
+        if stations is not None:
+            derived["stations"] = stations
+        object.__setattr__(self, "_derived", derived)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("MapTemplate is immutable")
+
+    # immutable, so copies of a Map keep sharing the same template
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (MapTemplate, (self.width, self.height, self.tile_classes))
+
+    @classmethod
+    def from_map(cls, m: Map) -> "MapTemplate":
+        """layout of m (tile state such as items is not part of a template)"""
+        if m.template is not None:
+            return m.template
+        return cls(m.width, m.height, tuple(tuple(type(t) for t in col) for col in m.tiles))
+
+    def instantiate(self, team: Team = Team.RED) -> Map:
+        tiles = [[tile_cls() for tile_cls in col] for col in self.tile_classes]
+        return Map(width=self.width, height=self.height, tiles=tiles, team=team, orders=[], template=self)
+
+    # ----------------------------
+    # Shared static lookups
+    # ----------------------------
+
+    def tile_name(self, x: int, y: int) -> str:
+        return self.tile_classes[x][y].tile_name
+
+    @property
+    def walkable(self) -> bytes:
+        """1 per walkable cell, index x * height + y"""
+        w = self._derived.get("walkable")
+        if w is None:
+            w = self._derived["walkable"] = bytes(
+                1 if cls.is_walkable else 0 for col in self.tile_classes for cls in col
+            )
+        return w
+
+    @property
+    def stations(self) -> Dict[str, List[Tuple[int, int]]]:
+        """tile_name -> positions of every non floor/wall tile"""
+        st = self._derived.get("stations")
+        if st is None:
+            st = {}
+            for x, col in enumerate(self.tile_classes):
+                for y, cls in enumerate(col):
+                    if cls.tile_type not in (TileType.FLOOR, TileType.WALL):
+                        st.setdefault(cls.tile_name, []).append((x, y))
+            self._derived["stations"] = st
+        return st
+
+    def positions(self, *tile_names: str) -> List[Tuple[int, int]]:
+        """every cell holding one of these kinds, in scan order (x, then y)"""
+        key = ("positions",) + tile_names
+        cells = self._derived.get(key)
+        if cells is None:
+            cells = self._derived[key] = sorted(
+                pos for name in tile_names for pos in self.stations.get(name, ())
+            )
+        return cells
@@ -7,7 +7,7 @@ from typing import Dict, List, Tuple, Optional
 import copy
 
 from game_constants import Team, FoodType, GameConstants
-from map import Map
+from map import Map, MapTemplate
 from tiles import Tile, Floor, Wall, Counter, Sink, SinkTable, Cooker, Trash, Submit, Shop, Box
 from game_state import Order
 
@@ -88,10 +88,6 @@ def extract_optional_switch_config(lines: List[str]) -> Tuple[List[str], int, in
     return kept, switch_turn, switch_duration
 
 
-def clone_tiles_grid(tiles: List[List[Tile]]) -> List[List[Tile]]:
-    return copy.deepcopy(tiles)
-
-
 def read_nonempty_noncomment_lines(raw_lines: List[str]) -> List[str]:
     '''CSV helper'''
 
@@ -271,14 +267,11 @@ def load_two_team_maps_and_orders(path: str, default_reward: int = 5, default_pe
         default_penalty=default_penalty,
     )
 
+    # nothing has touched the parsed tiles yet, so BLUE can be built from the
+    # layout instead of deepcopying RED's grid
     map_red = parsed.map_obj
-    map_blue = Map(
-        width=map_red.width,
-        height=map_red.height,
-        tiles=clone_tiles_grid(map_red.tiles),
-        team=Team.BLUE,
-        orders=[],
-    )
+    map_red.template = MapTemplate.from_map(map_red)
+    map_blue = map_red.template.instantiate(Team.BLUE)
 
     orders_red = parsed.orders
     orders_blue = copy.deepcopy(parsed.orders)
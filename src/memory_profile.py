@@ -0,0 +1,180 @@
+# memory_profile.py
+"""
+Memory profiling for game.py --memprofile: tracemalloc runs for the whole game
+and a snapshot is taken after the init phase and every N turns.
+
+Each allocation is charged to the most recent frame of its traceback that lies
+in one of the bot files (that bot) or in src/ (engine); anything else (stdlib,
+deepcopy recursion deeper than the NFRAMES traced frames, ...) is "other".
+At the end the output dir gets
+  - curve.csv: per snapshot turn, process RSS, traced bytes, traced peak since
+    the previous snapshot and traced bytes per category
+  - growth.txt: the allocation sites that grew most since the first snapshot,
+    per category
+
+tracemalloc makes allocation heavy code several times slower (goon.py's turns
+take ~20x longer), so raise --timeout while profiling.
+
+python src/game.py --red bots/goon.py --blue bots/ff.py --map maps/map1.txt --memprofile
+python src/game.py ... --memprofile out/mem --memprofile-every 10
+"""
+
+from __future__ import annotations
+
+import os
+import tracemalloc
+from typing import Dict, List, Optional, Tuple
+
+from game_constants import Team
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# frames kept per allocation: enough to get from most library code back to
+# the caller; every extra frame makes each allocation slower
+NFRAMES = 8
+
+ENGINE = "engine"
+OTHER = "other"
+
+
+def rss_bytes() -> Optional[int]:
+    """current resident set size (peak RSS where /proc is not available)"""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+        import sys
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except (ImportError, OSError):
+        return None
+
+
+class MemoryProfiler:
+    def __init__(self, bot_paths: Dict[Team, str], every: int = 50):
+        self.every = max(1, every)
+        # bot file -> category, e.g. "RED bot (goon.py)" or "RED+BLUE bot (goon.py)"
+        teams_by_file: Dict[str, List[str]] = {}
+        for team, p in bot_paths.items():
+            teams_by_file.setdefault(os.path.abspath(p), []).append(team.name)
+        self.bot_files = {
+            f: f"{'+'.join(teams)} bot ({os.path.basename(f)})" for f, teams in teams_by_file.items()
+        }
+        self.categories = list(self.bot_files.values()) + [ENGINE, OTHER]
+        self.first: Optional[tracemalloc.Snapshot] = None
+        self.last: Optional[tracemalloc.Snapshot] = None
+        # (turn, rss, traced, peak, {category: bytes})
+        self.curve: List[Tuple[int, Optional[int], int, int, Dict[str, int]]] = []
+        self._category_cache: Dict[str, Optional[str]] = {}
+
+    def start(self) -> None:
+        tracemalloc.start(NFRAMES)
+
+    def stop(self) -> None:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    # ----------------------------
+    # Snapshots
+    # ----------------------------
+
+    def file_category(self, filename: str) -> Optional[str]:
+        """bot / engine category of one file, None when the caller should look further up"""
+        if filename not in self._category_cache:
+            path = os.path.abspath(filename) if not filename.startswith("<") else filename
+            if path in self.bot_files:
+                cat = self.bot_files[path]
+            elif path.startswith(SRC_DIR + os.sep) and path != os.path.abspath(__file__):
+                cat = ENGINE
+            else:
+                cat = None
+            self._category_cache[filename] = cat
+        return self._category_cache[filename]
+
+    def site(self, traceback: tracemalloc.Traceback) -> Tuple[str, str]:
+        """(category, "file:line") of the most recent bot or engine frame"""
+        for frame in reversed(traceback):  # tracebacks are oldest frame first
+            cat = self.file_category(frame.filename)
+            if cat is not None:
+                return cat, f"{os.path.basename(frame.filename)}:{frame.lineno}"
+        frame = traceback[-1]
+        return OTHER, f"{os.path.basename(frame.filename)}:{frame.lineno}"
+
+    def snapshot(self, turn: int) -> None:
+        snap = tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__),)
+        )
+        by_cat = {c: 0 for c in self.categories}
+        for stat in snap.statistics("traceback"):
+            by_cat[self.site(stat.traceback)[0]] += stat.size
+        traced, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        self.curve.append((turn, rss_bytes(), traced, peak, by_cat))
+        if self.first is None:
+            self.first = snap
+        self.last = snap
+
+    def maybe_snapshot(self, turn: int) -> None:
+        if turn % self.every == 0:
+            self.snapshot(turn)
+
+    # ----------------------------
+    # Reporting
+    # ----------------------------
+
+    def growth(self, n: int = 10) -> Dict[str, List[Tuple[str, int, int]]]:
+        """category -> [(site, bytes grown, allocations grown)] since the first snapshot, largest first"""
+        per_site: Dict[Tuple[str, str], List[int]] = {}
+        if self.first is None or self.last is None or self.first is self.last:
+            return {c: [] for c in self.categories}
+        for d in self.last.compare_to(self.first, "traceback"):
+            key = self.site(d.traceback)
+            acc = per_site.setdefault(key, [0, 0])
+            acc[0] += d.size_diff
+            acc[1] += d.count_diff
+        out: Dict[str, List[Tuple[str, int, int]]] = {c: [] for c in self.categories}
+        for (cat, where), (size, count) in per_site.items():
+            if size > 0:
+                out[cat].append((where, size, count))
+        for rows in out.values():
+            rows.sort(key=lambda r: r[1], reverse=True)
+            del rows[n:]
+        return out
+
+    def summary(self, n: int = 10) -> str:
+        lines: List[str] = []
+        if self.curve:
+            t0, t1 = self.curve[0], self.curve[-1]
+            lines.append(
+                f"=== turns {t0[0]}..{t1[0]}: traced {t0[2] / 2**20:.1f}MB -> {t1[2] / 2**20:.1f}MB "
+                f"(peak {max(c[3] for c in self.curve) / 2**20:.1f}MB), RSS "
+                + (f"{t0[1] / 2**20:.1f}MB -> {t1[1] / 2**20:.1f}MB" if t0[1] and t1[1] else "n/a")
+                + " ==="
+            )
+            for cat in self.categories:
+                a, b = t0[4][cat], t1[4][cat]
+                lines.append(f"{cat:<32} {a / 1024:>10.1f}KB -> {b / 1024:>10.1f}KB ({(b - a) / 1024:+.1f}KB)")
+            lines.append("")
+        for cat, rows in self.growth(n).items():
+            lines.append(f"--- {cat}: top {n} growing allocation sites ---")
+            for where, size, count in rows:
+                lines.append(f"{size / 1024:>10.1f}KB {count:>+9} blocks  {where}")
+            lines.append("")
+        return "\n".join(lines)
+
+    def write(self, out_dir: str) -> str:
+        """curve.csv and growth.txt; returns the summary"""
+        os.makedirs(out_dir, exist_ok=True)
+        with open(os.path.join(out_dir, "curve.csv"), "w", encoding="utf-8") as f:
+            f.write(",".join(["turn", "rss_bytes", "traced_bytes", "traced_peak_bytes"] + self.categories) + "\n")
+            for turn, rss, traced, peak, by_cat in self.curve:
+                row = [turn, "" if rss is None else rss, traced, peak] + [by_cat[c] for c in self.categories]
+                f.write(",".join(str(v) for v in row) + "\n")
+        text = self.summary()
+        with open(os.path.join(out_dir, "growth.txt"), "w", encoding="utf-8") as f:
+            f.write(text)
+        return text
@@ -0,0 +1,85 @@
+# perf_counters.py
+"""
+Per-team counts of how a bot uses the RobotController, per turn and for the
+whole game: API calls by method, deepcopies made for it (get_map, get_tile)
+and warnings issued. Bots read them with controller.get_perf_stats(); the game
+prints the totals at the end.
+
+Counting sits on every controller call, so it is kept to one dict increment;
+per-turn counts are only folded into the game totals when the turn changes.
+"""
+
+from typing import Any, Dict, Optional
+
+
+class TurnCounts:
+    __slots__ = ("calls", "deepcopies", "warnings")
+
+    def __init__(self):
+        self.calls: Dict[str, int] = {}
+        self.deepcopies: Dict[str, int] = {}
+        self.warnings = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.calls or self.deepcopies or self.warnings)
+
+    def merge(self, other: "TurnCounts") -> None:
+        for mine, theirs in ((self.calls, other.calls), (self.deepcopies, other.deepcopies)):
+            for k, n in theirs.items():
+                mine[k] = mine.get(k, 0) + n
+        self.warnings += other.warnings
+
+    def as_dict(self) -> Dict[str, Any]:
+        calls = dict(sorted(self.calls.items(), key=lambda kv: -kv[1]))
+        deepcopies = dict(sorted(self.deepcopies.items(), key=lambda kv: -kv[1]))
+        return {
+            "calls": calls,
+            "total_calls": sum(calls.values()),
+            "deepcopies": deepcopies,
+            "total_deepcopies": sum(deepcopies.values()),
+            "warnings": self.warnings,
+        }
+
+
+class PerfCounters:
+    def __init__(self):
+        self.turn = 0
+        self.current = TurnCounts()
+        self.last_turn: Optional[int] = None
+        self.last = TurnCounts()
+        self.total = TurnCounts()  # every turn before self.turn
+        # > 0 while inside an API call, so the controller's own nested calls don't count
+        self.depth = 0
+
+    def roll(self, turn: int) -> None:
+        """start counting a new turn; the previous one becomes "last" if it had any usage"""
+        if turn != self.turn:
+            if self.current:
+                self.total.merge(self.current)
+                self.last_turn, self.last = self.turn, self.current
+                self.current = TurnCounts()
+            self.turn = turn
+
+    def deepcopy(self, turn: int, name: str) -> None:
+        if turn != self.turn:
+            self.roll(turn)
+        copies = self.current.deepcopies
+        copies[name] = copies.get(name, 0) + 1
+
+    def warning(self, turn: int) -> None:
+        if turn != self.turn:
+            self.roll(turn)
+        self.current.warnings += 1
+
+    def stats(self, turn: int) -> Dict[str, Any]:
+        self.roll(turn)
+        game = TurnCounts()
+        game.merge(self.total)
+        game.merge(self.current)
+        return {
+            "turn": self.turn,
+            "this_turn": self.current.as_dict(),
+            "last_turn": self.last_turn,
+            "last": self.last.as_dict(),
+            "game": game.as_dict(),
+        }
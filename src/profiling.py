@@ -0,0 +1,87 @@
+# profiling.py
+"""
+Per-team cProfile for game.py --profile.
+
+Each team's init phase and play_turn calls run under that team's own profiler
+for the whole game. At the end every team gets a <TEAM>.prof file (open it with
+pstats, snakeviz, ...) and summary.txt lists the top functions by cumulative
+time, split into engine code (src/) and bot code (the bot file's directory).
+
+python src/game.py --red bots/goon.py --blue bots/ff.py --map maps/map1.txt --profile
+python src/game.py ... --profile out/prof
+"""
+
+from __future__ import annotations
+
+import cProfile
+import os
+import pstats
+from typing import Dict, List, Tuple
+
+from game_constants import Team
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# (filename, lineno, funcname) -> (primitive calls, calls, tottime, cumtime, callers)
+StatKey = Tuple[str, int, str]
+
+
+class TeamProfiler:
+    def __init__(self, bot_paths: Dict[Team, str]):
+        self.bot_dirs = {
+            team: os.path.dirname(os.path.abspath(p)) for team, p in bot_paths.items()
+        }
+        self.profiles = {team: cProfile.Profile() for team in bot_paths}
+        self.calls = {team: 0 for team in bot_paths}
+
+    def runcall(self, team: Team, fn, *args, **kwargs):
+        """profiles fn in the calling thread (cProfile is per thread)"""
+        self.calls[team] += 1
+        return self.profiles[team].runcall(fn, *args, **kwargs)
+
+    # ----------------------------
+    # Reporting
+    # ----------------------------
+
+    def classify(self, team: Team, filename: str) -> str:
+        path = os.path.abspath(filename) if not filename.startswith("<") else filename
+        if path.startswith(self.bot_dirs[team] + os.sep):
+            return "bot"
+        if path.startswith(SRC_DIR + os.sep):
+            return "engine"
+        return "other"
+
+    def top(self, team: Team, kind: str, n: int) -> List[Tuple[StatKey, tuple]]:
+        stats = pstats.Stats(self.profiles[team]).stats
+        rows = [(k, v) for k, v in stats.items() if self.classify(team, k[0]) == kind]
+        rows.sort(key=lambda kv: kv[1][3], reverse=True)
+        return rows[:n]
+
+    def summary(self, n: int = 15) -> str:
+        lines: List[str] = []
+        for team, prof in self.profiles.items():
+            stats = pstats.Stats(prof)
+            lines.append(
+                f"=== {team.name}: {stats.total_tt:.3f}s profiled over {self.calls[team]} calls "
+                f"(init phase + play_turn) ==="
+            )
+            for kind in ("bot", "engine"):
+                lines.append(f"--- {kind} code, top {n} by cumulative time ---")
+                lines.append(f"{'ncalls':>10} {'tottime':>9} {'cumtime':>9}  function")
+                for (filename, lineno, func), (cc, nc, tt, ct, _) in self.top(team, kind, n):
+                    ncalls = str(nc) if nc == cc else f"{nc}/{cc}"
+                    lines.append(
+                        f"{ncalls:>10} {tt:>9.3f} {ct:>9.3f}  {os.path.basename(filename)}:{lineno}({func})"
+                    )
+            lines.append("")
+        return "\n".join(lines)
+
+    def write(self, out_dir: str) -> str:
+        """<TEAM>.prof per team plus summary.txt; returns the summary"""
+        os.makedirs(out_dir, exist_ok=True)
+        for team, prof in self.profiles.items():
+            prof.dump_stats(os.path.join(out_dir, f"{team.name}.prof"))
+        text = self.summary()
+        with open(os.path.join(out_dir, "summary.txt"), "w", encoding="utf-8") as f:
+            f.write(text)
+        return text
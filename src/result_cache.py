@@ -0,0 +1,132 @@
+# result_cache.py
+"""
+Content addressed cache of game results.
+
+A result is keyed by hashes of the red bot source, the blue bot source, the map
+file, the engine version (all engine sources in src/) and the game parameters
+(seed, turn limit, timeout). Changing any of them changes the key, so stale
+results are never reused and nothing has to be invalidated by hand.
+"""
+
+from __future__ import annotations
+
+import glob
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+from typing import Any, Dict, Optional
+
+from cache_dir import default_cache_dir
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+IMPORT_RE = re.compile(r"^\s*(?:from\s+([A-Za-z_]\w*)|import\s+([A-Za-z_]\w*))", re.MULTILINE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    red TEXT NOT NULL,
+    blue TEXT NOT NULL,
+    map TEXT NOT NULL,
+    engine TEXT NOT NULL,
+    params TEXT NOT NULL,
+    result TEXT NOT NULL,
+    created REAL NOT NULL
+)
+"""
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path: str) -> str:
+    with open(path, "rb") as f:
+        return _sha256(f.read())
+
+
+def bot_hash(path: str) -> str:
+    """the bot file plus any sibling module it imports (e.g. bots/helpers.py)"""
+    with open(path, "rb") as f:
+        src = f.read()
+    h = hashlib.sha256(src)
+    bot_dir = os.path.dirname(os.path.abspath(path))
+    names = {a or b for a, b in IMPORT_RE.findall(src.decode("utf-8", "replace"))}
+    for name in sorted(names):
+        sibling = os.path.join(bot_dir, name + ".py")
+        if os.path.isfile(sibling) and os.path.abspath(sibling) != os.path.abspath(path):
+            h.update(name.encode())
+            with open(sibling, "rb") as f:
+                h.update(f.read())
+    return h.hexdigest()
+
+
+_engine_version: Optional[str] = None
+
+
+def engine_version() -> str:
+    """hash over every engine source file; any engine edit invalidates cached results"""
+    global _engine_version
+    if _engine_version is None:
+        h = hashlib.sha256()
+        for p in sorted(glob.glob(os.path.join(SRC_DIR, "*.py"))):
+            h.update(os.path.basename(p).encode())
+            with open(p, "rb") as f:
+                h.update(f.read())
+        _engine_version = h.hexdigest()
+    return _engine_version
+
+
+def result_key(red_path: str, blue_path: str, map_path: str, params: Dict[str, Any]) -> Dict[str, str]:
+    """component hashes plus the combined cache key"""
+    parts = {
+        "red": bot_hash(red_path),
+        "blue": bot_hash(blue_path),
+        "map": file_hash(map_path),
+        "engine": engine_version(),
+        "params": json.dumps(params, sort_keys=True),
+    }
+    parts["key"] = _sha256(json.dumps(parts, sort_keys=True).encode())
+    return parts
+
+
+class ResultCache:
+    """sqlite backed; only used from the parent process"""
+
+    def __init__(self, path: Optional[str] = None):
+        if path is None:
+            path = os.path.join(default_cache_dir(), "results.sqlite")
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(SCHEMA)
+        self.conn.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute("SELECT result FROM results WHERE key = ?", (key,)).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def put(self, parts: Dict[str, str], result: Dict[str, Any]) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                parts["key"],
+                parts["red"],
+                parts["blue"],
+                parts["map"],
+                parts["engine"],
+                parts["params"],
+                json.dumps(result),
+                time.time(),
+            ),
+        )
+        self.conn.commit()
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self) -> None:
+        self.conn.close()
@@ -12,15 +12,20 @@ Rules enforced here:
 from __future__ import annotations
 
 import copy
+import functools
+import inspect
+import time
 from collections import deque
+from types import FunctionType
 from typing import Any, Dict, List, Optional, Tuple
 
-from game_constants import Team, FoodType, ShopCosts, GameConstants
+from game_constants import Team, FoodType, ShopCosts, GameConstants, WakeEvent
 from map import Map
 from tiles import Tile, Counter, Sink, SinkTable, Cooker, Trash, Submit, Shop, Box
 from item import Item, Food, Plate, Pan
 
 from game_state import GameState
+from perf_counters import PerfCounters
 
 from typing import Union
 
@@ -30,14 +35,108 @@ Buyable = Union[FoodType, ShopCosts]
 class RobotController:
     """Class where robots can call the specified PUBLIC actions to alter game state"""
 
-    def __init__(self, team: Team, game_state: GameState):
+    def __init__(self, team: Team, game_state: GameState, action_log=None, trace=None):
         self.__team = team
         self.__game_state = game_state
+        self.__action_log = action_log  # optional action_log.ActionLog
+        self.__perf = PerfCounters()
+        self.__trace = trace  # optional call_trace.CallTrace
+        self.__trace_warnings: Optional[List[str]] = None  # warnings of the call being traced
 
         self.__last_seen_turn: int = game_state.turn  # curr turn
         self.__moves_left: Dict[int, int] = {}
         self.__actions_left: Dict[int, int] = {}
+        self.__perf.depth += 1  # engine setup, not bot usage
         self.__refresh_turn_budgets()
+        self.__perf.depth -= 1
+
+    # ----------------------------
+    # Action logging
+    # ----------------------------
+
+    def _recorded(fn):
+        """decorator for state changing calls: records (args, result) when an action log is attached"""
+        name = fn.__name__
+        sig = None
+
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            nonlocal sig
+            result = fn(self, *args, **kwargs)
+            log = self.__action_log
+            if log is not None:
+                if sig is None:
+                    sig = inspect.signature(fn)
+                bound = sig.bind(self, *args, **kwargs)
+                bound.apply_defaults()
+                call_args = []
+                for pname, value in list(bound.arguments.items())[1:]:
+                    if sig.parameters[pname].kind is inspect.Parameter.VAR_POSITIONAL:
+                        call_args.extend(value)  # wake_on(*events): replayed as separate args
+                    else:
+                        call_args.append(value)
+                log.record(self.__game_state.turn, self.__team, name, call_args, result)
+            return result
+
+        wrapper.mutates_state = True
+        return wrapper
+
+    # ----------------------------
+    # Perf counters
+    # ----------------------------
+
+    @staticmethod
+    def _counted(name, fn):
+        """
+        wraps every public method (see below the class): counts the call, not
+        nested ones, and traces it when a CallTrace is attached
+        """
+        code = getattr(fn, "__wrapped__", fn).__code__  # past _recorded
+        takes_bot = code.co_varnames[1:2] == ("bot_id",)
+
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            perf = self.__perf
+            if perf.depth:
+                return fn(self, *args, **kwargs)
+            # counted inline rather than through PerfCounters: this runs on every API call
+            turn = self.__game_state.turn
+            if turn != perf.turn:
+                perf.roll(turn)
+            calls = perf.current.calls
+            calls[name] = calls.get(name, 0) + 1
+            perf.depth = 1
+            try:
+                if self.__trace is not None:
+                    return self.__traced_call(name, fn, takes_bot, args, kwargs)
+                return fn(self, *args, **kwargs)
+            finally:
+                perf.depth = 0
+
+        return wrapper
+
+    def __traced_call(self, name: str, fn, takes_bot: bool, args: tuple, kwargs: Dict[str, Any]):
+        bot = (args[0] if args else kwargs.get("bot_id")) if takes_bot else None
+        self.__trace_warnings = warnings = []
+        result = None
+        t0 = time.perf_counter_ns()
+        try:
+            result = fn(self, *args, **kwargs)
+            return result
+        finally:
+            ns = time.perf_counter_ns() - t0
+            self.__trace_warnings = None
+            self.__trace.record(
+                self.__game_state.turn, self.__team.name, bot, name, args, kwargs, result, warnings, ns
+            )
+
+    def get_perf_stats(self) -> Dict[str, Any]:
+        """
+        how this team has used the controller: API calls by method, deepcopies
+        made (get_map, get_tile) and warnings, for this turn so far, the last
+        turn with any usage and the whole game
+        """
+        return self.__perf.stats(self.__game_state.turn)
 
     # ----------------------------
     # Turn helpers
@@ -86,11 +185,26 @@ class RobotController:
     def get_team(self) -> Team:
         return self.__team
 
+    def get_turn_deadline(self) -> Optional[float]:
+        """
+        time.monotonic() value at which the current play_turn (or init phase)
+        times out; None outside a timed call
+        """
+        return self.__game_state.turn_deadlines.get(self.__team)
+
+    def time_remaining(self) -> float:
+        """seconds left before the engine's timeout (inf outside a timed call)"""
+        deadline = self.__game_state.turn_deadlines.get(self.__team)
+        if deadline is None:
+            return float("inf")
+        return deadline - time.monotonic()
+
     def get_enemy_team(self) -> Team:
         return Team.RED if self.__team == Team.BLUE else Team.BLUE
 
     def get_map(self, team: Team) -> Map:
         """Deep copy for the user"""
+        self.__perf.deepcopy(self.__game_state.turn, "get_map")
         return copy.deepcopy(self.__game_state.get_map(team))
 
     def get_orders(self, team: Team) -> List[Dict[str, Any]]:
@@ -147,6 +261,7 @@ class RobotController:
         """Get the tile at a specific x, y"""
         try:
             t = self.__game_state.get_tile(team, x, y)
+            self.__perf.deepcopy(self.__game_state.turn, "get_tile")
             return copy.deepcopy(t)
 
         except Exception:
@@ -205,6 +320,7 @@ class RobotController:
         # returns the private internal checker after main checks for modularity
         return self.__can_move_internal(b.map_team, b.x, b.y, dx, dy)
 
+    @_recorded
     def move(self, bot_id: int, dx: int, dy: int) -> bool:
         """actually moves, True if move succeeds; False otherwise"""
         b = self.__safe_get_bot(bot_id)
@@ -239,6 +355,7 @@ class RobotController:
     # botwise inventory interactions
     # ----------------------------
 
+    @_recorded
     def pickup(
         self,
         bot_id: int,
@@ -294,6 +411,7 @@ class RobotController:
 
         return True
 
+    @_recorded
     def place(
         self,
         bot_id: int,
@@ -433,6 +551,7 @@ class RobotController:
         b.holding = None
         return True
 
+    @_recorded
     def trash(
         self,
         bot_id: int,
@@ -541,6 +660,7 @@ class RobotController:
         cost = self.__buyable_cost(item)
         return self.__game_state.get_team_money(self.__team) >= cost
 
+    @_recorded
     def buy(
         self,
         bot_id: int,
@@ -601,6 +721,7 @@ class RobotController:
     # Food processing
     # ----------------------------
 
+    @_recorded
     def chop(
         self,
         bot_id: int,
@@ -672,6 +793,7 @@ class RobotController:
 
         return isinstance(b.holding, Food) and b.holding.can_cook
 
+    @_recorded
     def start_cook(
         self,
         bot_id: int,
@@ -726,6 +848,7 @@ class RobotController:
 
         return True
 
+    @_recorded
     def take_from_pan(
         self,
         bot_id: int,
@@ -771,6 +894,7 @@ class RobotController:
     # Plates and sink helpers
     # ----------------------------
 
+    @_recorded
     def take_clean_plate(
         self,
         bot_id: int,
@@ -812,6 +936,7 @@ class RobotController:
         b.holding = Plate(food=[], dirty=False)
         return True
 
+    @_recorded
     def put_dirty_plate_in_sink(
         self,
         bot_id: int,
@@ -849,6 +974,7 @@ class RobotController:
         b.holding = None
         return True
 
+    @_recorded
     def wash_sink(
         self,
         bot_id: int,
@@ -881,6 +1007,7 @@ class RobotController:
         tile.using = True
         return True
 
+    @_recorded
     def add_food_to_plate(
         self,
         bot_id: int,
@@ -960,6 +1087,7 @@ class RobotController:
         _, _, tile = tgt
         return isinstance(tile, Submit)
 
+    @_recorded
     def submit(
         self,
         bot_id: int,
@@ -1022,6 +1150,7 @@ class RobotController:
         info = self.get_switch_info()
         return bool(info["window_active"]) and (not info["my_team_switched"])
 
+    @_recorded
     def switch_maps(self) -> bool:
         """
         if this is called during the switch window, it tps all the bots
@@ -1090,6 +1219,10 @@ class RobotController:
         """warn string with traceback"""
         import traceback
 
+        self.__perf.warning(self.__game_state.turn)
+        if self.__trace_warnings is not None:
+            self.__trace_warnings.append(msg)
+
         stack = traceback.extract_stack()[:-1]  # Exclude this __warn call itself
         # Find the first frame outside robot_controller.py
         bot_frame = None
@@ -1136,6 +1269,49 @@ class RobotController:
         else:
             cooker.cook_progress = GameConstants.BURN_PROGRESS
 
+    # ----------------------------
+    # Sleeping
+    # ----------------------------
+
+    @_recorded
+    def sleep_until(self, turn: int, wake_on: Tuple[WakeEvent, ...] = ()) -> bool:
+        """
+        play_turn is not called again until `turn`, or earlier if one of the
+        wake_on events happens (a single WakeEvent works too). Passive income,
+        cooking and order expiry carry on as normal; the game fast-forwards
+        while both teams sleep.
+        """
+        if not isinstance(turn, int):
+            self.__warn(f"sleep_until() failed: turn {turn!r} is not an int")
+            return False
+        if turn <= self.__game_state.turn:
+            self.__warn(f"sleep_until() failed: turn {turn} is not in the future")
+            return False
+        if isinstance(wake_on, WakeEvent):
+            wake_on = (wake_on,)
+        return self.__sleep(turn, wake_on)
+
+    @_recorded
+    def wake_on(self, *events: WakeEvent) -> bool:
+        """sleep until one of the events happens (no time limit)"""
+        if not events:
+            self.__warn("wake_on() failed: no events given")
+            return False
+        return self.__sleep(None, events)
+
+    def __sleep(self, turn: Optional[int], events) -> bool:
+        try:
+            events = tuple(events)
+        except TypeError:
+            self.__warn(f"sleep failed: {events!r} is not a WakeEvent or a tuple of them")
+            return False
+        for e in events:
+            if not isinstance(e, WakeEvent):
+                self.__warn(f"sleep failed: {e!r} is not a WakeEvent")
+                return False
+        self.__game_state.put_to_sleep(self.__team, turn, events)
+        return True
+
     def item_to_public_dict(self, it: Optional[Item]) -> Any:
         """basically condensces info for user"""
         if it is None:
@@ -1167,3 +1343,27 @@ class RobotController:
             return {"type": "Pan", "food": self.item_to_public_dict(it.food)}
 
         return {"type": type(it).__name__}
+
+
+# count calls to every public controller method
+for _name, _fn in list(vars(RobotController).items()):
+    if not _name.startswith("_") and isinstance(_fn, FunctionType) and _name != "get_perf_stats":
+        setattr(RobotController, _name, RobotController._counted(_name, _fn))
+del _name, _fn
+
+
+class InitPhaseView:
+    """
+    Read-only stand-in for a RobotController during the init phase: queries
+    (get_*, can_*, ...) answer from the starting state, state changing calls
+    raise AttributeError.
+    """
+
+    def __init__(self, controller: RobotController):
+        self.__controller = controller
+
+    def __getattr__(self, name: str):
+        attr = getattr(RobotController, name, None)
+        if name.startswith("_") or attr is None or getattr(attr, "mutates_state", False):
+            raise AttributeError(f"{name} is not available during the init phase")
+        return getattr(self.__controller, name)
@@ -0,0 +1,131 @@
+# sampling_profiler.py
+"""
+Sampling profiler for game.py --sample-profile: a background thread wakes up
+--sample-hz times a second and records the Python stack of whichever bot
+thread is running (init phase or play_turn). Nothing is hooked into the bot's
+own calls, unlike cProfile (--profile), so timing stays close to a normal game.
+
+Output per team is collapsed-stack text, one "root;...;leaf count" line per
+distinct stack, which flamegraph.pl, speedscope, inferno etc. render directly:
+
+python src/game.py --red bots/goon.py --blue bots/ff.py --map maps/map1.txt --sample-profile
+flamegraph.pl samples/RED.collapsed > red.svg
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from game_constants import Team
+
+THREADING_FILE = threading.__file__
+
+
+class SamplingProfiler:
+    def __init__(self, hz: float = 250.0):
+        self.interval = 1.0 / hz
+        # team -> ident of the thread currently running its bot
+        self.active: Dict[Team, int] = {}
+        self.stacks: Dict[Team, Dict[str, int]] = {Team.RED: {}, Team.BLUE: {}}
+        self.samples: Dict[Team, int] = {Team.RED: 0, Team.BLUE: 0}
+        self.ticks = 0
+        self._labels: Dict[object, Optional[str]] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def attach(self, team: Team, ident: Optional[int]) -> None:
+        """sample this thread for team until detach(team)"""
+        if ident is not None:
+            self.active[team] = ident
+
+    def detach(self, team: Team) -> None:
+        self.active.pop(team, None)
+
+    # ----------------------------
+    # Sampling
+    # ----------------------------
+
+    def label(self, code) -> Optional[str]:
+        """flamegraph frame name, None for threading internals"""
+        name = self._labels.get(code, False)
+        if name is False:
+            if code.co_filename == THREADING_FILE:
+                name = None
+            else:
+                name = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            self._labels[code] = name
+        return name
+
+    def _run(self) -> None:
+        wait = self._stop.wait
+        while not wait(self.interval):  # sleeps without holding the GIL
+            self.ticks += 1
+            if not self.active:
+                continue
+            frames = sys._current_frames()
+            for team, ident in list(self.active.items()):
+                f = frames.get(ident)
+                if f is None:
+                    continue
+                stack: List[str] = []
+                while f is not None:
+                    name = self.label(f.f_code)
+                    if name is not None:
+                        stack.append(name)
+                    f = f.f_back
+                key = ";".join(reversed(stack))
+                counts = self.stacks[team]
+                counts[key] = counts.get(key, 0) + 1
+                self.samples[team] += 1
+            del frames
+
+    # ----------------------------
+    # Reporting
+    # ----------------------------
+
+    def collapsed(self, team: Team) -> str:
+        return "".join(f"{stack} {n}\n" for stack, n in sorted(self.stacks[team].items()))
+
+    def top_self(self, team: Team, n: int) -> List[Tuple[str, int]]:
+        """leaf frames by sample count"""
+        leaves: Dict[str, int] = {}
+        for stack, count in self.stacks[team].items():
+            leaf = stack.rsplit(";", 1)[-1]
+            leaves[leaf] = leaves.get(leaf, 0) + count
+        return sorted(leaves.items(), key=lambda kv: kv[1], reverse=True)[:n]
+
+    def summary(self, n: int = 15) -> str:
+        lines: List[str] = []
+        for team in (Team.RED, Team.BLUE):
+            total = self.samples[team]
+            lines.append(
+                f"=== {team.name}: {total} samples (~{total * self.interval:.2f}s at {1 / self.interval:.0f}Hz) ==="
+            )
+            for leaf, count in self.top_self(team, n):
+                lines.append(f"{count:>8} {count / max(total, 1):>6.1%}  {leaf}")
+            lines.append("")
+        return "\n".join(lines)
+
+    def write(self, out_dir: str) -> str:
+        """<TEAM>.collapsed per team plus summary.txt; returns the summary"""
+        os.makedirs(out_dir, exist_ok=True)
+        for team in (Team.RED, Team.BLUE):
+            with open(os.path.join(out_dir, f"{team.name}.collapsed"), "w", encoding="utf-8") as f:
+                f.write(self.collapsed(team))
+        text = self.summary()
+        with open(os.path.join(out_dir, "summary.txt"), "w", encoding="utf-8") as f:
+            f.write(text)
+        return text
@@ -6,25 +6,47 @@ from item import Item, Pan, Food, Plate
 """Each class describes the current STATE of a tile. Robot controller describes how the state changes through bot actions"""
 
 
+def static_attrs(tile_type: TileType) -> dict:
+    """the attributes every tile of this kind has in common"""
+    return {
+        "tile_type": tile_type,
+        "tile_name": tile_type.tile_name,
+        "tile_id": tile_type.tile_id,
+        "is_walkable": tile_type.is_walkable,
+        "is_dangerous": tile_type.is_dangerous,
+        "is_placeable": tile_type.is_placeable,
+        "is_interactable": tile_type.is_interactable,
+        # basic JSON, shared by every to_dict() of this kind (no using)
+        "static_dict": {"tile_name": tile_type.tile_name, "is_walkable": tile_type.is_walkable},
+    }
+
+
 class Tile:
+    """
+    Static attributes (tile_name, is_walkable, ...) live on the class, given by
+    class Floor(Tile, tile_type=TileType.FLOOR), so they are stored once per
+    kind instead of once per tile on each map. Instances only hold state.
+    """
+
+    tile_type = None
+
+    def __init_subclass__(cls, tile_type: TileType = None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if tile_type is not None:
+            for k, v in static_attrs(tile_type).items():
+                setattr(cls, k, v)
+
     def __init__(self, tile_type: TileType):
-        self.tile_name = tile_type.tile_name
-        self.tile_id = tile_type.tile_id
-        self.is_walkable = tile_type.is_walkable
-        self.is_dangerous = tile_type.is_dangerous
-        self.is_placeable = tile_type.is_placeable
-        self.is_interactable = tile_type.is_interactable
+        if type(self).tile_type is not tile_type:
+            # plain Tile(...) or a subclass used for another kind
+            self.__dict__.update(static_attrs(tile_type))
 
         self.item = None  # what item is on the tile
         self.using = False  # whether the tile is "in use" or not
 
     def to_dict(self):
-        """basic JSON"""
-        return {
-            "tile_name": self.tile_name,
-            "is_walkable": self.is_walkable,
-            # no using
-        }
+        """basic JSON: a fresh copy of the per-kind static_dict"""
+        return dict(self.static_dict)
 
 
 class Placeable(Tile):
@@ -32,31 +54,27 @@ class Placeable(Tile):
     Tiles that we can place objects on (ie counters)
     """
 
-    def __init__(self, tile_type: TileType):
-        super().__init__(tile_type)
-        self.placeable = True
+    placeable = True
 
 
 class Interactable(Tile):
     """Tiles that we can interact with (ie cooker)"""
 
-    def __init__(self, tile_type: TileType):
-        super().__init__(tile_type)
-        self.placeable = True
-        self.interactable = True
+    placeable = True
+    interactable = True
 
 
-class Floor(Tile):
+class Floor(Tile, tile_type=TileType.FLOOR):
     def __init__(self):
         super().__init__(TileType.FLOOR)
 
 
-class Wall(Tile):
+class Wall(Tile, tile_type=TileType.WALL):
     def __init__(self):
         super().__init__(TileType.WALL)
 
 
-class Counter(Interactable):
+class Counter(Interactable, tile_type=TileType.COUNTER):
     def __init__(self):
         super().__init__(TileType.COUNTER)
         self.item = None  # only 1 item can be on a counter, None = no item on counter
@@ -69,7 +87,7 @@ class Counter(Interactable):
         return d
 
 
-class Box(Interactable):
+class Box(Interactable, tile_type=TileType.BOX):
     def __init__(self):
         super().__init__(TileType.BOX)
         self.item = None  # this is the item to put in that needs to match
@@ -87,7 +105,7 @@ class Box(Interactable):
         return d
 
 
-class Sink(Interactable):
+class Sink(Interactable, tile_type=TileType.SINK):
     def __init__(self):
         super().__init__(TileType.SINK)
         self.num_dirty_plates = 0
@@ -101,7 +119,7 @@ class Sink(Interactable):
         return d
 
 
-class SinkTable(Interactable):
+class SinkTable(Interactable, tile_type=TileType.SINKTABLE):
     def __init__(self):
         super().__init__(TileType.SINKTABLE)
         self.num_clean_plates = 0  # user can take clean plates
@@ -112,7 +130,7 @@ class SinkTable(Interactable):
         return d
 
 
-class Cooker(Interactable):
+class Cooker(Interactable, tile_type=TileType.COOKER):
     def __init__(self):
         super().__init__(TileType.COOKER)
         self.item = Pan()  # empty pan
@@ -125,17 +143,17 @@ class Cooker(Interactable):
         return d
 
 
-class Trash(Interactable):
+class Trash(Interactable, tile_type=TileType.TRASH):
     def __init__(self):
         super().__init__(TileType.TRASH)
 
 
-class Submit(Interactable):
+class Submit(Interactable, tile_type=TileType.SUBMIT):
     def __init__(self):
         super().__init__(TileType.SUBMIT)
 
 
-class Shop(Interactable):
+class Shop(Interactable, tile_type=TileType.SHOP):
     def __init__(self):
         super().__init__(TileType.SHOP)
         self.shop_items = set()
@@ -147,6 +165,5 @@ class Shop(Interactable):
             self.shop_items.add(shop_item)
 
     def to_dict(self):
-        d = super().to_dict()
         # shop has all available items for sale (all food, pans, plates)
-        return d
+        return super().to_dict()
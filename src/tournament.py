@@ -0,0 +1,388 @@
+# tournament.py
+"""
+Round-robin tournament: every pair of bots on every map, from both sides.
+
+python src/tournament.py
+python src/tournament.py --bots bots/goon.py bots/ff.py --maps maps/map1.txt --jobs 4 --out results.csv
+
+Each game runs in its own worker process (fresh per game unless --reuse-workers),
+with the bot output silenced. A bot that crashes the engine or kills its worker
+only loses that one game.
+
+Results are cached by content (bot sources, map, engine version, seed and game
+parameters, see result_cache.py), so only games affected by a change are played
+again. --no-cache plays everything.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import csv
+import functools
+import glob
+import itertools
+import multiprocessing
+import os
+import random
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, asdict, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from game_constants import Team, GameConstants
+from result_cache import ResultCache, result_key
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass(frozen=True)
+class Match:
+    red: str
+    blue: str
+    map_path: str
+    swapped: bool = False  # True for the second game of a pair (sides exchanged)
+    turns: int = GameConstants.TOTAL_TURNS
+    timeout: float = 0.5
+    seed: int = 0
+
+    def params(self) -> Dict[str, object]:
+        """everything besides the files that decides the outcome"""
+        return {"turns": self.turns, "timeout": self.timeout, "seed": self.seed}
+
+
+@dataclass
+class MatchResult:
+    red: str
+    blue: str
+    map: str
+    swapped: bool
+    winner: Optional[str] = None  # RED, BLUE or None for a draw / error
+    red_money: int = 0
+    blue_money: int = 0
+    margin: int = 0  # red_money - blue_money
+    turns: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+    cached: bool = False
+    log: List[str] = field(default_factory=list, repr=False)
+
+# outcome fields stored in the result cache
+CACHED_FIELDS = ("winner", "red_money", "blue_money", "margin", "turns", "seconds")
+
+
+def bot_name(path: str) -> str:
+    return os.path.basename(path).rsplit(".", 1)[0]
+
+
+def discover_bots(paths: List[str]) -> List[str]:
+    """bot files (or every file in a directory) that define a BotPlayer"""
+    found: List[str] = []
+    for p in paths:
+        files = sorted(glob.glob(os.path.join(p, "*.py"))) if os.path.isdir(p) else [p]
+        for f in files:
+            with open(f, "r", encoding="utf-8") as fh:
+                if "class BotPlayer" in fh.read():
+                    found.append(f)
+    return found
+
+
+def discover_maps(paths: List[str]) -> List[str]:
+    found: List[str] = []
+    for p in paths:
+        found.extend(sorted(glob.glob(os.path.join(p, "*.txt"))) if os.path.isdir(p) else [p])
+    return found
+
+
+def schedule(
+    bots: List[str],
+    maps: List[str],
+    self_play: bool = False,
+    turns: int = GameConstants.TOTAL_TURNS,
+    timeout: float = 0.5,
+    seed: int = 0,
+) -> List[Match]:
+    """every (red, blue, map) pairing, each pair played from both sides"""
+    pairs = list(itertools.combinations(bots, 2))
+    if self_play:
+        pairs += [(b, b) for b in bots]
+
+    matches: List[Match] = []
+    for map_path in maps:
+        for a, b in pairs:
+            matches.append(Match(a, b, map_path, False, turns, timeout, seed))
+            if a != b:
+                matches.append(Match(b, a, map_path, True, turns, timeout, seed))
+    return matches
+
+
+_WORKER_LOADER = None
+# worker side of the "started" queue, see run_tournament
+_WORKER_STARTED = None
+
+
+def _init_worker(started) -> None:
+    global _WORKER_STARTED
+    _WORKER_STARTED = started
+
+
+def _play_tracked(i: int, match: Match, reuse_loader: bool = False) -> MatchResult:
+    """play_match that first reports match i as started"""
+    _WORKER_STARTED.put(i)
+    return play_match(match, reuse_loader=reuse_loader)
+
+
+def play_match(match: Match, reuse_loader: bool = False) -> MatchResult:
+    """worker entry point; never raises"""
+    from game import Game
+
+    # long lived workers keep parsed maps and imported bots around
+    global _WORKER_LOADER
+    loader = None
+    if reuse_loader:
+        if _WORKER_LOADER is None:
+            from batch import CachingLoader
+
+            _WORKER_LOADER = CachingLoader()
+        loader = _WORKER_LOADER
+
+    res = MatchResult(bot_name(match.red), bot_name(match.blue), match.map_path, match.swapped)
+    out = open(os.devnull, "w")
+    t0 = time.perf_counter()
+    try:
+        random.seed(match.seed)
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(out):
+            g = Game(
+                red_bot_path=match.red,
+                blue_bot_path=match.blue,
+                map_path=match.map_path,
+                turn_limit=match.turns,
+                per_turn_timeout_s=match.timeout,
+                loader=loader,
+            )
+            try:
+                winner = g.run_game()
+            finally:
+                g.close()
+        res.winner = None if winner is None else winner.name
+        res.red_money = g.game_state.get_team_money(Team.RED)
+        res.blue_money = g.game_state.get_team_money(Team.BLUE)
+        res.margin = res.red_money - res.blue_money
+        res.turns = g.game_state.turn
+    except BaseException as e:
+        res.error = f"{type(e).__name__}: {e}"
+        res.log = traceback.format_exc().splitlines()
+    finally:
+        out.close()
+    res.seconds = time.perf_counter() - t0
+    return res
+
+
+def _describe(r: MatchResult) -> str:
+    if r.error is not None:
+        return f"ERROR {r.error}"
+    tag = " [cached]" if r.cached else ""
+    if r.winner is None:
+        return f"DRAW ${r.red_money}{tag}"
+    return f"{r.winner} by ${abs(r.margin)}{tag}"
+
+
+def run_tournament(
+    matches: List[Match],
+    jobs: Optional[int] = None,
+    fresh_workers: bool = True,
+    progress: bool = True,
+    cache: Optional[ResultCache] = None,
+) -> List[MatchResult]:
+    """runs every match on a process pool; results come back in schedule order"""
+    jobs = jobs or os.cpu_count() or 1
+    results: Dict[int, MatchResult] = {}
+    keys: Dict[int, Dict[str, str]] = {}
+    t_start = time.perf_counter()
+
+    def report(i: int, r: MatchResult) -> None:
+        results[i] = r
+        if cache is not None and not r.cached and r.error is None:
+            cache.put(keys[i], {k: getattr(r, k) for k in CACHED_FIELDS})
+        if progress:
+            elapsed = time.perf_counter() - t_start
+            print(
+                f"[{len(results)}/{len(matches)} {elapsed:.0f}s] "
+                f"{r.red} (RED) vs {r.blue} (BLUE) on {bot_name(r.map)}: "
+                f"{_describe(r)} ({r.seconds:.1f}s)",
+                flush=True,
+            )
+
+    def run_pool(indices: List[int], workers: int) -> Tuple[List[int], Set[int]]:
+        """returns the matches that were lost to a dead worker, and which of those had started"""
+        lost: List[int] = []
+        # max_tasks_per_child needs spawn, and the queue must come from the pool's context
+        ctx = multiprocessing.get_context("spawn" if fresh_workers else None)
+        started = ctx.SimpleQueue()
+        kwargs = {"max_tasks_per_child": 1} if fresh_workers else {}
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=ctx, initializer=_init_worker, initargs=(started,), **kwargs
+        ) as pool:
+            play = functools.partial(_play_tracked, reuse_loader=not fresh_workers)
+            futures = {pool.submit(play, i, matches[i]): i for i in indices}
+            for fut in as_completed(futures):
+                i = futures[fut]
+                try:
+                    report(i, fut.result())
+                except BrokenProcessPool:
+                    lost.append(i)
+        in_flight: Set[int] = set()
+        while not started.empty():
+            in_flight.add(started.get())
+        started.close()
+        return sorted(lost), in_flight.intersection(lost)
+
+    todo: List[int] = []
+    for i, m in enumerate(matches):
+        if cache is None:
+            todo.append(i)
+            continue
+        keys[i] = result_key(m.red, m.blue, m.map_path, m.params())
+        hit = cache.get(keys[i]["key"])
+        if hit is None:
+            todo.append(i)
+            continue
+        r = MatchResult(bot_name(m.red), bot_name(m.blue), m.map_path, m.swapped, cached=True)
+        for k in CACHED_FIELDS:
+            setattr(r, k, hit[k])
+        report(i, r)
+
+    # a dead worker breaks the whole pool and fails every unfinished match with
+    # it. The casualties go to a fresh pool at full width; from the second break
+    # on, the matches that were in flight are played alone to find the one that
+    # actually kills its worker, and the rest go round again
+    pending, retry = todo, False
+    while pending:
+        lost, in_flight = run_pool(pending, jobs)
+        if not retry:
+            pending, retry = lost, True
+            continue
+        for i in sorted(in_flight or lost):
+            if run_pool([i], 1)[0]:
+                m = matches[i]
+                r = MatchResult(bot_name(m.red), bot_name(m.blue), m.map_path, m.swapped)
+                r.error = "worker process died"
+                report(i, r)
+        pending = [i for i in lost if i not in in_flight] if in_flight else []
+
+    return [results[i] for i in sorted(results)]
+
+
+# ----------------------------
+# Reporting
+# ----------------------------
+
+def standings(results: List[MatchResult]) -> List[Dict[str, object]]:
+    """per bot totals from each bot's own point of view, best first"""
+    table: Dict[str, Dict[str, object]] = {}
+
+    def row(name: str) -> Dict[str, object]:
+        return table.setdefault(
+            name, {"bot": name, "games": 0, "wins": 0, "losses": 0, "draws": 0, "errors": 0, "margin": 0}
+        )
+
+    for r in results:
+        for name, team, sign in ((r.red, "RED", 1), (r.blue, "BLUE", -1)):
+            s = row(name)
+            s["games"] += 1
+            if r.error is not None:
+                s["errors"] += 1
+                continue
+            s["margin"] += sign * r.margin
+            if r.winner is None:
+                s["draws"] += 1
+            elif r.winner == team:
+                s["wins"] += 1
+            else:
+                s["losses"] += 1
+
+    rows = list(table.values())
+    for s in rows:
+        played = s["games"] - s["errors"]
+        s["avg_margin"] = s["margin"] / played if played else 0.0
+    rows.sort(key=lambda s: (s["wins"] + 0.5 * s["draws"], s["avg_margin"]), reverse=True)
+    return rows
+
+
+def print_standings(rows: List[Dict[str, object]]) -> None:
+    name_w = max([len("bot")] + [len(str(s["bot"])) for s in rows])
+    print(f"{'bot':<{name_w}}  games  wins  losses  draws  errors  avg_margin")
+    for s in rows:
+        print(
+            f"{s['bot']:<{name_w}}  {s['games']:>5}  {s['wins']:>4}  {s['losses']:>6}  "
+            f"{s['draws']:>5}  {s['errors']:>6}  {s['avg_margin']:>10.1f}"
+        )
+
+
+def write_results(path: str, results: List[MatchResult]) -> None:
+    fields = [k for k in asdict(results[0]).keys() if k != "log"] if results else []
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
+        w.writeheader()
+        for r in results:
+            w.writerow(asdict(r))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="round-robin tournament over bots x maps")
+    ap.add_argument("--bots", nargs="+", default=[os.path.join(REPO_ROOT, "bots")], help="bot files or directories")
+    ap.add_argument("--maps", nargs="+", default=[os.path.join(REPO_ROOT, "maps")], help="map files or directories")
+    ap.add_argument("--self-play", action="store_true", help="also play every bot against itself")
+    ap.add_argument("--turns", type=int, default=GameConstants.TOTAL_TURNS, help="turn limit")
+    ap.add_argument("--timeout", type=float, default=0.5, help="per-turn timeout seconds per bot")
+    ap.add_argument("--seed", type=int, default=0, help="random seed set before every game")
+    ap.add_argument("--jobs", type=int, default=None, help="worker processes (default: cpu count)")
+    ap.add_argument("--reuse-workers", action="store_true", help="don't start a fresh process per game")
+    ap.add_argument("--out", default=None, help="optional csv path for per-game results")
+    ap.add_argument("--quiet", action="store_true", help="no per-game progress lines")
+    ap.add_argument("--cache", default=None, help="result cache path (default: .cache/results.sqlite)")
+    ap.add_argument("--no-cache", action="store_true", help="play every game, don't read or write the cache")
+    args = ap.parse_args()
+
+    bots = discover_bots(args.bots)
+    maps = discover_maps(args.maps)
+    matches = schedule(bots, maps, args.self_play, args.turns, args.timeout, args.seed)
+    jobs = args.jobs or os.cpu_count() or 1
+    print(f"[TOURNAMENT] {len(bots)} bots, {len(maps)} maps, {len(matches)} games on {jobs} workers")
+
+    cache = None if args.no_cache else ResultCache(args.cache)
+    try:
+        results = run_tournament(
+            matches,
+            jobs,
+            fresh_workers=not args.reuse_workers,
+            progress=not args.quiet,
+            cache=cache,
+        )
+    finally:
+        if cache is not None:
+            cache.close()
+
+    hits = sum(1 for r in results if r.cached)
+    if cache is not None:
+        print(f"[TOURNAMENT] {hits} cached, {len(results) - hits} played")
+
+    errors = [r for r in results if r.error is not None]
+    for r in errors:
+        print(f"[ERROR] {r.red} vs {r.blue} on {r.map}: {r.error}", file=sys.stderr)
+        for line in r.log[-3:]:
+            print(f"    {line}", file=sys.stderr)
+
+    print()
+    print_standings(standings(results))
+
+    if args.out is not None:
+        write_results(args.out, results)
+        print(f"[TOURNAMENT] wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
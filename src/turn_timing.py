@@ -0,0 +1,98 @@
+# turn_timing.py
+"""
+Per-turn latency of each team's play_turn: wall time (what the timeout is
+checked against) and CPU time of the bot's thread.
+
+game.py always records the samples. With --latency-report PATH it writes a
+JSON report at game end, per team:
+  - p50/p90/p99/max/mean of wall and CPU milliseconds
+  - a histogram of wall times (bucket upper edges in ms)
+  - every turn whose wall time used more than --warn-fraction of
+    per_turn_timeout_s, and every timed out turn
+
+python src/game.py --red bots/goon.py --blue bots/ff.py --map maps/map1.txt --latency-report latency.json
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, List, Optional, Sequence
+
+from game_constants import Team
+
+# histogram bucket upper edges, ms; the last bucket is everything above
+BUCKET_EDGES_MS = (0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+def percentile(sorted_values: Sequence[float], p: float) -> Optional[float]:
+    """nearest rank percentile of an already sorted sequence"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(values: List[float]) -> Dict[str, Optional[float]]:
+    s = sorted(values)
+    return {
+        "p50": percentile(s, 50),
+        "p90": percentile(s, 90),
+        "p99": percentile(s, 99),
+        "max": s[-1] if s else None,
+        "mean": sum(s) / len(s) if s else None,
+    }
+
+
+def histogram(values_ms: List[float]) -> Dict[str, Any]:
+    counts = [0] * (len(BUCKET_EDGES_MS) + 1)
+    for v in values_ms:
+        i = 0
+        while i < len(BUCKET_EDGES_MS) and v > BUCKET_EDGES_MS[i]:
+            i += 1
+        counts[i] += 1
+    return {"edges_ms": list(BUCKET_EDGES_MS), "counts": counts}
+
+
+class TurnTimings:
+    """one sample per play_turn call; cpu_s is None when the turn timed out"""
+
+    def __init__(self, per_turn_timeout_s: float):
+        self.per_turn_timeout_s = per_turn_timeout_s
+        self.samples: Dict[Team, List[tuple]] = {Team.RED: [], Team.BLUE: []}
+
+    def record(self, team: Team, turn: int, wall_s: float, cpu_s: Optional[float], timed_out: bool) -> None:
+        self.samples[team].append((turn, wall_s, cpu_s, timed_out))
+
+    def team_report(self, team: Team, warn_fraction: float) -> Dict[str, Any]:
+        rows = self.samples[team]
+        wall_ms = [w * 1e3 for _, w, _, _ in rows]
+        cpu_ms = [c * 1e3 for _, _, c, _ in rows if c is not None]
+        limit = self.per_turn_timeout_s
+        near = [
+            {"turn": t, "wall_ms": round(w * 1e3, 3), "fraction": round(w / limit, 3)}
+            for t, w, _, out in rows
+            if not out and limit > 0 and w > warn_fraction * limit
+        ]
+        return {
+            "turns": len(rows),
+            "wall_ms": summarize(wall_ms),
+            "cpu_ms": summarize(cpu_ms),
+            "histogram": histogram(wall_ms),
+            "near_timeout": near,
+            "timeouts": [t for t, _, _, out in rows if out],
+        }
+
+    def report(self, warn_fraction: float = 0.8) -> Dict[str, Any]:
+        return {
+            "per_turn_timeout_s": self.per_turn_timeout_s,
+            "warn_fraction": warn_fraction,
+            "teams": {team.name: self.team_report(team, warn_fraction) for team in self.samples},
+        }
+
+    def write(self, path: str, warn_fraction: float = 0.8) -> Dict[str, Any]:
+        import json
+
+        rep = self.report(warn_fraction)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(rep, f, indent=2)
+        return rep